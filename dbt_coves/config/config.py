@@ -3,7 +3,7 @@
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel
 
@@ -71,6 +71,14 @@ class GenerateAirflowDagsModel(BaseModel):
     secrets_environment: Optional[str] = ""
     secrets_tags: Optional[str] = ""
     secrets_key: Optional[str] = ""
+    jobs: Optional[int] = 1
+    force: Optional[bool] = False
+    format_with_black: Optional[bool] = False
+    inventory_snapshot: Optional[str] = ""
+    manifest: Optional[str] = ""
+    profiling: Optional[bool] = False
+    profiling_report: Optional[str] = ""
+    profiling_cprofile: Optional[str] = ""
 
 
 class GenerateModel(BaseModel):
@@ -107,6 +115,11 @@ class LoadAirbyteModel(BaseModel):
     secrets_environment: Optional[str] = ""
     secrets_tags: Optional[List[str]] = []
     secrets_key: Optional[str] = ""
+    max_workers: Optional[int] = 8
+    plan: Optional[bool] = False
+    plan_file: Optional[str] = ""
+    apply_plan: Optional[str] = ""
+    allow_deletes: Optional[bool] = False
 
 
 class LoadFivetranModel(BaseModel):
@@ -121,6 +134,11 @@ class LoadFivetranModel(BaseModel):
     secrets_environment: Optional[str] = ""
     secrets_tags: Optional[List[str]] = []
     secrets_key: Optional[str] = ""
+    max_workers: Optional[int] = 8
+    plan: Optional[bool] = False
+    plan_file: Optional[str] = ""
+    apply_plan: Optional[str] = ""
+    allow_deletes: Optional[bool] = False
 
 
 class ExtractModel(BaseModel):
@@ -145,14 +163,46 @@ class RunDbtModel(BaseModel):
     project_dir: Optional[str] = ""
     virtualenv: Optional[str] = ""
     cleanup: Optional[bool] = False
+    full_copy: Optional[bool] = False
+
+
+class DataSyncTableModel(BaseModel):
+    cursor: Optional[str] = None
+    initial_value: Optional[Any] = None
+    primary_key: Optional[List[str]] = None
+    write_disposition: Optional[Literal["append", "merge", "replace"]] = None
+    partitions: Optional[int] = None
+    partition_column: Optional[str] = None
 
 
 class RedshiftDataSyncModel(BaseModel):
     tables: Optional[List[str]] = []
+    catalog: Optional[Dict[str, DataSyncTableModel]] = {}
+    extract_workers: Optional[int] = None
+    normalize_workers: Optional[int] = None
+    load_workers: Optional[int] = None
+    refresh_reflection: Optional[bool] = False
+    chunk_bytes: Optional[int] = None
+    page_size: Optional[int] = None
+    max_pages: Optional[int] = None
+    detect_cursors: Optional[bool] = False
+    metrics_path: Optional[str] = None
+    metrics_table: Optional[str] = None
 
 
 class SnowflakeDataSyncModel(BaseModel):
     tables: Optional[List[str]] = []
+    catalog: Optional[Dict[str, DataSyncTableModel]] = {}
+    extract_workers: Optional[int] = None
+    normalize_workers: Optional[int] = None
+    load_workers: Optional[int] = None
+    refresh_reflection: Optional[bool] = False
+    chunk_bytes: Optional[int] = None
+    page_size: Optional[int] = None
+    max_pages: Optional[int] = None
+    detect_cursors: Optional[bool] = False
+    metrics_path: Optional[str] = None
+    metrics_table: Optional[str] = None
 
 
 class DataSyncModel(BaseModel):
@@ -232,6 +282,14 @@ class DbtCovesConfig:
         "generate.airflow_dags.secrets_environment",
         "generate.airflow_dags.secrets_tags",
         "generate.airflow_dags.secrets_key",
+        "generate.airflow_dags.jobs",
+        "generate.airflow_dags.force",
+        "generate.airflow_dags.format_with_black",
+        "generate.airflow_dags.inventory_snapshot",
+        "generate.airflow_dags.manifest",
+        "generate.airflow_dags.profiling",
+        "generate.airflow_dags.profiling_report",
+        "generate.airflow_dags.profiling_cprofile",
         "extract.airbyte.path",
         "extract.airbyte.host",
         "extract.airbyte.port",
@@ -247,6 +305,11 @@ class DbtCovesConfig:
         "load.airbyte.secrets_environment",
         "load.airbyte.secrets_tags",
         "load.airbyte.secrets_key",
+        "load.airbyte.max_workers",
+        "load.airbyte.plan",
+        "load.airbyte.plan_file",
+        "load.airbyte.apply_plan",
+        "load.airbyte.allow_deletes",
         "setup.no_prompt",
         "setup.quiet",
         "setup.template_url",
@@ -255,6 +318,7 @@ class DbtCovesConfig:
         "dbt.project_dir",
         "dbt.virtualenv",
         "dbt.cleanup",
+        "dbt.full_copy",
         "extract.fivetran.path",
         "extract.fivetran.api_key",
         "extract.fivetran.api_secret",
@@ -270,8 +334,33 @@ class DbtCovesConfig:
         "load.fivetran.secrets_environment",
         "load.fivetran.secrets_tags",
         "load.fivetran.secrets_key",
+        "load.fivetran.max_workers",
+        "load.fivetran.plan",
+        "load.fivetran.plan_file",
+        "load.fivetran.apply_plan",
+        "load.fivetran.allow_deletes",
         "data_sync.redshift.tables",
+        "data_sync.redshift.extract_workers",
+        "data_sync.redshift.normalize_workers",
+        "data_sync.redshift.load_workers",
+        "data_sync.redshift.refresh_reflection",
+        "data_sync.redshift.chunk_bytes",
+        "data_sync.redshift.page_size",
+        "data_sync.redshift.max_pages",
+        "data_sync.redshift.detect_cursors",
+        "data_sync.redshift.metrics_path",
+        "data_sync.redshift.metrics_table",
         "data_sync.snowflake.tables",
+        "data_sync.snowflake.extract_workers",
+        "data_sync.snowflake.normalize_workers",
+        "data_sync.snowflake.load_workers",
+        "data_sync.snowflake.refresh_reflection",
+        "data_sync.snowflake.chunk_bytes",
+        "data_sync.snowflake.page_size",
+        "data_sync.snowflake.max_pages",
+        "data_sync.snowflake.detect_cursors",
+        "data_sync.snowflake.metrics_path",
+        "data_sync.snowflake.metrics_table",
         "blue_green.prod_db_env_var",
         "blue_green.staging_database",
         "blue_green.staging_suffix",
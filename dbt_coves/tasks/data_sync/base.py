@@ -3,41 +3,104 @@ Bring all common (shared across Snowflake and Redshift) dlt functionalities here
 """
 
 import os
-from datetime import datetime
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
 
 from rich.console import Console
+from rich.table import Table
 
 from dbt_coves.tasks.base import NonDbtBaseConfiguredTask
+from dbt_coves.utils.yaml import yaml
 
-# These tables are always synced.  Anything else can be requested but that's on user.
-DEFAULT_AIRFLOW_TABLES = [
-    "ab_permission",
-    "ab_role",
-    "ab_user",
-    "dag",
-    "dag_run",
-    "dag_tag",
-    "import_error",
-    "job",
-    "task_fail",
-    "task_instance",
-]
-
-# These tables have a column appropriate for incremental upload.  Everything else will just
-# blindly replace the destination table.  Each tuple is (column, initial_value).
-AIRFLOW_INCREMENTALS = {
-    "dag": ("last_pickled", "1970-01-01T00:00:00Z"),
-    "dag_run": ("execution_date", datetime.fromisoformat("1970-01-01T00:00:00Z")),
-    "import_error": ("timestamp", datetime.fromisoformat("1970-01-01T00:00:00Z")),
-    "job": ("start_date", datetime.fromisoformat("1970-01-01T00:00:00Z")),
-    "task_fail": ("start_date", datetime.fromisoformat("1970-01-01T00:00:00Z")),
-    "task_instance": ("updated_at", datetime.fromisoformat("1970-01-01T00:00:00Z")),
-}
+from .catalog import build_catalog, detect_cursor
+from .metrics import (
+    cursor_high_water_mark,
+    metrics_rows,
+    source_now,
+    step_seconds,
+    table_metrics,
+    write_metrics,
+)
+
+# dlt steps whose worker counts can be set, see `set_dlt_workers`
+DLT_WORKER_STEPS = ("extract", "normalize", "load")
+# Memory budget of each chunk of rows extracted, unless set with --chunk-bytes
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+MEGABYTE = 1024 * 1024
 
 console = Console()
 
 
 class BaseDataSyncTask(NonDbtBaseConfiguredTask):
+    @classmethod
+    def register_sync_arguments(cls, subparser):
+        """Arguments shared by every data-sync destination"""
+        subparser.add_argument(
+            "--tables", help="List of tables to dump", required=False
+        )
+        subparser.add_argument("--source", help="Source database name", required=True)
+        subparser.add_argument(
+            "--extract-workers",
+            type=int,
+            help="Threads extracting incremental tables concurrently (dlt default: 5)",
+        )
+        subparser.add_argument(
+            "--normalize-workers",
+            type=int,
+            help="Processes normalizing extracted data (dlt default: 1)",
+        )
+        subparser.add_argument(
+            "--load-workers",
+            type=int,
+            help="Threads loading files into the destination (dlt default: 20)",
+        )
+        subparser.add_argument(
+            "--refresh-reflection",
+            action="store_true",
+            help="Reflect source tables again instead of using their cached schemas",
+        )
+        subparser.add_argument(
+            "--chunk-bytes",
+            type=int,
+            help="Memory budget of each chunk of rows extracted "
+            f"(default: {DEFAULT_CHUNK_BYTES})",
+        )
+        subparser.add_argument(
+            "--page-size",
+            type=int,
+            help="Read incremental tables in pages of this many rows, each a short "
+            "query, instead of a single long-running query",
+        )
+        subparser.add_argument(
+            "--max-pages",
+            type=int,
+            help="Pages read per pipeline run: with more pages, further runs are made, "
+            "each committing the progress of the previous ones",
+        )
+        subparser.add_argument(
+            "--detect-cursors",
+            action="store_true",
+            help="Print a catalog proposing incremental cursors for the tables "
+            "synced in full, instead of syncing them",
+        )
+        subparser.add_argument(
+            "--metrics-path",
+            help="Write each table's throughput and lag metrics to this JSON file",
+        )
+        subparser.add_argument(
+            "--metrics-table",
+            help="Also append each table's metrics to this destination table",
+        )
+
+    def set_dlt_workers(self) -> None:
+        """dlt reads its steps' worker counts from environment variables"""
+        for step in DLT_WORKER_STEPS:
+            workers = self.get_config_value(f"{step}_workers")
+            if workers:
+                os.environ[f"{step.upper()}__WORKERS"] = str(workers)
+
     def get_source_connection_string(self):
         self.source_connection_string = os.environ.get(
             "DATA_SYNC_SOURCE_CONNECTION_STRING"
@@ -51,20 +114,24 @@ class BaseDataSyncTask(NonDbtBaseConfiguredTask):
         import dlt
         from dlt.sources.credentials import ConnectionStringCredentials
 
-        from .sql_database import sql_database, sql_table
+        from .sql_database import sql_database
+        from .sql_database.helpers import LOAD_STATS
 
-        # Merge the default table list with the user-requested table list, and split it into
-        # incremental and full loads according to if we have an incremental column.
-        full_tables = []
-        incremental_tables = {}
-        requested_tables = self.tables
-        for i in DEFAULT_AIRFLOW_TABLES + requested_tables:
-            if i in AIRFLOW_INCREMENTALS.keys():
-                incremental_tables[i] = AIRFLOW_INCREMENTALS[i]
-            else:
-                if i not in full_tables:
-                    full_tables.append(i)
+        # Split the catalog's tables into full and incremental loads, according to if
+        # they have a cursor column (or are merged into the destination).
+        catalog = build_catalog(self.tables, self.get_config_value("catalog"))
+        full_tables = {
+            table: options
+            for table, options in catalog.items()
+            if options["write_disposition"] == "replace"
+        }
+        incremental_tables = {
+            table: options
+            for table, options in catalog.items()
+            if table not in full_tables
+        }
 
+        self.set_dlt_workers()
         pipeline = dlt.pipeline(
             progress="enlighten",
             pipeline_name="source",
@@ -75,24 +142,239 @@ class BaseDataSyncTask(NonDbtBaseConfiguredTask):
         # By default the sql_database source reflects all tables in the schema
         # The database credentials are sourced from the `.dlt/secrets.toml` configuration
         credentials = ConnectionStringCredentials(self.source_connection_string)
+        refresh_reflection = bool(self.get_config_value("refresh_reflection"))
+        chunk_bytes = self.get_config_value("chunk_bytes") or DEFAULT_CHUNK_BYTES
+        LOAD_STATS.clear()
+        load_stats = {}
+        # Seconds of the normalize and load steps of all the sync's pipeline runs
+        sync_seconds = {"normalize_seconds": 0.0, "load_seconds": 0.0}
+        started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
 
         # All fully-replaced tables go at once.
         if len(full_tables):
             console.print(f"Loading full tables into {self.destination}")
-            console.print("Full tables: ", str(full_tables))
-            source = sql_database(credentials=credentials, table_names=full_tables)
+            console.print("Full tables: ", str(list(full_tables)))
+            source = sql_database(
+                credentials=credentials,
+                table_names=list(full_tables),
+                chunk_bytes=chunk_bytes,
+                refresh_reflection=refresh_reflection,
+                table_options={
+                    table: self.get_partition_options(options)
+                    for table, options in full_tables.items()
+                },
+            )
+            for table, options in full_tables.items():
+                if options["primary_key"]:
+                    source.resources[table].apply_hints(
+                        primary_key=options["primary_key"]
+                    )
             console.print("Run pipeline")
             info = pipeline.run(source, write_disposition="replace")
             print(info)
-        # Incrementally loaded tables go one at a time, with their own cursor columns.
-        for i in incremental_tables:
-            console.print(f"Incrementally loading table: {i}")
-            source = sql_table(
-                credentials=credentials,
-                table=i,
-                incremental=dlt.sources.incremental(
-                    incremental_tables[i][0], initial_value=incremental_tables[i][1]
+            self.merge_load_stats(load_stats, LOAD_STATS)
+            self.add_step_seconds(sync_seconds, pipeline.last_trace)
+        # Incrementally loaded tables go at once too, each with its own cursor column
+        # and write disposition. Their resources are parallelized, so they're extracted
+        # concurrently. Tables read in pages that stopped at --max-pages are run again,
+        # continuing after the last row read by the previous run
+        while incremental_tables:
+            console.print(f"Incrementally loading tables into {self.destination}")
+            console.print("Incremental tables: ", str(list(incremental_tables)))
+            LOAD_STATS.clear()
+            resources = [
+                self.get_incremental_resource(credentials, table, options).parallelize()
+                for table, options in incremental_tables.items()
+            ]
+            info = pipeline.run(resources)
+            print(info)
+            self.merge_load_stats(load_stats, LOAD_STATS)
+            self.add_step_seconds(sync_seconds, pipeline.last_trace)
+            incremental_tables = {
+                table: options
+                for table, options in incremental_tables.items()
+                if not LOAD_STATS.get(table, {}).get("complete", True)
+            }
+            stalled = [
+                table for table in incremental_tables if not LOAD_STATS[table]["rows"]
+            ]
+            if stalled:
+                raise RuntimeError(
+                    f"Tables {', '.join(stalled)} read no rows in a run without "
+                    "being complete, their sync can't progress"
+                )
+        self.print_load_stats(load_stats)
+        self.report_metrics(
+            pipeline,
+            catalog,
+            load_stats,
+            {
+                "source": self.args.source,
+                "destination": self.destination,
+                "started_at": started_at.isoformat(),
+                "seconds": time.perf_counter() - started,
+                **sync_seconds,
+            },
+        )
+
+    def get_incremental_resource(self, credentials, table, options):
+        """
+        The resource of a table loaded incrementally, or merged in full if it has no
+        cursor. Tables read in partitions or without a cursor aren't paged
+        """
+        import dlt
+
+        from .sql_database import sql_table
+
+        page_size = self.get_config_value("page_size")
+        max_pages = self.get_config_value("max_pages") if page_size else None
+        incremental = None
+        if options["cursor"]:
+            incremental = dlt.sources.incremental(
+                options["cursor"], initial_value=options["initial_value"]
+            )
+        if not options["cursor"] or options["partitions"]:
+            page_size = max_pages = None
+        return sql_table(
+            credentials=credentials,
+            table=table,
+            incremental=incremental,
+            chunk_bytes=self.get_config_value("chunk_bytes") or DEFAULT_CHUNK_BYTES,
+            page_size=page_size,
+            max_pages=max_pages,
+            refresh_reflection=bool(self.get_config_value("refresh_reflection")),
+            write_disposition=options["write_disposition"],
+            primary_key=options["primary_key"],
+            **self.get_partition_options(options),
+        )
+
+    def get_partition_options(self, options):
+        """The `partitions` and `partition_column` of a table, if set in the catalog"""
+        return {
+            option: options[option]
+            for option in ("partitions", "partition_column")
+            if options[option]
+        }
+
+    def detect_cursors(self) -> None:
+        """
+        Print a catalog proposing a cursor for each table synced in full that has a
+        timestamp column likely updated along with its row
+        """
+        from sqlalchemy import MetaData
+
+        from .sql_database.helpers import engine_from_credentials
+        from .sql_database.reflection import reflect_table
+
+        catalog = build_catalog(self.tables, self.get_config_value("catalog"))
+        engine = engine_from_credentials(self.source_connection_string)
+        refresh_reflection = bool(self.get_config_value("refresh_reflection"))
+        proposed_catalog = {}
+        for table, options in catalog.items():
+            if options["write_disposition"] != "replace":
+                continue
+            cursor = detect_cursor(
+                reflect_table(engine, MetaData(), table, refresh=refresh_reflection)
+            )
+            if cursor:
+                proposed_catalog[table] = {"cursor": cursor}
+            else:
+                console.print(f"No cursor found for table {table}")
+        if not proposed_catalog:
+            return
+        console.print(
+            "Proposed cursors, to add to the catalog of your .dbt_coves/config.yml:"
+        )
+        yaml.dump(
+            {"data_sync": {self.args.task: {"catalog": proposed_catalog}}}, sys.stdout
+        )
+
+    def merge_load_stats(self, load_stats, run_load_stats) -> None:
+        """Add the stats of a pipeline run's tables to the stats of the whole sync"""
+        for table, run_stats in run_load_stats.items():
+            stats = load_stats.setdefault(table, dict.fromkeys(run_stats, 0))
+            for key in ("rows", "pages", "chunks", "bytes", "extract_seconds"):
+                stats[key] += run_stats[key]
+            stats["max_chunk_bytes"] = max(
+                stats["max_chunk_bytes"], run_stats["max_chunk_bytes"]
+            )
+            if run_stats["chunks"]:
+                stats["last_chunk_rows"] = run_stats["last_chunk_rows"]
+            stats["peak_rss_bytes"] = run_stats["peak_rss_bytes"]
+
+    def add_step_seconds(self, sync_seconds, trace) -> None:
+        """
+        Add the seconds a pipeline run's normalize and load steps took, for all its
+        tables at once, to those of the whole sync
+        """
+        run_seconds = step_seconds(trace)
+        for step in ("normalize", "load"):
+            sync_seconds[f"{step}_seconds"] += run_seconds[step]
+
+    def report_metrics(self, pipeline, catalog, load_stats, metrics) -> None:
+        """
+        Write the sync's and each table's metrics to --metrics-path as JSON, and
+        append the tables' to the --metrics-table destination table, if set
+        """
+        from .sql_database.helpers import engine_from_credentials
+
+        metrics_path = self.get_config_value("metrics_path")
+        metrics_table = self.get_config_value("metrics_table")
+        if not (metrics_path or metrics_table) or not load_stats:
+            return
+        now = None
+        if any(catalog[table]["cursor"] for table in load_stats):
+            now = source_now(engine_from_credentials(self.source_connection_string))
+        metrics["tables"] = [
+            table_metrics(
+                table,
+                catalog[table],
+                stats,
+                high_water_mark=cursor_high_water_mark(
+                    pipeline, table, catalog[table]["cursor"]
                 ),
+                now=now,
+            )
+            for table, stats in sorted(load_stats.items())
+        ]
+        if metrics_path:
+            write_metrics(Path(metrics_path), metrics)
+            console.print(f"Metrics written to {metrics_path}")
+        if metrics_table:
+            info = pipeline.run(
+                metrics_rows(metrics),
+                table_name=metrics_table,
+                write_disposition="append",
             )
-            info = pipeline.run(source, write_disposition="append")
             print(info)
+
+    def print_load_stats(self, load_stats) -> None:
+        """Rows and memory taken by each table extracted"""
+        if not load_stats:
+            return
+        stats_table = Table(title="Extracted tables")
+        for column in (
+            "Table",
+            "Rows",
+            "Chunks",
+            "Rows/chunk",
+            "Row bytes",
+            "Max chunk MB",
+            "Peak RSS MB",
+        ):
+            stats_table.add_column(
+                column, justify="left" if column == "Table" else "right", no_wrap=True
+            )
+        for table, stats in sorted(load_stats.items()):
+            peak_rss = stats["peak_rss_bytes"]
+            stats_table.add_row(
+                table,
+                str(stats["rows"]),
+                str(stats["chunks"]),
+                str(stats["last_chunk_rows"]),
+                str(stats["bytes"] // stats["rows"]) if stats["rows"] else "",
+                f"{stats['max_chunk_bytes'] / MEGABYTE:.1f}",
+                f"{peak_rss / MEGABYTE:.0f}" if peak_rss else "",
+            )
+        console.print(stats_table)
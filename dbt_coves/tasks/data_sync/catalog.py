@@ -0,0 +1,119 @@
+"""
+Tables synced by data-sync, and how each of them is loaded.
+
+Airflow's metadata tables are always synced, as described by AIRFLOW_CATALOG. The
+`catalog` config, by table name, adds tables or overrides how they're loaded:
+
+    cursor: column of an incremental cursor, loading the rows from its last value
+    initial_value: the cursor's first value, i.e. "2024-01-01T00:00:00Z"
+    primary_key: columns identifying each row, instead of the table's primary key
+    write_disposition: "append", "merge" or "replace" (default: "merge" for tables
+        with a cursor, "replace" for the rest)
+    partitions, partition_column: read the table in parallel key ranges
+
+Tables with a cursor are merged on their primary key, so rows updated in place or
+read again at the cursor's last value replace their previous version instead of
+being appended as duplicates. Tables without a cursor are replaced in full on each
+run. `detect_cursor` proposes one for tables with a timestamp column that's likely
+updated along with its row.
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import DateTime, Table
+
+EPOCH = datetime.fromisoformat("1970-01-01T00:00:00Z")
+
+# These tables are always synced.  Anything else can be requested but that's on user.
+# Those with a cursor are loaded incrementally, everything else will just blindly
+# replace the destination table.
+AIRFLOW_CATALOG = {
+    "ab_permission": {},
+    "ab_role": {},
+    "ab_user": {},
+    "dag": {"cursor": "last_pickled", "initial_value": EPOCH},
+    "dag_run": {"cursor": "execution_date", "initial_value": EPOCH},
+    "dag_tag": {},
+    "import_error": {"cursor": "timestamp", "initial_value": EPOCH},
+    "job": {"cursor": "start_date", "initial_value": EPOCH},
+    "task_fail": {"cursor": "start_date", "initial_value": EPOCH},
+    "task_instance": {"cursor": "updated_at", "initial_value": EPOCH},
+}
+
+TABLE_OPTIONS = (
+    "cursor",
+    "initial_value",
+    "primary_key",
+    "write_disposition",
+    "partitions",
+    "partition_column",
+)
+
+# Names of columns usually set whenever their row changes, by preference
+CURSOR_NAMES = (
+    "updated_at",
+    "modified_at",
+    "last_modified",
+    "last_modified_at",
+    "last_updated",
+    "last_updated_at",
+    "updated",
+    "modified",
+    "changed_at",
+    "update_time",
+    "updated_on",
+    "modified_on",
+)
+CURSOR_NAME_PATTERN = re.compile(r"updated|modified|changed")
+
+
+def build_catalog(
+    tables: Optional[List[str]], catalog: Optional[Dict[str, Dict[str, Any]]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Every table synced, Airflow's, then `tables` and then the catalog's, with its
+    options: those of the catalog override Airflow's
+    """
+    catalog = catalog or {}
+    table_catalog = {}
+    for name in [*AIRFLOW_CATALOG, *(tables or []), *catalog]:
+        if name in table_catalog:
+            continue
+        options = {**dict.fromkeys(TABLE_OPTIONS), **AIRFLOW_CATALOG.get(name, {})}
+        options.update(
+            {
+                option: value
+                for option, value in (catalog.get(name) or {}).items()
+                if value is not None
+            }
+        )
+        if isinstance(options["initial_value"], str):
+            options["initial_value"] = datetime.fromisoformat(options["initial_value"])
+        if options["write_disposition"] is None:
+            options["write_disposition"] = "merge" if options["cursor"] else "replace"
+        if options["cursor"] and options["write_disposition"] == "replace":
+            raise ValueError(
+                f"Table '{name}' has a cursor, it can't be replaced in full on each run"
+            )
+        if options["initial_value"] is not None and not options["cursor"]:
+            raise ValueError(f"Table '{name}' has an initial_value but no cursor")
+        table_catalog[name] = options
+    return table_catalog
+
+
+def detect_cursor(table: Table) -> Optional[str]:
+    """A timestamp column of `table` likely updated along with its row, if any"""
+    timestamps = {
+        column.name.lower(): str(column.name)
+        for column in table.columns
+        if isinstance(column.type, DateTime)
+    }
+    for name in CURSOR_NAMES:
+        if name in timestamps:
+            return timestamps[name]
+    for name, column_name in timestamps.items():
+        if CURSOR_NAME_PATTERN.search(name):
+            return column_name
+    return None
@@ -0,0 +1,106 @@
+"""
+Throughput and lag metrics of data-sync runs.
+
+Each table's metrics combine its extraction stats (see `TableLoader.stats`) and,
+for incremental tables, its cursor's high-water mark and how far behind the source
+database's current time it is. The normalize and load steps process every table of
+a pipeline run at once, so their durations are the sync's, not any table's.
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine
+
+PIPELINE_STEPS = ("extract", "normalize", "load")
+
+
+def step_seconds(trace) -> Dict[str, float]:
+    """Seconds each step of a pipeline run's trace took"""
+    seconds = dict.fromkeys(PIPELINE_STEPS, 0.0)
+    for step in trace.steps if trace else []:
+        if step.step in seconds and step.finished_at:
+            seconds[step.step] += (step.finished_at - step.started_at).total_seconds()
+    return seconds
+
+
+def cursor_high_water_mark(pipeline, table: str, cursor: str) -> Any:
+    """The last value of a table's incremental cursor, in the pipeline's state"""
+    for source_state in pipeline.state.get("sources", {}).values():
+        incremental = (
+            source_state.get("resources", {}).get(table, {}).get("incremental", {})
+        )
+        if cursor in incremental:
+            return incremental[cursor].get("last_value")
+    return None
+
+
+def source_now(engine: Engine) -> datetime:
+    """The source database's current time"""
+    with engine.connect() as connection:
+        return connection.execute(select(func.current_timestamp())).scalar()
+
+
+def lag_seconds(now: Any, high_water_mark: Any) -> Optional[float]:
+    """Seconds from a datetime cursor's high-water mark to `now`, naive ones in UTC"""
+    if not isinstance(now, datetime) or not isinstance(high_water_mark, datetime):
+        return None
+    now, high_water_mark = [
+        value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        for value in (now, high_water_mark)
+    ]
+    return (now - high_water_mark).total_seconds()
+
+
+def table_metrics(
+    table: str,
+    options: Dict[str, Any],
+    stats: Dict[str, Any],
+    high_water_mark: Any = None,
+    now: Any = None,
+) -> Dict[str, Any]:
+    """A table's metrics, from its catalog options and merged load stats"""
+    seconds = stats["extract_seconds"]
+    return {
+        "table": table,
+        "write_disposition": options["write_disposition"],
+        "rows": stats["rows"],
+        "bytes": stats["bytes"],
+        "chunks": stats["chunks"],
+        "extract_seconds": stats["extract_seconds"],
+        "rows_per_second": stats["rows"] / seconds if seconds else None,
+        "peak_rss_bytes": stats["peak_rss_bytes"],
+        "cursor": options["cursor"],
+        "high_water_mark": (
+            high_water_mark.isoformat()
+            if isinstance(high_water_mark, datetime)
+            else high_water_mark
+        ),
+        "lag_seconds": lag_seconds(now, high_water_mark),
+    }
+
+
+def write_metrics(metrics_path: Path, metrics: Dict[str, Any]) -> None:
+    metrics_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(metrics_path, "w") as metrics_file:
+        json.dump(metrics, metrics_file, indent=4, default=str)
+
+
+def metrics_rows(metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    A row per table, with the sync's source, start time and normalize and load
+    seconds, shared by all its tables
+    """
+    return [
+        {
+            "source": metrics["source"],
+            "started_at": metrics["started_at"],
+            "sync_normalize_seconds": metrics["normalize_seconds"],
+            "sync_load_seconds": metrics["load_seconds"],
+            **table,
+        }
+        for table in metrics["tables"]
+    ]
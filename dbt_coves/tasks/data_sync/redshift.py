@@ -34,10 +34,7 @@ class RedshiftDataSyncTask(BaseDataSyncTask):
             parents=[base_subparser],
             help="""Loads data into Redshift""",
         )
-        subparser.add_argument(
-            "--tables", help="List of tables to dump", required=False
-        )
-        subparser.add_argument("--source", help="Source database name", required=True)
+        cls.register_sync_arguments(subparser)
         subparser.set_defaults(cls=cls, which="redshift")
         return subparser
 
@@ -48,6 +45,9 @@ class RedshiftDataSyncTask(BaseDataSyncTask):
     def run(self):
         self.tables = self.get_config_value("tables")
         self.get_source_connection_string()
+        if self.get_config_value("detect_cursors"):
+            self.detect_cursors()
+            return 0
         self.get_destination_instance()
         self.destination_instance.set_credentials()
         self.perform_sync()
@@ -54,10 +54,7 @@ class SnowflakeDataSyncTask(BaseDataSyncTask):
             parents=[base_subparser],
             help="""Loads data into Snowflake""",
         )
-        subparser.add_argument(
-            "--tables", help="List of tables to dump", required=False
-        )
-        subparser.add_argument("--source", help="Source database name", required=True)
+        cls.register_sync_arguments(subparser)
         subparser.set_defaults(cls=cls, which="snowflake")
         return subparser
 
@@ -68,6 +65,9 @@ class SnowflakeDataSyncTask(BaseDataSyncTask):
     def run(self):
         self.tables = self.get_config_value("tables")
         self.get_source_connection_string()
+        if self.get_config_value("detect_cursors"):
+            self.detect_cursors()
+            return 0
         self.get_destination_instance()
         self.destination_instance.set_credentials()
         self.perform_sync()
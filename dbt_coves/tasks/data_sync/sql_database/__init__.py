@@ -1,10 +1,12 @@
 """Source that loads tables form any SQLAlchemy supported database, supports batching requests
 and incremental loads."""
 
-from typing import Any, Callable, Iterable, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 import dlt
+from dlt.common import logger
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
+from dlt.common.schema.typing import TWriteDisposition
 from dlt.sources import DltResource
 from dlt.sources.credentials import ConnectionStringCredentials
 from sqlalchemy import MetaData, Table
@@ -17,7 +19,8 @@ from .helpers import (
     get_primary_key,
     table_rows,
 )
-from .schema_types import table_to_columns
+from .reflection import reflect_table
+from .schema_types import TableBackend, table_to_columns
 
 
 @dlt.source
@@ -27,9 +30,13 @@ def sql_database(
     metadata: Optional[MetaData] = None,
     table_names: Optional[List[str]] = dlt.config.value,
     chunk_size: int = 1000,
+    chunk_bytes: Optional[int] = None,
     detect_precision_hints: Optional[bool] = dlt.config.value,
     defer_table_reflect: Optional[bool] = dlt.config.value,
     table_adapter_callback: Callable[[Table], None] = None,
+    backend: TableBackend = "sqlalchemy",
+    refresh_reflection: bool = False,
+    table_options: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Iterable[DltResource]:
     """
     A DLT source which loads data from an SQL database using SQLAlchemy.
@@ -46,6 +53,9 @@ def sql_database(
             all tables in the schema are loaded.
         chunk_size (int): Number of rows yielded in one batch.
             SQL Alchemy will create additional internal rows buffer twice the chunk size.
+        chunk_bytes (Optional[int]): Size chunks by memory instead: after a first chunk of
+            up to 100 rows, each chunk takes as many rows as fit in `chunk_bytes`, at the
+            average size of the rows read so far (10 to 100000 rows).
         detect_precision_hints (bool): Set column precision and scale hints for supported data types
             in the target schema based on the columns in the source tables.
             This is disabled by default.
@@ -54,6 +64,20 @@ def sql_database(
             Enable this option when running on Airflow. Available on dlt 0.4.4 and later.
         table_adapter_callback: (Callable): Receives each reflected table.
             May be used to modify the list of columns that will be selected.
+        backend (TableBackend): What each chunk of rows is yielded as. "sqlalchemy"
+            yields lists of dicts, "pyarrow" arrow tables and "pandas" data frames.
+            Arrow tables and data frames skip dlt's row by row normalization, and
+            require pyarrow (and pandas) to be installed. JSON columns are loaded
+            as JSON strings instead of being unnested into their own columns.
+        refresh_reflection (bool): Reflect tables from the database, even if their
+            cached reflection is still valid (see `reflection.py`).
+        table_options (Optional[Dict[str, Dict[str, Any]]]): Arguments of each
+            table's resource, by table name, i.e. its `partitions`.
+    Tables can be read in parallel key ranges by setting their `partitions` (and
+    `partition_column`), or in keyset pages with `page_size` (and `max_pages`), in
+    `table_options` or the `sources.sql_database.<table>` config section, see
+    `sql_table`.
+
     Returns:
         Iterable[DltResource]: A list of DLT resources for each table to be loaded.
     """
@@ -65,7 +89,9 @@ def sql_database(
     # use provided tables or all tables
     if table_names:
         tables = [
-            Table(name, metadata, autoload_with=None if defer_table_reflect else engine)
+            Table(name, metadata)
+            if defer_table_reflect
+            else reflect_table(engine, metadata, name, refresh=refresh_reflection)
             for name in table_names
         ]
     else:
@@ -90,6 +116,10 @@ def sql_database(
             detect_precision_hints=detect_precision_hints,
             defer_table_reflect=defer_table_reflect,
             table_adapter_callback=table_adapter_callback,
+            backend=backend,
+            refresh_reflection=refresh_reflection,
+            chunk_bytes=chunk_bytes,
+            **(table_options or {}).get(table.name, {}),
         )
 
 
@@ -105,9 +135,18 @@ def sql_table(
     metadata: Optional[MetaData] = None,
     incremental: Optional[dlt.sources.incremental[Any]] = None,
     chunk_size: int = 1000,
+    chunk_bytes: Optional[int] = None,
     detect_precision_hints: Optional[bool] = dlt.config.value,
     defer_table_reflect: Optional[bool] = dlt.config.value,
     table_adapter_callback: Callable[[Table], None] = None,
+    backend: TableBackend = "sqlalchemy",
+    partitions: int = 1,
+    partition_column: Optional[str] = None,
+    page_size: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    refresh_reflection: bool = False,
+    write_disposition: TWriteDisposition = "append",
+    primary_key: Optional[List[str]] = None,
 ) -> DltResource:
     """
     A dlt resource which loads data from an SQL database table using SQLAlchemy.
@@ -124,6 +163,9 @@ def sql_table(
             pendulum.parse('2022-01-01T00:00:00Z'))`
         chunk_size (int): Number of rows yielded in one batch.
             SQL Alchemy will create additional internal rows buffer twice the chunk size.
+        chunk_bytes (Optional[int]): Size chunks by memory instead: after a first chunk of
+            up to 100 rows, each chunk takes as many rows as fit in `chunk_bytes`, at the
+            average size of the rows read so far (10 to 100000 rows).
         detect_precision_hints (bool): Set column precision and scale hints for supported data
             types in the target schema based on the columns in the source tables.
             This is disabled by default.
@@ -132,6 +174,33 @@ def sql_table(
             on dlt 0.4.4 and later
         table_adapter_callback: (Callable): Receives each reflected table.
             May be used to modify the list of columns that will be selected.
+        backend (TableBackend): What each chunk of rows is yielded as. "sqlalchemy"
+            yields lists of dicts, "pyarrow" arrow tables and "pandas" data frames.
+            Arrow tables and data frames skip dlt's row by row normalization, and
+            require pyarrow (and pandas) to be installed. JSON columns are loaded
+            as JSON strings instead of being unnested into their own columns.
+        refresh_reflection (bool): Reflect tables from the database, even if their
+            cached reflection is still valid (see `reflection.py`).
+        partitions (int): Number of key ranges the table is split into, each read by
+            its own connection, in parallel. Rows are yielded in no particular order.
+        partition_column (Optional[str]): Column the key ranges are taken from.
+            Defaults to the incremental cursor column, or the (first) primary key
+            column. Tables without either are read with a single query.
+        page_size (Optional[int]): Read the table in pages of `page_size` rows, each
+            a short query continuing after the last row read, ordered by incremental
+            cursor and primary key (`cursor > last_seen ORDER BY cursor, pk LIMIT n`),
+            instead of a single long-running query. A page whose query fails with an
+            OperationalError (i.e. cancelled on a replica) is read again from the last
+            row read. Requires a primary key, and can't be combined with `partitions`.
+        max_pages (Optional[int]): Stop after this many pages: the rest of the table is
+            read by the next run, continuing after the last row read by this one,
+            which is kept in the resource's state.
+        write_disposition (TWriteDisposition): How rows are written to the destination
+            table. With "merge", rows replace those of the same primary key, so rows
+            read again (i.e. updated in place, or at an incremental cursor's last value)
+            aren't duplicated. Tables without a primary key are appended to instead.
+        primary_key (Optional[List[str]]): Columns identifying each row, instead of
+            the table's primary key.
 
     Returns:
         DltResource: The dlt resource for loading data from the SQL database table.
@@ -140,16 +209,26 @@ def sql_table(
     engine.execution_options(stream_results=True, max_row_buffer=2 * chunk_size)
     metadata = metadata or MetaData(schema=schema)
 
-    table_obj = Table(
-        table, metadata, autoload_with=None if defer_table_reflect else engine
+    table_obj = (
+        Table(table, metadata)
+        if defer_table_reflect
+        else reflect_table(engine, metadata, table, refresh=refresh_reflection)
     )
     if table_adapter_callback and not defer_table_reflect:
         table_adapter_callback(table_obj)
+    primary_key = primary_key or get_primary_key(table_obj)
+    if write_disposition == "merge" and not primary_key:
+        logger.warning(
+            f"Table '{table_obj.name}' has no primary key to merge rows on, "
+            "they're appended instead"
+        )
+        write_disposition = "append"
 
     return dlt.resource(
         table_rows,
         name=table_obj.name,
-        primary_key=get_primary_key(table_obj),
+        primary_key=primary_key,
+        write_disposition=write_disposition,
         columns=table_to_columns(table_obj) if detect_precision_hints else None,
     )(
         engine,
@@ -159,4 +238,11 @@ def sql_table(
         detect_precision_hints=detect_precision_hints,
         defer_table_reflect=defer_table_reflect,
         table_adapter_callback=table_adapter_callback,
+        backend=backend,
+        partitions=partitions,
+        partition_column=partition_column,
+        page_size=page_size,
+        max_pages=max_pages,
+        refresh_reflection=refresh_reflection,
+        chunk_bytes=chunk_bytes,
     )
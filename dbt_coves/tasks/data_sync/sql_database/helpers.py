@@ -1,16 +1,55 @@
 """SQL database source helpers"""
 
 import operator
-from typing import Any, Callable, Iterator, List, Optional, Union
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 
 import dlt
 from dlt.common.configuration.specs import BaseConfiguration, configspec
+from dlt.common.schema.typing import TWriteDisposition
 from dlt.common.typing import TDataItem
 from dlt.sources.credentials import ConnectionStringCredentials
-from sqlalchemy import create_engine
+from sqlalchemy import and_, create_engine, func, or_, select
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.sql import sqltypes
 
-from .schema_types import SelectAny, Table, table_to_columns
+from .reflection import reflect_table
+from .schema_types import (
+    ColumnAny,
+    SelectAny,
+    Table,
+    TableBackend,
+    table_to_backend_columns,
+    table_to_columns,
+)
+
+# Column types whose range is split by interpolating between their min and max values,
+# others are split at the values found at evenly spaced offsets
+INTERPOLATED_TYPES = (
+    sqltypes.Integer,
+    sqltypes.Numeric,
+    sqltypes.DateTime,
+    sqltypes.Date,
+)
+# Marks that a partition was read completely
+PARTITION_DONE = object()
+# Bounds of the rows per chunk when sizing chunks by `chunk_bytes`, starting with a
+# small chunk to measure rows' size
+FIRST_ADAPTIVE_CHUNK_ROWS = 100
+MIN_CHUNK_ROWS = 10
+MAX_CHUNK_ROWS = 100000
+# Rows per chunk whose size is measured, to estimate the chunk's size
+SAMPLED_ROWS = 50
+# Times a page's query is run before failing, i.e. when cancelled by a replica
+PAGE_ATTEMPTS = 3
+
+# Stats of the tables loaded by this process, by table name
+LOAD_STATS: Dict[str, Dict[str, Any]] = {}
 
 
 class TableLoader:
@@ -20,11 +59,47 @@ class TableLoader:
         table: Table,
         chunk_size: int = 1000,
         incremental: Optional[dlt.sources.incremental[Any]] = None,
+        backend: TableBackend = "sqlalchemy",
+        partitions: int = 1,
+        partition_column: Optional[str] = None,
+        chunk_bytes: Optional[int] = None,
+        page_size: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        state: Optional[Dict[str, Any]] = None,
     ) -> None:
         self.engine = engine
         self.table = table
         self.chunk_size = chunk_size
+        self.chunk_bytes = chunk_bytes
         self.incremental = incremental
+        self.backend = backend
+        self.partitions = partitions
+        self.page_size = page_size
+        self.max_pages = max_pages
+        # The resource's state, keeping the last row read by a run stopped at
+        # `max_pages` for the next one
+        self.state = state if state is not None else {}
+        self.stats = {
+            "rows": 0,
+            "pages": 0,
+            "complete": True,
+            "chunks": 0,
+            "bytes": 0,
+            "max_chunk_bytes": 0,
+            "last_chunk_rows": 0,
+            "peak_rss_bytes": None,
+            "extract_seconds": 0.0,
+        }
+        self._stats_lock = threading.Lock()
+        if backend == "pyarrow":
+            # Raises with install instructions if pyarrow is missing
+            from dlt.common.libs.pyarrow import pyarrow  # noqa: F401
+
+            self.columns = table_to_backend_columns(table)
+        elif backend == "pandas":
+            from dlt.common.libs.pandas import pandas  # noqa: F401
+        elif backend != "sqlalchemy":
+            raise ValueError(f"Unknown backend '{backend}' to load table {table.name}")
         if incremental:
             try:
                 self.cursor_column = table.c[incremental.cursor_path]
@@ -41,6 +116,9 @@ class TableLoader:
             self.last_value = None
             self.end_value = None
             self.row_order = None
+        self.partition_column = self._get_partition_column(partition_column)
+        self.keyset_columns = self._get_keyset_columns() if page_size else None
+        self._last_key = None
 
     def make_query(self) -> SelectAny:
         table = self.table
@@ -77,12 +155,336 @@ class TableLoader:
 
         return query
 
-    def load_rows(self) -> Iterator[List[TDataItem]]:
+    def make_partition_queries(self) -> List[SelectAny]:
+        """
+        Split the table's query into up to `partitions` queries, each reading a range
+        of the partition column. The first range includes its NULL values
+        """
         query = self.make_query()
+        # Partitions are read concurrently, so rows can't be yielded in order
+        if self.partitions <= 1 or self.partition_column is None or self.row_order:
+            return [query]
+        bounds = self._get_partition_bounds(query)
+        if not bounds:
+            return [query]
+        column = self.partition_column
+        queries = []
+        for lower, upper in zip([None, *bounds], [*bounds, None]):
+            if lower is None:
+                partition_query = query.where(or_(column < upper, column.is_(None)))
+            elif upper is None:
+                partition_query = query.where(column >= lower)
+            else:
+                partition_query = query.where(column >= lower, column < upper)
+            queries.append(partition_query)
+        return queries
+
+    def load_rows(self) -> Iterator[TDataItem]:
+        LOAD_STATS[self.table.name] = self.stats
+        started = time.perf_counter()
+        try:
+            if self.page_size:
+                yield from self._load_pages()
+                return
+            queries = self.make_partition_queries()
+            if len(queries) == 1:
+                yield from self._load_query(queries[0])
+            else:
+                yield from self._load_partitions(queries)
+        finally:
+            self.stats["peak_rss_bytes"] = peak_rss_bytes()
+            # Includes the time dlt takes processing the chunks yielded
+            self.stats["extract_seconds"] = time.perf_counter() - started
+
+    def make_page_query(self, last_key: Optional[List[Any]] = None) -> SelectAny:
+        """
+        The query of the page of `page_size` rows after `last_key`, the values of the
+        keyset columns (incremental cursor and primary key) of the last row read
+        """
+        query = (
+            self.make_query()
+            .order_by(None)
+            .order_by(*self.keyset_columns)
+            .limit(self.page_size)
+        )
+        if last_key is None:
+            return query
+        # (a, b) > (x, y) as a > x OR (a = x AND b > y), as not all databases support
+        # comparing tuples
+        return query.where(
+            or_(
+                *[
+                    and_(
+                        *[
+                            column == value
+                            for column, value in zip(self.keyset_columns[:i], last_key)
+                        ],
+                        self.keyset_columns[i] > last_key[i],
+                    )
+                    for i in range(len(self.keyset_columns))
+                ]
+            )
+        )
+
+    def _load_pages(self) -> Iterator[TDataItem]:
+        """
+        Read the table in pages, each a short query (and transaction) continuing
+        after the last row read. A page whose query fails, i.e. cancelled by a
+        replica's recovery, is read again from the last row read. After
+        `max_pages` pages, the rest of the table is left for the next run, which
+        continues after the last row read
+        """
+        last_key = self._get_resumed_key()
+        while True:
+            if self.max_pages is not None and self.stats["pages"] >= self.max_pages:
+                self.stats["complete"] = False
+                if last_key is not None:
+                    self.state["last_key"] = last_key
+                return
+            for attempt in range(1, PAGE_ATTEMPTS + 1):
+                rows_read = self.stats["rows"]
+                try:
+                    for chunk in self._load_query(self.make_page_query(last_key)):
+                        last_key = self._last_key
+                        yield chunk
+                    break
+                except OperationalError:
+                    if attempt == PAGE_ATTEMPTS:
+                        raise
+                    time.sleep(attempt)
+            self.stats["pages"] += 1
+            if self.stats["rows"] - rows_read < self.page_size:
+                self.state.pop("last_key", None)
+                return
+
+    def _get_resumed_key(self) -> Optional[List[Any]]:
+        """
+        The last row read by the previous run, if it stopped at `max_pages`. The
+        incremental cursor restarts from its last value, which more rows than a run
+        reads may share, so runs continue after that row instead. It's ignored if
+        the cursor's last value isn't the row's anymore (i.e. it was reset)
+        """
+        last_key = self.state.get("last_key")
+        if last_key is None:
+            return None
+        if self.cursor_column is not None and last_key[0] != self.last_value:
+            return None
+        return last_key
+
+    def _load_partitions(self, queries: List[SelectAny]) -> Iterator[TDataItem]:
+        """
+        Read each partition with its own connection and thread, and yield their
+        chunks as they're read
+        """
+        chunks: queue.Queue = queue.Queue(maxsize=2 * len(queries))
+        stopped = threading.Event()
+
+        def put(item):
+            while not stopped.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def read_partition(query):
+            try:
+                for chunk in self._load_query(query):
+                    if not put(chunk):
+                        return
+            except Exception as e:
+                put(e)
+            finally:
+                put(PARTITION_DONE)
+
+        with ThreadPoolExecutor(
+            max_workers=len(queries), thread_name_prefix=f"{self.table.name}_partition"
+        ) as executor:
+            for query in queries:
+                executor.submit(read_partition, query)
+            try:
+                partitions_done = 0
+                while partitions_done < len(queries):
+                    item = chunks.get()
+                    if item is PARTITION_DONE:
+                        partitions_done += 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                # Stop the other partitions' threads if one failed or the resource
+                # was closed
+                stopped.set()
+
+    def _load_query(self, query: SelectAny) -> Iterator[TDataItem]:
+        chunk_size = self._next_chunk_size()
+        with self.engine.connect() as conn:
+            result = conn.execution_options(yield_per=chunk_size).execute(query)
+            columns = list(result.keys())
+            while rows := result.fetchmany(chunk_size):
+                if self.keyset_columns:
+                    self._last_key = [
+                        rows[-1]._mapping[column] for column in self.keyset_columns
+                    ]
+                chunk = self._make_chunk(rows, columns)
+                self._add_chunk_stats(chunk, len(rows))
+                next_chunk_size = self._next_chunk_size()
+                if next_chunk_size != chunk_size:
+                    # Buffer as many rows as the next chunks take
+                    chunk_size = next_chunk_size
+                    result.yield_per(chunk_size)
+                yield chunk
+
+    def _make_chunk(self, rows: List[Any], columns: List[str]) -> TDataItem:
+        if self.backend == "pyarrow":
+            # An arrow table, that dlt writes without normalizing rows
+            from dlt.sources.sql_database.arrow_helpers import row_tuples_to_arrow
+
+            return row_tuples_to_arrow(rows, self.columns, tz="UTC")
+        if self.backend == "pandas":
+            from dlt.common.libs.pandas import pandas
+
+            return pandas.DataFrame.from_records(
+                rows, columns=columns, coerce_float=True
+            )
+        return [dict(row._mapping) for row in rows]
+
+    def _next_chunk_size(self) -> int:
+        """
+        Rows in the next chunk: `chunk_size`, or as many rows of the average size
+        read so far as fit in `chunk_bytes`
+        """
+        if not self.chunk_bytes:
+            return self.chunk_size
+        if not self.stats["rows"]:
+            return min(self.chunk_size, FIRST_ADAPTIVE_CHUNK_ROWS)
+        row_bytes = max(self.stats["bytes"] / self.stats["rows"], 1)
+        return max(
+            MIN_CHUNK_ROWS, min(MAX_CHUNK_ROWS, int(self.chunk_bytes / row_bytes))
+        )
+
+    def _add_chunk_stats(self, chunk: TDataItem, rows: int) -> None:
+        chunk_bytes = chunk_size_in_bytes(chunk)
+        with self._stats_lock:
+            self.stats["rows"] += rows
+            self.stats["chunks"] += 1
+            self.stats["bytes"] += chunk_bytes
+            self.stats["max_chunk_bytes"] = max(
+                self.stats["max_chunk_bytes"], chunk_bytes
+            )
+            self.stats["last_chunk_rows"] = rows
+
+    def _get_partition_column(
+        self, partition_column: Optional[str]
+    ) -> Optional[ColumnAny]:
+        """
+        The column to partition reads by: `partition_column` if given, else the
+        incremental cursor column or the (first) primary key column
+        """
+        if partition_column:
+            try:
+                return self.table.c[partition_column]
+            except KeyError as e:
+                raise KeyError(
+                    f"Partition column '{partition_column}' "
+                    f"does not exist in table '{self.table.name}'"
+                ) from e
+        if self.cursor_column is not None:
+            return self.cursor_column
+        primary_key = list(self.table.primary_key)
+        return primary_key[0] if primary_key else None
+
+    def _get_keyset_columns(self) -> List[ColumnAny]:
+        """Columns ordering pages: the incremental cursor, then the primary key"""
+        if self.partitions > 1:
+            raise ValueError(
+                f"Table '{self.table.name}' can't be read in both pages and partitions"
+            )
+        if self.incremental and self.incremental.last_value_func is not max:
+            raise ValueError(
+                f"Table '{self.table.name}' can only be read in pages with an "
+                "incremental cursor whose last value is its max"
+            )
+        primary_key = list(self.table.primary_key)
+        if not primary_key:
+            raise ValueError(
+                f"Table '{self.table.name}' needs a primary key to be read in pages"
+            )
+        if self.cursor_column is None:
+            return primary_key
+        return [self.cursor_column] + [
+            column for column in primary_key if column is not self.cursor_column
+        ]
+
+    def _get_partition_bounds(self, query: SelectAny) -> List[Any]:
+        """Sorted, distinct values splitting `query`'s rows into partitions"""
+        rows = query.order_by(None).subquery()
+        column = rows.c[self.partition_column.name]
         with self.engine.connect() as conn:
-            result = conn.execution_options(yield_per=self.chunk_size).execute(query)
-            for partition in result.partitions(size=self.chunk_size):
-                yield [dict(row._mapping) for row in partition]
+            if isinstance(self.partition_column.type, INTERPOLATED_TYPES):
+                low, high = conn.execute(
+                    select(func.min(column), func.max(column))
+                ).one()
+                if low is None or low == high:
+                    return []
+                bounds = [
+                    low + (high - low) * i / self.partitions
+                    if not isinstance(low, int)
+                    else low + (high - low) * i // self.partitions
+                    for i in range(1, self.partitions)
+                ]
+            else:
+                count = conn.execute(select(func.count()).select_from(rows)).scalar()
+                bounds = [
+                    conn.execute(
+                        select(column)
+                        .where(column.is_not(None))
+                        .order_by(column)
+                        .offset(count * i // self.partitions)
+                        .limit(1)
+                    ).scalar()
+                    for i in range(1, self.partitions)
+                ]
+        return sorted({bound for bound in bounds if bound is not None})
+
+
+def chunk_size_in_bytes(chunk: TDataItem) -> int:
+    """
+    Memory taken by a chunk's data: exact for arrow tables and data frames, estimated
+    from a sample of the rows for lists of dicts
+    """
+    if hasattr(chunk, "nbytes"):
+        return chunk.nbytes
+    if hasattr(chunk, "memory_usage"):
+        return int(chunk.memory_usage(deep=True).sum())
+    if not chunk:
+        return 0
+    sample = chunk[:: max(len(chunk) // SAMPLED_ROWS, 1)]
+    return sum(value_size_in_bytes(row) for row in sample) * len(chunk) // len(sample)
+
+
+def value_size_in_bytes(value: Any) -> int:
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            value_size_in_bytes(key) + value_size_in_bytes(item)
+            for key, item in value.items()
+        )
+    elif isinstance(value, (list, tuple)):
+        size += sum(value_size_in_bytes(item) for item in value)
+    return size
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """The process' peak resident memory, None where it can't be read (Windows)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
 
 
 def table_rows(
@@ -93,10 +495,17 @@ def table_rows(
     detect_precision_hints: bool = False,
     defer_table_reflect: bool = False,
     table_adapter_callback: Callable[[Table], None] = None,
+    backend: TableBackend = "sqlalchemy",
+    partitions: int = 1,
+    partition_column: Optional[str] = None,
+    refresh_reflection: bool = False,
+    chunk_bytes: Optional[int] = None,
+    page_size: Optional[int] = None,
+    max_pages: Optional[int] = None,
 ) -> Iterator[TDataItem]:
     if defer_table_reflect:
-        table = Table(
-            table.name, table.metadata, autoload_with=engine, extend_existing=True
+        table = reflect_table(
+            engine, table.metadata, table.name, refresh=refresh_reflection
         )
         if table_adapter_callback:
             table_adapter_callback(table)
@@ -114,7 +523,19 @@ def table_rows(
             ),
         )
 
-    loader = TableLoader(engine, table, incremental=incremental, chunk_size=chunk_size)
+    loader = TableLoader(
+        engine,
+        table,
+        incremental=incremental,
+        chunk_size=chunk_size,
+        backend=backend,
+        partitions=partitions,
+        partition_column=partition_column,
+        chunk_bytes=chunk_bytes,
+        page_size=page_size,
+        max_pages=max_pages,
+        state=dlt.current.resource_state() if page_size else None,
+    )
     yield from loader.load_rows()
 
 
@@ -137,6 +558,10 @@ def get_primary_key(table: Table) -> List[str]:
 @configspec
 class SqlDatabaseTableConfiguration(BaseConfiguration):
     incremental: Optional[dlt.sources.incremental] = None  # type: ignore[type-arg]
+    partitions: int = 1
+    partition_column: Optional[str] = None
+    page_size: Optional[int] = None
+    max_pages: Optional[int] = None
 
 
 @configspec
@@ -148,8 +573,17 @@ class SqlTableResourceConfiguration(BaseConfiguration):
     incremental: Optional[dlt.sources.incremental] = None  # type: ignore[type-arg]
     schema: Optional[str] = None
     chunk_size: int = 50000
+    chunk_bytes: Optional[int] = None
     detect_precision_hints: Optional[bool] = False
     defer_table_reflect: Optional[bool] = False
+    backend: TableBackend = "sqlalchemy"
+    partitions: int = 1
+    partition_column: Optional[str] = None
+    refresh_reflection: Optional[bool] = False
+    page_size: Optional[int] = None
+    max_pages: Optional[int] = None
+    write_disposition: TWriteDisposition = "append"
+    primary_key: Optional[List[str]] = None
 
 
 __source_name__ = "sql_database"
@@ -0,0 +1,109 @@
+"""
+Reflected tables cached on disk.
+
+Reflecting a table takes several catalog queries. Reflected tables are pickled in
+the user's cache directory, by connection (without its password), schema and table
+name, and reused as long as the table's column names, read with a query returning no
+rows, match the cached ones. Changes that keep column names (i.e. a column's type)
+need a refresh.
+"""
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Union
+
+import sqlalchemy
+from sqlalchemy import MetaData, Table, select, table, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from dbt_coves.utils.hashing import canonical_hash
+
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "dbt-coves"
+    / "reflected_tables"
+)
+
+
+def reflect_table(
+    engine: Engine,
+    metadata: MetaData,
+    name: str,
+    refresh: bool = False,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> Table:
+    """
+    `Table(name, metadata, autoload_with=engine)`, replacing any table of the same
+    name in `metadata`, reused from the cache unless `refresh` or the table changed
+    """
+    cache_path = (
+        Path(cache_dir or CACHE_DIR)
+        / connection_fingerprint(engine, metadata.schema)
+        / f"{canonical_hash(name)[:16]}.pickle"
+    )
+    with engine.connect() as connection:
+        cached_table = None if refresh else _load_table(cache_path)
+        if cached_table is not None and _column_names(
+            connection, name, metadata.schema
+        ) == [column.name for column in cached_table.columns]:
+            existing_table = metadata.tables.get(cached_table.key)
+            if existing_table is not None:
+                metadata.remove(existing_table)
+            return cached_table.to_metadata(metadata)
+        reflected_table = Table(
+            name, metadata, autoload_with=connection, extend_existing=True
+        )
+    _store_table(cache_path, reflected_table)
+    return reflected_table
+
+
+def connection_fingerprint(engine: Engine, schema: Optional[str]) -> str:
+    """Identifies the database and schema reflected, and how"""
+    return canonical_hash(
+        [
+            engine.url.render_as_string(hide_password=True),
+            schema,
+            sqlalchemy.__version__,
+        ]
+    )[:16]
+
+
+def _column_names(
+    connection: Connection, name: str, schema: Optional[str]
+) -> Optional[List[str]]:
+    try:
+        result = connection.execute(
+            select(text("*")).select_from(table(name, schema=schema)).limit(0)
+        )
+        return list(result.keys())
+    except SQLAlchemyError:
+        # The table was likely dropped: reflecting it raises the right error
+        connection.rollback()
+        return None
+
+
+def _load_table(cache_path: Path) -> Optional[Table]:
+    try:
+        with open(cache_path, "rb") as cache_file:
+            return pickle.load(cache_file)
+    except Exception:
+        # Missing, or written by an incompatible version
+        return None
+
+
+def _store_table(cache_path: Path, reflected_table: Table) -> None:
+    """Pickle a copy of the table alone, not the rest of its metadata"""
+    temp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=cache_path.parent)
+        with os.fdopen(file_descriptor, "wb") as cache_file:
+            pickle.dump(reflected_table.to_metadata(MetaData()), cache_file)
+        os.replace(temp_path, cache_path)
+    except Exception:
+        # Caching is best effort, i.e. in read-only home directories
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
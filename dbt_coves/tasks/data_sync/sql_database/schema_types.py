@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Optional, Type
+from typing import TYPE_CHECKING, Any, Literal, Optional, Type
 
 from dlt.common.schema.typing import TColumnSchema, TTableSchemaColumns
 from sqlalchemy import Column, Table
@@ -13,6 +13,9 @@ else:
     SelectAny: TypeAlias = Type[Any]
     ColumnAny: TypeAlias = Type[Any]
 
+# What rows are yielded as: lists of dicts, arrow tables or pandas data frames
+TableBackend = Literal["sqlalchemy", "pyarrow", "pandas"]
+
 
 def sqla_col_to_column_schema(sql_col: ColumnAny) -> Optional[TColumnSchema]:
     """Infer dlt schema column type from an sqlalchemy type.
@@ -62,3 +65,24 @@ def table_to_columns(table: Table) -> TTableSchemaColumns:
         for col in (sqla_col_to_column_schema(c) for c in table.columns)
         if col is not None
     }
+
+
+def table_to_backend_columns(table: Table) -> TTableSchemaColumns:
+    """Convert an sqlalchemy table to a dlt table schema with all of its columns,
+    used to build arrow tables.
+
+    Columns of types without a dlt equivalent have no data type, so it's inferred
+    from their values.
+    """
+    columns: TTableSchemaColumns = {}
+    for sql_col in table.columns:
+        col = sqla_col_to_column_schema(sql_col) or {"name": sql_col.name}
+        if isinstance(sql_col.type, sqltypes.Boolean):
+            col["data_type"] = "bool"
+        elif isinstance(sql_col.type, sqltypes.Float):
+            col["data_type"] = "double"
+        elif isinstance(sql_col.type, sqltypes.JSON):
+            col["data_type"] = "json"
+        col["nullable"] = sql_col.nullable
+        columns[sql_col.name] = col
+    return columns
@@ -9,6 +9,7 @@ from rich.console import Console
 from rich.text import Text
 
 from dbt_coves.tasks.base import NonDbtBaseConfiguredTask
+from dbt_coves.utils import project_copy
 from dbt_coves.utils.tracking import trackable
 
 console = Console()
@@ -49,6 +50,13 @@ class RunDbtTask(NonDbtBaseConfiguredTask):
             default=False,
             help="If a read-write clone is created, remove it after completion",
         )
+        ext_subparser.add_argument(
+            "--full-copy",
+            action="store_true",
+            default=False,
+            help="Copy the whole read-only project, instead of overlaying it with "
+            "links to its files",
+        )
         ext_subparser.add_argument(
             "command",
             type=str,
@@ -72,16 +80,21 @@ class RunDbtTask(NonDbtBaseConfiguredTask):
         command = self.get_config_value("command")
         if self.is_readonly(project_dir):
             path_file = Path("/tmp/dbt_coves_dbt_clone_path.txt")
-            tmp_dir = None
-            if path_file.exists():
+            full_copy = self.get_config_value("full_copy")
+            # Git projects' copies are cached by commit
+            tmp_dir = project_copy.cached_copy_path(project_dir)
+            if not tmp_dir and path_file.exists():
                 tmp_dir = open(path_file).read().rstrip("\n")
             if not tmp_dir:
                 tmp_dir = tempfile.NamedTemporaryFile().name
+            tmp_dir = str(tmp_dir)
             if not os.path.exists(tmp_dir):
                 console.print(
                     f"Readonly project detected. Copying it to temp directory [b]{tmp_dir}[/b]."
                 )
-                subprocess.run(["cp", "-rf", f"{project_dir}/", tmp_dir], check=False)
+                project_copy.create_writable_copy(
+                    project_dir, tmp_dir, full_copy=full_copy
+                )
             try:
                 self.run_dbt(command, cwd=tmp_dir)
             finally:
@@ -1,5 +1,4 @@
 import glob
-import json
 import os
 import pathlib
 import re
@@ -11,7 +10,7 @@ from dbt_coves.core.exceptions import MissingArgumentException
 from dbt_coves.utils.api_caller import AirbyteApiCaller
 from dbt_coves.utils.tracking import trackable
 
-from .base import BaseExtractTask
+from .base import BaseExtractTask, ExtractException
 
 console = Console()
 NON_EXTRACT_KEYS = ["icon", "breakingChange", "createdAt", "updatedAt"]
@@ -120,6 +119,19 @@ class ExtractAirbyteTask(BaseExtractTask):
         for airbyte_conn in self.airbyte_api.connections_list:
             self._save_json_connection(airbyte_conn)
 
+        for directory, object_type in (
+            (self.sources_extract_destination, "sources"),
+            (self.destinations_extract_destination, "destinations"),
+            (self.connections_extract_destination, "connections"),
+        ):
+            self.remove_stale_jsons(
+                directory,
+                [
+                    os.path.join(directory, filename)
+                    for filename in self.extraction_results[object_type]
+                ],
+            )
+
         if len(self.extraction_results["sources"]) >= 1:
             console.print(
                 f"Extraction to path {extract_destination} was successful!\n"
@@ -129,6 +141,7 @@ class ExtractAirbyteTask(BaseExtractTask):
             )
         else:
             console.print("No Airbyte Connections were extracted")
+        self.print_extraction_changes()
         return 0
 
     def dbt_packages_exist(self, dbt_project_path):
@@ -282,11 +295,9 @@ class ExtractAirbyteTask(BaseExtractTask):
     def _save_json(self, path, json_object):
         json_object = self._remove_unnecessary_fields(json_object)
         try:
-            with open(path, "w") as json_file:
-                json.dump(json_object, json_file, indent=4)
-                json_file.write("\n")
-        except OSError as e:
-            raise AirbyteExtractorException(f"Couldn't write {path}: {e}")
+            self.save_json(path, json_object, trailing_newline=True)
+        except ExtractException as e:
+            raise AirbyteExtractorException(str(e))
 
     def _save_json_connection(self, connection: dict):
         connection = copy(connection)
@@ -304,8 +315,11 @@ class ExtractAirbyteTask(BaseExtractTask):
         connection.pop("sourceCatalogId", None)
         connection["sourceName"] = connection_source_name
         connection["destinationName"] = connection_destination_name
-        filename = self._normalize_filename(
-            f"{connection_source_name}-{connection_destination_name}.json"
+        filename = (
+            self._normalize_filename(
+                f"{connection_source_name}-{connection_destination_name}"
+            )
+            + ".json"
         )
 
         path = os.path.join(self.connections_extract_destination, filename)
@@ -1,6 +1,13 @@
+import glob
 import json
+import os
+
+from rich.console import Console
 
 from dbt_coves.tasks.base import NonDbtBaseTask
+from dbt_coves.utils.hashing import canonical_hash
+
+console = Console()
 
 
 class ExtractException(Exception):
@@ -10,10 +17,61 @@ class ExtractException(Exception):
 class BaseExtractTask(NonDbtBaseTask):
     def __init__(self, args, config):
         super().__init__(args, config)
+        self.extraction_changes = {
+            "added": [],
+            "changed": [],
+            "unchanged": [],
+            "removed": [],
+        }
 
-    def save_json(self, path, object):
+    def _existing_json_hash(self, path):
         try:
-            with open(path, "w") as json_file:
-                json.dump(object, json_file, indent=4)
-        except OSError as e:
-            raise ExtractException(f"Couldn't write {path}: {e}")
+            with open(path, "r") as json_file:
+                return canonical_hash(json.load(json_file))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def save_json(self, path, object, trailing_newline=False):
+        """
+        Write `object` to `path` unless the file already holds the same content.
+        Returns whether the file was 'added', 'changed' or 'unchanged'.
+        """
+        if not os.path.exists(path):
+            status = "added"
+        elif self._existing_json_hash(path) == canonical_hash(object):
+            status = "unchanged"
+        else:
+            status = "changed"
+
+        if status != "unchanged":
+            try:
+                with open(path, "w") as json_file:
+                    json.dump(object, json_file, indent=4)
+                    if trailing_newline:
+                        json_file.write("\n")
+            except OSError as e:
+                raise ExtractException(f"Couldn't write {path}: {e}")
+        self.extraction_changes[status].append(str(path))
+        return status
+
+    def remove_stale_jsons(self, directory, extracted_paths):
+        """Remove JSON files of objects that no longer exist in the extracted system"""
+        extracted_paths = {os.path.abspath(path) for path in extracted_paths}
+        for path in glob.glob(f"{directory}/*.json"):
+            if os.path.abspath(path) not in extracted_paths:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    raise ExtractException(f"Couldn't remove {path}: {e}")
+                self.extraction_changes["removed"].append(path)
+
+    def print_extraction_changes(self):
+        console.print(
+            ", ".join(
+                f"{len(paths)} {status}"
+                for status, paths in self.extraction_changes.items()
+            )
+        )
+        for status in ("added", "changed", "removed"):
+            for path in self.extraction_changes[status]:
+                console.print(f"  [b]{status}[/b]: {path}")
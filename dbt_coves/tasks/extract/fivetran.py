@@ -96,6 +96,13 @@ class ExtractFivetranTask(BaseExtractTask):
 
             self.save_json(destination_filepath, export_data)
             self.extraction_results.add(filename)
+        self.remove_stale_jsons(
+            self.extract_destination,
+            [
+                self.extract_destination.joinpath(filename)
+                for filename in self.extraction_results
+            ],
+        )
         if len(self.extraction_results) >= 1:
             console.print(
                 f"Extraction to path {self.extract_destination} was successful\n"
@@ -103,6 +110,7 @@ class ExtractFivetranTask(BaseExtractTask):
             )
         else:
             console.print("No Fivetran Connections were extracted")
+        self.print_extraction_changes()
         return 0
 
     def _connect_to_api_using_credentials_file(self, credentials_path):
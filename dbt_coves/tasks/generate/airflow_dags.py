@@ -1,24 +1,48 @@
 import datetime
 import importlib
+import io
+import json
 import os
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from glob import glob
+from inspect import signature
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-import isort
 import yaml
-from black import FileMode, format_str
 from rich.console import Console
 
+from dbt_coves import __version__
 from dbt_coves.core.exceptions import MissingArgumentException
 from dbt_coves.tasks.base import NonDbtBaseTask
-from dbt_coves.utils.secrets import load_secret_manager_data, replace_secrets
+from dbt_coves.utils import api_inventory, dbt_projects, profiling
+from dbt_coves.utils.hashing import canonical_hash, file_hash
+from dbt_coves.utils.mp_context import get_mp_context
+from dbt_coves.utils.python_emitter import emit_python
+from dbt_coves.utils.secrets import (
+    index_secrets,
+    load_secret_manager_data,
+    replace_secrets,
+)
 from dbt_coves.utils.tracking import trackable
 from dbt_coves.utils.yaml import deep_merge
 
 console = Console()
 
+DAG_CACHE_FILENAME = ".dag_cache.json"
+PROFILE_REPORT_FILENAME = "airflow_dags_profile.json"
+# Settings that don't change generated DAGs
+NON_OUTPUT_SETTINGS = (
+    "jobs",
+    "force",
+    "inventory_snapshot",
+    "profiling",
+    "profiling_report",
+    "profiling_cprofile",
+)
+
 AIRFLOW_K8S_CONFIG_TEMPLATE = textwrap.dedent(
     """{{
         "pod_override": k8s.V1Pod(
@@ -39,6 +63,40 @@ class GenerateAirflowDagsException(Exception):
     pass
 
 
+# Task instance used by `--jobs` worker processes, built once per worker
+_worker_task = None
+
+
+def _init_worker(run_state):
+    global _worker_task
+    _worker_task = GenerateAirflowDagsTask.from_run_state(run_state)
+    api_inventory.set_registry(_worker_task.inventory_registry)
+    dbt_projects.set_registry(_worker_task.dbt_project_registry)
+    if _worker_task.profiler_options is not None:
+        profiling.start_profiler(**_worker_task.profiler_options)
+
+
+def _generate_dag_in_worker(yml_filepath):
+    """
+    Generate a DAG in a worker process, capturing its console output so the parent
+    can print it in order. Returns (output, DAG cache entry, exception, profile),
+    the profile being the DAG's and its cProfile stats path, if profiling
+    """
+    output = io.StringIO()
+    cache_entry = exception = dag_profile = None
+    with redirect_stdout(output):
+        try:
+            with profiling.dag(yml_filepath):
+                cache_entry = _worker_task._generate_dag(Path(yml_filepath))
+        except Exception as e:
+            exception = e
+    profiler = profiling.get_profiler()
+    if profiler:
+        cprofile_path = profiler.cprofile_paths.pop() if profiler.cprofile else None
+        dag_profile = (profiler.dags.pop(yml_filepath), cprofile_path)
+    return output.getvalue(), cache_entry, exception, dag_profile
+
+
 class RawExpr(str):
     """A string marked via the `!py` YAML tag to be emitted as a raw, unquoted Python expression."""
 
@@ -48,6 +106,24 @@ class GenerateAirflowDagsTask(NonDbtBaseTask):
     Task that generate sources, models and model properties automatically
     """
 
+    # Attributes needed to generate a DAG, shared with `--jobs` worker processes
+    RUN_STATE_ATTRIBUTES = (
+        "settings",
+        "dags_path",
+        "ymls_path",
+        "yml_dags_path_env",
+        "validate_operators",
+        "secrets_path",
+        "secrets_manager",
+        "secret_nodes",
+        "secrets_index",
+        "inputs_fingerprint",
+        "dag_cache",
+        "inventory_registry",
+        "dbt_project_registry",
+        "profiler_options",
+    )
+
     @classmethod
     def register_parser(cls, sub_parsers, base_subparser):
         subparser = sub_parsers.add_parser(
@@ -107,6 +183,55 @@ class GenerateAirflowDagsTask(NonDbtBaseTask):
             "--secrets-tags", type=str, help="Secret credentials tags"
         )
         subparser.add_argument("--secrets-key", type=str, help="Secret credentials key")
+        subparser.add_argument(
+            "--jobs",
+            type=int,
+            help="Number of DAG files generated in parallel processes, default 1",
+        )
+        subparser.add_argument(
+            "--force",
+            help="Regenerate every DAG, even the ones whose inputs didn't change "
+            "since the last run",
+            action="store_true",
+            default=False,
+        )
+        subparser.add_argument(
+            "--inventory-snapshot",
+            type=str,
+            help="JSON file with Airbyte and Fivetran inventories used by generators. "
+            "Read if it exists instead of querying the APIs, and written after the run",
+        )
+        subparser.add_argument(
+            "--manifest",
+            type=str,
+            help="dbt manifest.json used by dbt generators to select sources, "
+            "instead of running dbt ls",
+        )
+        subparser.add_argument(
+            "--format-with-black",
+            help="Format DAG files with black and isort instead of the built-in "
+            "formatter, slower",
+            action="store_true",
+            default=False,
+        )
+        subparser.add_argument(
+            "--profiling",
+            help="Time DAG generation phases and count HTTP requests and "
+            "subprocesses, printing a summary and writing a JSON report",
+            action="store_true",
+            default=False,
+        )
+        subparser.add_argument(
+            "--profiling-report",
+            type=str,
+            help="Path of the --profiling JSON report, "
+            f"default .dbt_coves/{PROFILE_REPORT_FILENAME}",
+        )
+        subparser.add_argument(
+            "--profiling-cprofile",
+            type=str,
+            help="With --profiling, also write DAGs' cProfile stats to this path",
+        )
 
         cls.arg_parser = base_subparser
         subparser.set_defaults(cls=cls, which="airflow_dags")
@@ -114,6 +239,17 @@ class GenerateAirflowDagsTask(NonDbtBaseTask):
 
     def __init__(self, args, config):
         super().__init__(args, config)
+        self.settings = None
+
+    def run_state(self) -> Dict[str, Any]:
+        return {attr: getattr(self, attr) for attr in self.RUN_STATE_ATTRIBUTES}
+
+    @classmethod
+    def from_run_state(cls, run_state: Dict[str, Any]):
+        task = cls(args=None, config=None)
+        for attr, value in run_state.items():
+            setattr(task, attr, value)
+        return task
 
     # Custom constructor to convert to datetime.datetime
     def date_constructor(self, loader, node):
@@ -125,14 +261,19 @@ class GenerateAirflowDagsTask(NonDbtBaseTask):
         return RawExpr(loader.construct_scalar(node))
 
     def get_config_value(self, key):
-        return self.coves_config.integrated["generate"]["airflow_dags"][key]
+        if self.settings is None:
+            self.settings = self.coves_config.integrated["generate"]["airflow_dags"]
+        return self.settings[key]
 
     def _generate_dag(self, yml_filepath: Path):
+        """
+        Generate a DAG file from its YML, unless its inputs didn't change since the
+        last run. Returns the DAG's cache entry, None if it couldn't be generated
+        """
         yaml.FullLoader.add_constructor(
             "tag:yaml.org,2002:timestamp", self.date_constructor
         )
         yaml.FullLoader.add_constructor("!py", self.raw_expr_constructor)
-        console.print(f"Generating [b][i]{yml_filepath.stem}[/i][/b]")
         try:
             if self.dags_path:
                 if yml_filepath != self.ymls_path:
@@ -151,12 +292,36 @@ class GenerateAirflowDagsTask(NonDbtBaseTask):
                 )
             else:
                 dag_destination = yml_filepath.with_suffix(".py")
+            with profiling.phase("yaml"):
+                with open(yml_filepath, "rb") as yml_file:
+                    yml_content = yml_file.read()
+            input_hash = canonical_hash(
+                [self.inputs_fingerprint, yml_content.decode(), str(dag_destination)]
+            )
+            cached = self.dag_cache.get(str(yml_filepath), {})
+            # DAGs using Generators depend on external systems (APIs, dbt), so they
+            # are always built, but only re-formatted and written if their code changed
+            if (
+                cached.get("input_hash") == input_hash
+                and not cached.get("uses_generators")
+                and file_hash(dag_destination) == cached.get("output_hash")
+            ):
+                console.print(f"Skipping [b][i]{yml_filepath.stem}[/i][/b]: unchanged")
+                return cached
+
+            console.print(f"Generating [b][i]{yml_filepath.stem}[/i][/b]")
             dag_destination.parent.mkdir(parents=True, exist_ok=True)
-            self.build_dag_file(
+            with profiling.phase("yaml"):
+                yml_dag = yaml.full_load(yml_content)
+            cache_entry = self.build_dag_file(
                 destination_path=dag_destination,
                 dag_name=yml_filepath.stem,
-                yml_dag=yaml.full_load(open(yml_filepath)),
+                yml_dag=yml_dag,
+                cached=cached,
             )
+            if cache_entry:
+                cache_entry["input_hash"] = input_hash
+            return cache_entry
         except GenerateAirflowDagsException as e:
             console.print(f"[red]{e}[/red]")
 
@@ -176,13 +341,145 @@ class GenerateAirflowDagsTask(NonDbtBaseTask):
                 "Can't use 'secrets_path' and 'secrets_manager' simultaneously."
             )
         self.ymls_path = Path(ymls_path).resolve()
+        jobs = self.get_config_value("jobs") or 1
+        force = self.get_config_value("force")
+
+        self.profiler_options = None
+        if self.get_config_value("profiling"):
+            self.profiler_options = {
+                "cprofile": bool(self.get_config_value("profiling_cprofile"))
+            }
+            profiler = profiling.start_profiler(**self.profiler_options)
+            try:
+                return self._run(jobs, force)
+            finally:
+                profiling.stop_profiler()
+                self._write_profile(profiler)
+        return self._run(jobs, force)
+
+    def _run(self, jobs, force):
+        # Secrets are loaded and indexed once per run, and shared by every DAG
+        with profiling.phase("secrets"):
+            secret_files_data = []
+            if self.secrets_path:
+                for secret in sorted(glob(f"{self.secrets_path}/*.yml")):
+                    with open(secret) as secret_file:
+                        secret_files_data.append(yaml.full_load(secret_file))
+            secret_manager_data = None
+            if self.secrets_manager:
+                secret_manager_data = load_secret_manager_data(self)
+            self._index_secrets(secret_files_data, secret_manager_data)
+
+        # Everything besides the YML itself that a generated DAG depends on
+        self.inputs_fingerprint = canonical_hash(
+            {
+                "version": __version__,
+                "settings": {
+                    key: value
+                    for key, value in self.settings.items()
+                    if key not in NON_OUTPUT_SETTINGS
+                },
+                "secret_nodes": self.secret_nodes,
+                "secrets_index": self.secrets_index,
+            }
+        )
+        dag_cache_path = self._get_dag_cache_path()
+        self.dag_cache = {} if force else self._load_dag_cache(dag_cache_path)
+
         if self.ymls_path.is_dir():
-            for yml_filepath in glob(f"{self.ymls_path}/**/*.yml", recursive=True):
-                self._generate_dag(Path(yml_filepath))
+            yml_filepaths = sorted(glob(f"{self.ymls_path}/**/*.yml", recursive=True))
+        else:
+            yml_filepaths = [self.ymls_path]
+
+        # Generators crawl each Airbyte/Fivetran API once per run
+        self.inventory_registry = api_inventory.start_registry(
+            self.get_config_value("inventory_snapshot")
+        )
+        # and run dbt deps/compile once per dbt project
+        self.dbt_project_registry = dbt_projects.start_registry()
+        if jobs > 1 and len(yml_filepaths) > 1:
+            cache_entries = self._generate_dags_in_parallel(yml_filepaths, jobs)
         else:
-            self._generate_dag(self.ymls_path)
+            cache_entries = []
+            for yml_filepath in yml_filepaths:
+                with profiling.dag(str(yml_filepath)):
+                    cache_entries.append(self._generate_dag(Path(yml_filepath)))
+        self.inventory_registry.save_snapshot()
+        for yml_filepath, cache_entry in zip(yml_filepaths, cache_entries):
+            if cache_entry:
+                self.dag_cache[str(yml_filepath)] = cache_entry
+            else:
+                self.dag_cache.pop(str(yml_filepath), None)
+        self._save_dag_cache(dag_cache_path)
         return 0
 
+    def _write_profile(self, profiler: profiling.RunProfiler):
+        profiler.print_summary()
+        report_path = self.get_config_value("profiling_report") or (
+            self._get_dag_cache_path().parent / PROFILE_REPORT_FILENAME
+        )
+        profiler.write_report(Path(report_path))
+        cprofile_path = self.get_config_value("profiling_cprofile")
+        if cprofile_path:
+            profiler.write_cprofile(Path(cprofile_path))
+
+    def _get_dag_cache_path(self) -> Path:
+        """The DAG cache lives next to dbt-coves config file, in `.dbt_coves/`"""
+        config_path = self.coves_config._config_path
+        if config_path and Path(config_path).is_file():
+            return Path(config_path).parent / DAG_CACHE_FILENAME
+        return Path(".dbt_coves") / DAG_CACHE_FILENAME
+
+    def _load_dag_cache(self, dag_cache_path: Path) -> Dict[str, Any]:
+        try:
+            with open(dag_cache_path) as cache_file:
+                return json.load(cache_file).get("dags", {})
+        except (OSError, ValueError):
+            return {}
+
+    def _save_dag_cache(self, dag_cache_path: Path):
+        try:
+            dag_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(dag_cache_path, "w") as cache_file:
+                json.dump(
+                    {"dags": self.dag_cache}, cache_file, indent=4, sort_keys=True
+                )
+        except OSError as e:
+            console.print(f"[yellow]Couldn't save DAG cache {dag_cache_path}: {e}")
+
+    def _generate_dags_in_parallel(self, yml_filepaths, jobs):
+        """
+        Generate DAGs in a process pool. Output is printed in the same order
+        DAGs are generated sequentially.
+        """
+        with get_mp_context().Manager() as manager:
+            # Workers share API inventories, so each API is still crawled once
+            self.inventory_registry.share(manager)
+            self.dbt_project_registry.share(manager)
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(yml_filepaths)),
+                mp_context=get_mp_context(),
+                initializer=_init_worker,
+                initargs=(self.run_state(),),
+            ) as executor:
+                cache_entries = []
+                profiler = profiling.get_profiler()
+                for yml_filepath, (output, cache_entry, exception, dag_profile) in zip(
+                    yml_filepaths,
+                    executor.map(
+                        _generate_dag_in_worker, [str(path) for path in yml_filepaths]
+                    ),
+                ):
+                    print(output, end="")
+                    if profiler and dag_profile:
+                        profiler.add_dag(str(yml_filepath), *dag_profile)
+                    if exception:
+                        raise exception
+                    cache_entries.append(cache_entry)
+            self.inventory_registry.unshare()
+            self.dbt_project_registry.unshare()
+        return cache_entries
+
     def dag_args_to_string(self, yaml, indent=2):
         """
         Converts a dictionary to a string of arguments for the DAG constructor.
@@ -242,14 +539,23 @@ class GenerateAirflowDagsTask(NonDbtBaseTask):
         return callback_output
 
     def build_dag_file(
-        self, destination_path: Path, dag_name: str, yml_dag: Dict[str, Any]
+        self,
+        destination_path: Path,
+        dag_name: str,
+        yml_dag: Dict[str, Any],
+        cached: Optional[Dict[str, Any]] = None,
     ):
         """
         Generate DAG Python file based on YML configuration
+        If the resulting code matches the `cached` one, the existing file is kept
+        Returns the DAG's cache entry, None if the DAG is invalid
         """
+        cached = cached or {}
         self.generated_groups = {}
         self.collected_dependencies = []
-        yml_dag = self._discover_secrets(yml_dag)
+        self.uses_generators = False
+        with profiling.phase("secrets"):
+            yml_dag = self._discover_secrets(yml_dag)
         try:
             nodes = yml_dag.pop("nodes")
         except KeyError:
@@ -287,46 +593,80 @@ class GenerateAirflowDagsTask(NonDbtBaseTask):
             )
         self.dag_output["dag"].append(f"dag = {dag_name}()\n")
 
-        with open(destination_path, "w") as f:
-            final_output = (
-                "".join(self.dag_output["docstring"])
-                + "".join(set(self.dag_output["imports"]))
-                + "".join(self.dag_output["globals"])
-                + "".join(self.dag_output["dag"])
-            )
-            try:
-                black_formatted = format_str(final_output, mode=FileMode())
-                isort_formatted = isort.code(black_formatted)
-                f.write(isort_formatted)
-            except Exception as exc:
-                f.write(final_output)
-                console.print(
-                    f"DAG {dag_name} resulted in an invalid DAG, skipping. Error: {exc}"
-                )
+        final_output = (
+            "".join(self.dag_output["docstring"])
+            + "".join(dict.fromkeys(self.dag_output["imports"]))
+            + "".join(self.dag_output["globals"])
+            + "".join(self.dag_output["dag"])
+        )
+        cache_entry = {
+            # The formatter used is part of the source, so switching it rewrites files
+            "source_hash": canonical_hash(
+                [__version__, self.get_config_value("format_with_black"), final_output]
+            ),
+            "uses_generators": self.uses_generators,
+        }
+        if cached.get("source_hash") == cache_entry["source_hash"] and (
+            file_hash(destination_path) == cached.get("output_hash")
+        ):
+            console.print(f"DAG {dag_name} didn't change")
+            cache_entry["output_hash"] = cached["output_hash"]
+            return cache_entry
 
-    def _merge_secret_nodes(self, secret_nodes, yml_dag) -> Dict[str, Any]:
-        if isinstance(secret_nodes, dict):
-            for node_name, node_config in secret_nodes.get("nodes", {}).items():
-                yml_node = yml_dag.get("nodes", {}).get(node_name)
-                if yml_node:
-                    yml_dag["nodes"][node_name] = deep_merge(node_config, yml_node)
-        elif isinstance(secret_nodes, list):  # Datacoves secrets
-            replace_secrets(secret_nodes, yml_dag)
-        return yml_dag
+        try:
+            with profiling.phase("format"):
+                dag_code = emit_python(final_output)
+                if self.get_config_value("format_with_black"):
+                    dag_code = self._format_with_black(dag_code)
+        except Exception as exc:
+            dag_code = None
+            console.print(
+                f"DAG {dag_name} resulted in an invalid DAG, skipping. Error: {exc}"
+            )
+        with profiling.phase("write"):
+            with open(destination_path, "w") as f:
+                f.write(final_output if dag_code is None else dag_code)
+            if dag_code is None:
+                return None
+            cache_entry["output_hash"] = file_hash(destination_path)
+        return cache_entry
+
+    def _format_with_black(self, code: str) -> str:
+        # black and isort are slow to import, only load them when requested
+        import isort
+        from black import FileMode, format_str
+
+        return isort.code(format_str(code, mode=FileMode()))
+
+    def _index_secrets(self, secret_files_data, secret_manager_data):
+        """
+        Index secrets by node name (secret files' `nodes -> node_name -> config`)
+        and by slug (Datacoves secrets, referenced with `{{ secret('slug') }}`)
+        """
+        self.secret_nodes = {}
+        self.secrets_index = {}
+        secrets_data = list(secret_files_data)
+        if isinstance(secret_manager_data, dict):
+            secrets_data.append(secret_manager_data)
+        elif isinstance(secret_manager_data, list):  # Datacoves secrets
+            self.secrets_index = index_secrets(secret_manager_data)
+        for secret_data in secrets_data:
+            if isinstance(secret_data, dict):
+                for node_name, node_config in secret_data.get("nodes", {}).items():
+                    self.secret_nodes.setdefault(node_name, []).append(node_config)
 
     def _discover_secrets(self, yml_dag: Dict[str, Any]):
         """
-        Load secrets locally/remotely, and merge their 'nodes' into YML file ones
+        Merge indexed secrets 'nodes' into YML file ones, and replace templated secrets
         """
-        if self.secrets_path:
-            for secret in glob(f"{self.secrets_path}/*.yml"):
-                secret_data = yaml.full_load(open(secret))
-                yml_dag = self._merge_secret_nodes(secret_data, yml_dag)
+        yml_nodes = yml_dag.get("nodes", {})
+        for node_name in yml_nodes.keys() & self.secret_nodes.keys():
+            for node_config in self.secret_nodes[node_name]:
+                if yml_nodes[node_name]:
+                    yml_nodes[node_name] = deep_merge(node_config, yml_nodes[node_name])
 
-        if self.secrets_manager:
-            self.secret_data = load_secret_manager_data(self)
-            if self.secret_data:
-                yml_dag = self._merge_secret_nodes(self.secret_data, yml_dag)
+        if self.secrets_index:
+            replace_secrets(self.secrets_index, yml_dag)
 
         return yml_dag
 
@@ -366,7 +706,7 @@ class GenerateAirflowDagsTask(NonDbtBaseTask):
         generators_params = self.get_config_value("generators_params")
         coves_config_generators_params = generators_params.get(generator, {})
         if self.secrets_manager:
-            replace_secrets(self.secret_data, coves_config_generators_params)
+            replace_secrets(self.secrets_index, coves_config_generators_params)
         return deep_merge(tg_conf, coves_config_generators_params)
 
     def generate_task_group(self, tg_name: str, tg_conf: Dict[str, Any]):
@@ -387,12 +727,17 @@ class GenerateAirflowDagsTask(NonDbtBaseTask):
         tasks = tg_conf.pop("tasks", {})
 
         if generator:
+            self.uses_generators = True
             generator_class = self.get_generator_class(generator)
             tg_conf = self._merge_generator_configs(tg_conf, generator)
-            generator_instance = generator_class(**tg_conf)
-            for operator in generator_instance.imports:
-                self._add_operator_import_to_output(operator)
-            tasks = generator_instance.generate_tasks()
+            manifest = self.get_config_value("manifest")
+            if manifest and "manifest_path" in signature(generator_class).parameters:
+                tg_conf.setdefault("manifest_path", manifest)
+            with profiling.phase("generators"):
+                generator_instance = generator_class(**tg_conf)
+                for operator in generator_instance.imports:
+                    self._add_operator_import_to_output(operator)
+                tasks = generator_instance.generate_tasks()
 
             for task_call in tasks.values():
                 if type(task_call) is str:
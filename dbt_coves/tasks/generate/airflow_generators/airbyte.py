@@ -7,7 +7,7 @@ from dbt_coves.tasks.generate.airflow_generators.base import (
     BaseDbtCovesTaskGenerator,
     BaseDbtGenerator,
 )
-from dbt_coves.utils.api_caller import AirbyteApiCaller
+from dbt_coves.utils.api_inventory import get_registry
 
 
 class AirbyteGeneratorException(Exception):
@@ -32,20 +32,32 @@ class AirbyteGenerator(BaseDbtCovesTaskGenerator):
         self.imports = [
             "airflow.providers.airbyte.operators.airbyte.AirbyteTriggerSyncOperator"
         ]
-        self.api_caller = AirbyteApiCaller(
-            self.host, api_port=self.port or None, api_key=self.api_key or None
+        # Shared by every generator of the run using the same Airbyte
+        self.api_caller = get_registry().airbyte(
+            self.host, port=self.port or None, api_key=self.api_key or None
         )
         self.airbyte_connections = self.api_caller.connections_list
+        self.connections_by_id = {
+            connection["connectionId"]: connection
+            for connection in self.airbyte_connections
+        }
+        self.airbyte_sources = {
+            source["sourceId"]: source for source in self.api_caller.sources_list
+        }
+        self.airbyte_destinations = {
+            destination["destinationId"]: destination
+            for destination in self.api_caller.destinations_list
+        }
         self.connections_should_exist = False
+        # (database, schema, table) -> connection ids, built on first lookup
+        self.tables_index = None
 
     def validate_ids_in_airbyte(self, connection_ids):
         """
         Ensure connection_ids exist in Airbyte API
         """
         for conn in connection_ids:
-            if conn not in (
-                connection["connectionId"] for connection in self.airbyte_connections
-            ):
+            if conn not in self.connections_by_id:
                 raise AirbyteGeneratorException(
                     f"Airbyte error: there is no Airbyte connection for id [red]{conn}[/red]"
                 )
@@ -70,18 +82,16 @@ class AirbyteGenerator(BaseDbtCovesTaskGenerator):
 
     def _get_airbyte_destination(self, id):
         """Given a destination id, returns the destination payload"""
-        for destination in self.api_caller.destinations_list:
-            if destination["destinationId"] == id:
-                return destination
+        if id in self.airbyte_destinations:
+            return self.airbyte_destinations[id]
         raise AirbyteGeneratorException(
             f"Airbyte error: there are no destinations for id {id}"
         )
 
     def _get_airbyte_source(self, id):
         """Get the complete Source object from it's ID"""
-        for source in self.api_caller.sources_list:
-            if source["sourceId"] == id:
-                return source
+        if id in self.airbyte_sources:
+            return self.airbyte_sources[id]
         raise AirbyteGeneratorException(
             f"Airbyte extract error: there is no Airbyte Source for id [red]{id}[/red]"
         )
@@ -109,18 +119,18 @@ class AirbyteGenerator(BaseDbtCovesTaskGenerator):
             if namespace_definition in custom_format_values:
                 return conn["namespaceFormat"].lower()
 
-    def get_pipeline_connection_ids(self, db: str, schema: str, table: str) -> str:
+    def _build_tables_index(self):
         """
-        Given a table name, schema and db, returns the corresponding Airbyte Connection ID
+        Index active connections by the (database, schema, table) their streams land in.
+        Connections whose schema can't be told are indexed with a None schema,
+        matching any schema
         """
-        airbyte_tables = []
-        connection_ids = []
-        for conn in list(
-            filter(
-                lambda conn: conn.get("status") != "deprecated",
-                self.airbyte_connections,
-            )
-        ):
+        self.tables_index = {}
+        self.tables_index_errors = {}
+        self.airbyte_tables = []
+        for position, conn in enumerate(self.airbyte_connections):
+            if conn.get("status") == "deprecated":
+                continue
             # Handle both old syncCatalog and new configurations API formats
             catalog = conn.get("syncCatalog") or conn.get("configurations", {})
             streams = catalog.get("streams", [])
@@ -130,47 +140,62 @@ class AirbyteGenerator(BaseDbtCovesTaskGenerator):
                 airbyte_table = (
                     stream.get("stream", {}).get("name") or stream.get("name", "")
                 ).lower()
-                airbyte_tables.append(airbyte_table)
-                if airbyte_table == table.replace("_airbyte_raw_", ""):
+                self.airbyte_tables.append(airbyte_table)
+                # Errors are only raised if a dbt source needs this (database and) table
+                db = None
+                try:
                     destination = self._get_airbyte_destination(conn["destinationId"])
                     destination_config = destination.get(
                         "configuration", destination.get("connectionConfiguration", {})
                     )
+                    db = destination_config.get(
+                        "database", destination_config.get("project-id", "")
+                    ).lower()
+                    airbyte_schema = self._get_connection_schema(
+                        conn, destination_config
+                    )
+                except AirbyteGeneratorException as e:
+                    self.tables_index_errors.setdefault((db, airbyte_table), e)
+                    continue
+                self.tables_index.setdefault(
+                    (db, airbyte_schema or None, airbyte_table), {}
+                ).setdefault(conn["connectionId"], position)
 
-                    # match database
-                    if (
-                        db
-                        == destination_config.get(
-                            "database", destination_config.get("project-id", "")
-                        ).lower()
-                    ):
-                        airbyte_schema = self._get_connection_schema(
-                            conn, destination_config
-                        )
-                        # and finally, match schema, if defined
-                        if (
-                            airbyte_schema == schema or not airbyte_schema
-                        ) and conn.get("connectionId") not in connection_ids:
-                            connection_ids.append(conn["connectionId"])
+    def get_pipeline_connection_ids(self, db: str, schema: str, table: str) -> str:
+        """
+        Given a table name, schema and db, returns the corresponding Airbyte Connection ID
+        """
+        if self.tables_index is None:
+            self._build_tables_index()
+        table = table.replace("_airbyte_raw_", "")
+        for error_key in ((None, table), (db, table)):
+            if error_key in self.tables_index_errors:
+                raise self.tables_index_errors[error_key]
+        connections = {
+            **self.tables_index.get((db, None, table), {}),
+            **self.tables_index.get((db, schema, table), {}),
+        }
+        # In the order connections are listed by Airbyte
+        connection_ids = sorted(connections, key=connections.get)
         if connection_ids:
             return connection_ids
         if self.connections_should_exist:
             raise AirbyteGeneratorException(
                 f"Airbyte error: there are no connections for table {db}.{schema}.{table}. "
-                f"Tables checked: {', '.join(airbyte_tables)}"
+                f"Tables checked: {', '.join(self.airbyte_tables)}"
             )
 
     def _create_airbyte_connection_name_for_id(self, conn_id):
         """
         Given a ConnectionID, create it's name using both Source and Destination ones
         """
-        for conn in self.airbyte_connections:
-            if conn["connectionId"] == conn_id:
-                source_name = self._get_airbyte_source(conn["sourceId"])["name"]
-                destination_name = self._get_airbyte_destination(conn["destinationId"])[
-                    "name"
-                ]
-                return slugify(f"{source_name} → {destination_name}", separator="_")
+        conn = self.connections_by_id.get(conn_id)
+        if conn:
+            source_name = self._get_airbyte_source(conn["sourceId"])["name"]
+            destination_name = self._get_airbyte_destination(conn["destinationId"])[
+                "name"
+            ]
+            return slugify(f"{source_name} → {destination_name}", separator="_")
 
         raise AirbyteGeneratorException(
             f"Airbyte error: there are missing names for connection ID {conn_id}"
@@ -189,6 +214,7 @@ class AirbyteDbtGenerator(AirbyteGenerator, BaseDbtGenerator):
         dbt_list_args: str = "",
         run_dbt_deps: bool = False,
         airbyte_conn_id: str = "",
+        manifest_path: str = "",
     ):
         AirbyteGenerator.__init__(
             self, host=host, port=port, api_key=api_key, airbyte_conn_id=airbyte_conn_id
@@ -200,5 +226,6 @@ class AirbyteDbtGenerator(AirbyteGenerator, BaseDbtGenerator):
             run_dbt_compile,
             run_dbt_deps,
             dbt_list_args,
+            manifest_path,
         )
         self.connection_ids = self.discover_dbt_connections()
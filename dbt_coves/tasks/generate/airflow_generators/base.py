@@ -1,13 +1,21 @@
-import json
 import os
 import shlex
+import shutil
 import subprocess
+import tempfile
 from os import environ
 from pathlib import Path
-from typing import Any, Dict, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from rich.console import Console
 
+from dbt_coves.utils import dbt_projects, profiling, project_copy
+from dbt_coves.utils.dbt_manifest import (
+    ManifestSelector,
+    UnsupportedSelectionException,
+    load_manifest,
+)
+
 console = Console()
 
 
@@ -27,16 +35,19 @@ class BaseDbtGenerator:
         run_dbt_compile: bool = False,
         run_dbt_deps: bool = False,
         dbt_list_args: str = "",
+        manifest_path: str = "",
     ) -> None:
         self.dbt_project_path = dbt_project_path
         self.virtualenv_path = virtualenv_path
         self.run_dbt_compile = run_dbt_compile
         self.run_dbt_deps = run_dbt_deps
         self.dbt_list_args = dbt_list_args
+        self.manifest_path = manifest_path
 
     def discover_dbt_connections(self) -> Set[str]:
         """
         Discover DBT source(s)' Airbyte/Fivetran connection IDs based on params
+        Sources are selected in the dbt manifest when there is one, without running dbt
         """
         if self.virtualenv_path:
             self.virtualenv_path = Path(
@@ -50,76 +61,138 @@ class BaseDbtGenerator:
                 Path(environ.get("DATACOVES__REPO_PATH", "/config/workspace"))
                 / self.dbt_project_path
             )
+
+        manifest_json = None
+        sources_list = None
+        manifest_path = self._get_manifest_path()
+        if manifest_path:
+            try:
+                with profiling.phase("dbt_manifest"):
+                    manifest_json = load_manifest(manifest_path)
+                    sources_list = ManifestSelector(manifest_json).select_sources(
+                        self.dbt_list_args
+                    )
+                console.print(f"Listing [i]dbt sources[/i] from {manifest_path}")
+            except UnsupportedSelectionException as e:
+                console.print(f"{e}, listing [i]dbt sources[/i] with dbt instead")
+        if sources_list is None:
+            manifest_json, sources_list = self._list_dbt_sources()
+
+        connections_ids = []
+        for source in sources_list:
+            # Transform the 'dbt source' into [db, schema, table]
+            source_table = manifest_json["sources"][source]["identifier"].lower()
+            if source_table in self.ignored_source_tables:
+                continue
+            source_db = manifest_json["sources"][source]["database"].lower()
+            source_schema = manifest_json["sources"][source]["schema"].lower()
+            connections_for_source = self.get_pipeline_connection_ids(
+                source_db, source_schema, source_table
+            )
+            if connections_for_source:
+                for connection in connections_for_source:
+                    if connection not in connections_ids:
+                        connections_ids.append(connection)
+
+        return connections_ids
+
+    def _get_manifest_path(self) -> Optional[Path]:
+        """
+        The `manifest_path` given, or the project's `target/manifest.json` unless
+        dbt deps or compile were requested. None if there's no manifest to use
+        """
+        if self.manifest_path:
+            manifest_path = Path(self.manifest_path)
+            if not manifest_path.is_file():
+                raise GeneratorException(f"dbt manifest {manifest_path} not found")
+            return manifest_path
+        if self.run_dbt_deps or self.run_dbt_compile:
+            return None
+        manifest_path = Path(self.dbt_project_path) / "target" / "manifest.json"
+        return manifest_path if manifest_path.is_file() else None
+
+    def _list_dbt_sources(self) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Run `dbt ls` (and dbt deps/compile, if requested) on the project
+        Returns the resulting manifest and the sources listed
+        """
         cwd = self.dbt_project_path
 
         deploy_path = None
         if self.is_readonly(self.dbt_project_path):
-            commit = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                capture_output=True,
-                text=True,
-                cwd=self.dbt_project_path,
-            ).stdout.strip("\n")
-            deploy_path = "/tmp/airbyte-generator-" + commit
-            # Move folders
-            subprocess.run(
-                ["cp", "-rf", self.dbt_project_path, deploy_path], check=True
-            )
-            cwd = deploy_path
+            # Reused by every generator (and run) for the same commit
+            cwd = project_copy.writable_copy(self.dbt_project_path)
+            if cwd is None:
+                deploy_path = tempfile.NamedTemporaryFile(
+                    prefix="airbyte-generator-"
+                ).name
+                cwd = project_copy.create_writable_copy(
+                    self.dbt_project_path, deploy_path
+                )
 
         try:
-            if self.run_dbt_deps:
-                if self.virtualenv_path:
-                    command = self.get_bash_command(self.virtualenv_path, "dbt deps")
-                else:
-                    command = ["dbt", "deps"]
-                console.print("Running [i]dbt deps[/i]")
-                subprocess.run(
-                    command,
-                    check=True,
-                    cwd=cwd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+            # dbt deps and compile run once per project for all the run's generators
+            steps = [
+                step
+                for step, requested in (
+                    ("deps", self.run_dbt_deps),
+                    ("compile", self.run_dbt_compile),
                 )
+                if requested
+            ]
+            dbt_projects.get_registry().prepare(
+                cwd,
+                self.virtualenv_path,
+                steps,
+                lambda step: self._run_dbt(f"dbt {step}", cwd),
+            )
+            manifest_file = Path(cwd) / "target" / "manifest.json"
 
+            sources_list = None
             if self.run_dbt_compile:
-                if self.virtualenv_path:
-                    command = self.get_bash_command(
-                        self.virtualenv_path, f"dbt compile {self.dbt_list_args}"
+                manifest_json = load_manifest(manifest_file)
+                try:
+                    sources_list = ManifestSelector(manifest_json).select_sources(
+                        self.dbt_list_args
                     )
-                else:
-                    command = ["dbt", "compile"] + self.dbt_list_args.split()
-                console.print("Running [i]dbt compile[/i]")
-                subprocess.run(
+                except UnsupportedSelectionException as e:
+                    console.print(f"{e}, listing [i]dbt sources[/i] with dbt instead")
+            if sources_list is None:
+                console.print("Listing [i]dbt sources[/i]")
+                stdout = self._run_dbt(
+                    f"dbt ls --resource-type source {self.dbt_list_args}", cwd
+                )
+                sources_list = []
+                if "No nodes selected" not in stdout:
+                    sources_list = [
+                        src.replace("source:", "source.")
+                        for src in stdout.split("\n")
+                        if (src and "source:" in src)
+                    ]
+                manifest_json = load_manifest(manifest_file)
+        finally:
+            if deploy_path:
+                shutil.rmtree(deploy_path, ignore_errors=True)
+
+        return manifest_json, sources_list
+
+    def _run_dbt(self, dbt_command: str, cwd) -> str:
+        """Run a dbt command on `cwd`, in the virtualenv if any. Returns its output"""
+        if self.virtualenv_path:
+            command = self.get_bash_command(self.virtualenv_path, dbt_command)
+        else:
+            command = shlex.split(dbt_command)
+        if not dbt_command.startswith("dbt ls"):
+            console.print(f"Running [i]{dbt_command}[/i]")
+        try:
+            with profiling.phase("dbt"):
+                process = subprocess.run(
                     command,
-                    check=True,
                     cwd=cwd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
+                    check=True,
                 )
-
-            if self.virtualenv_path:
-                command = self.get_bash_command(
-                    self.virtualenv_path,
-                    f"dbt ls --resource-type source {self.dbt_list_args}",
-                )
-            else:
-                command = [
-                    "dbt",
-                    "ls",
-                    "--resource-type",
-                    "source",
-                ] + self.dbt_list_args.split()
-                console.print("Listing [i]dbt sources[/i]")
-
-            process = subprocess.run(
-                command,
-                cwd=cwd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True,
-            )
-            stdout = process.stdout.decode()
         except subprocess.CalledProcessError as e:
             error_message = ""
             if e.stdout:
@@ -129,36 +202,7 @@ class BaseDbtGenerator:
             raise GeneratorException(
                 f"Exception occurred running {command}\n{error_message}"
             )
-
-        sources_list = []
-        if "No nodes selected" not in stdout:
-            sources_list = [
-                src.replace("source:", "source.")
-                for src in stdout.split("\n")
-                if (src and "source:" in src)
-            ]
-        manifest_json = json.load(open(Path(cwd) / "target" / "manifest.json"))
-
-        if deploy_path:
-            subprocess.run(["rm", "-rf", deploy_path], check=True)
-
-        connections_ids = []
-        for source in sources_list:
-            # Transform the 'dbt source' into [db, schema, table]
-            source_table = manifest_json["sources"][source]["identifier"].lower()
-            if source_table in self.ignored_source_tables:
-                continue
-            source_db = manifest_json["sources"][source]["database"].lower()
-            source_schema = manifest_json["sources"][source]["schema"].lower()
-            connections_for_source = self.get_pipeline_connection_ids(
-                source_db, source_schema, source_table
-            )
-            if connections_for_source:
-                for connection in connections_for_source:
-                    if connection not in connections_ids:
-                        connections_ids.append(connection)
-
-        return connections_ids
+        return process.stdout.decode()
 
 
 class BaseDbtCovesTaskGenerator:
@@ -3,7 +3,7 @@ from typing import Any, Dict, List
 
 from slugify import slugify
 
-from dbt_coves.utils.api_caller import FivetranApiCaller
+from dbt_coves.utils.api_inventory import get_registry
 
 from .base import BaseDbtCovesTaskGenerator, BaseDbtGenerator
 
@@ -28,24 +28,30 @@ class FivetranGenerator(BaseDbtCovesTaskGenerator):
         self.connection_ids = connection_ids
         self.wait_for_completion = wait_for_completion
         self.ignored_source_tables = ["fivetran_audit", "fivetran_audit_warning"]
-        self.fivetran_api = FivetranApiCaller(api_key, api_secret)
+        # Shared by every generator of the run using the same Fivetran account
+        self.fivetran_api = get_registry().fivetran(api_key, api_secret)
         self.fivetran_data = self.fivetran_api.fivetran_data
         self.fivetran_groups = self.fivetran_api.fivetran_groups
         self.connectors_should_exist = False
         self.fivetran_conn_id = fivetran_conn_id
+        self.connectors_by_id = {
+            connector_data["details"]["id"]: connector_data["details"]
+            for dest_data in self.fivetran_data.values()
+            for connector_data in dest_data.get("connectors", {}).values()
+        }
+        # (database, schema, table) -> connector ids, built on first lookup
+        self.tables_index = None
 
     def _get_fivetran_connector_name_for_id(self, connector_id):
         """
         Create a name for Fivetran tasks based on a Connector ID
         """
-        for dest_data in self.fivetran_data.values():
-            for connector_data in dest_data.get("connectors", {}).values():
-                details = connector_data["details"]
-                if details["id"] == connector_id:
-                    return slugify(
-                        f"{self.fivetran_groups[details['group_id']]['name']}.{details['schema']}",
-                        separator="_",
-                    )
+        details = self.connectors_by_id.get(connector_id)
+        if details:
+            return slugify(
+                f"{self.fivetran_groups[details['group_id']]['name']}.{details['schema']}",
+                separator="_",
+            )
 
     def generate_tasks(self) -> Dict[str, Any]:
         """
@@ -88,25 +94,29 @@ class FivetranGenerator(BaseDbtCovesTaskGenerator):
 
         return tasks
 
-    def _dbt_database_in_destination(self, fivetran_destination, dbt_database):
-        return (
-            dbt_database
-            == fivetran_destination.get("details")
-            .get("config", {})
-            .get("database", "")
-            .lower()
-        )
-
-    def _dbt_schema_table_in_connector(self, connector_schemas, dbt_schema, dbt_table):
-        for schema_details in connector_schemas.values():
-            if schema_details.get("name_in_destination", "").lower() == dbt_schema:
-                for table_details in schema_details.get("tables", {}).values():
-                    if (
-                        table_details.get("name_in_destination", "").lower()
-                        == dbt_table
-                    ):
-                        return True
-        return False
+    def _build_tables_index(self):
+        """
+        Index connectors by the (database, schema, table) their tables land in
+        """
+        self.tables_index = {}
+        for dest_dict in self.fivetran_data.values():
+            # destination dict can be empty if Fivetran Destination is missing
+            # configuration or not yet tested
+            if not (dest_dict and dest_dict.get("details")):
+                continue
+            database = (
+                dest_dict["details"].get("config", {}).get("database", "").lower()
+            )
+            for connector_id, connector_data in dest_dict.get("connectors", {}).items():
+                for schema_details in connector_data.get("schemas", {}).values():
+                    schema = schema_details.get("name_in_destination", "").lower()
+                    for table_details in schema_details.get("tables", {}).values():
+                        table = table_details.get("name_in_destination", "").lower()
+                        connector_ids = self.tables_index.setdefault(
+                            (database, schema, table), []
+                        )
+                        if connector_id not in connector_ids:
+                            connector_ids.append(connector_id)
 
     def get_pipeline_connection_ids(
         self, source_db: str, source_schema: str, source_table: str
@@ -114,33 +124,15 @@ class FivetranGenerator(BaseDbtCovesTaskGenerator):
         """
         Given a table name, schema and db, returns the corresponding Fivetran Connection ID
         """
-        fivetran_schema_db_naming = f"{source_schema}.{source_table}".lower()
-        connector_ids = []
-        for dest_dict in self.fivetran_data.values():
-            # destination dict can be empty if Fivetran Destination is missing
-            # configuration or not yet tested
-            if dest_dict and dest_dict.get("details"):
-                # match dbt source_db to Fivetran destination database
-                if self._dbt_database_in_destination(dest_dict, source_db.lower()):
-                    # find the appropiate Connector from destination connectors)
-                    for connector_id, connector_data in dest_dict.get(
-                        "connectors", {}
-                    ).items():
-                        for schema_id, schema_data in connector_data.get(
-                            "schemas", {}
-                        ).items():
-                            if (
-                                self._dbt_schema_table_in_connector(
-                                    {schema_id: schema_data},
-                                    source_schema.lower(),
-                                    source_table.lower(),
-                                )
-                                and connector_id not in connector_ids
-                            ):
-                                connector_ids.append(connector_id)
+        if self.tables_index is None:
+            self._build_tables_index()
+        connector_ids = self.tables_index.get(
+            (source_db.lower(), source_schema.lower(), source_table.lower())
+        )
         if connector_ids:
-            return connector_ids
+            return list(connector_ids)
         if self.connectors_should_exist:
+            fivetran_schema_db_naming = f"{source_schema}.{source_table}".lower()
             raise FivetranGeneratorException(
                 f"There is no Fivetran Connector for {source_db}.{fivetran_schema_db_naming}"
             )
@@ -159,6 +151,7 @@ class FivetranDbtGenerator(FivetranGenerator, BaseDbtGenerator):
         run_dbt_deps: bool = False,
         fivetran_conn_id: str = "",
         connection_ids: List[str] = [],
+        manifest_path: str = "",
     ) -> Dict[str, Any]:
         FivetranGenerator.__init__(
             self,
@@ -175,5 +168,6 @@ class FivetranDbtGenerator(FivetranGenerator, BaseDbtGenerator):
             run_dbt_compile,
             run_dbt_deps,
             dbt_list_args,
+            manifest_path,
         )
         self.connection_ids = self.discover_dbt_connections()
@@ -1,10 +1,14 @@
 import json
 import os
 import pathlib
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from copy import copy
 
 import questionary
 from rich.console import Console
+from rich.table import Table
 from slugify import slugify
 
 from dbt_coves.utils.api_caller import AirbyteApiCaller, AirbyteApiCallerException
@@ -15,6 +19,8 @@ from .base import BaseLoadTask
 
 console = Console()
 
+DEFAULT_MAX_WORKERS = 8
+
 
 class AirbyteLoaderException(Exception):
     pass
@@ -77,22 +83,56 @@ class LoadAirbyteTask(BaseLoadTask):
             "--secrets-tags", type=str, help="Secret credentials tags"
         )
         subparser.add_argument("--secrets-key", type=str, help="Secret credentials key")
+        subparser.add_argument(
+            "--max-workers",
+            type=int,
+            help="Maximum number of sources, destinations and connections "
+            f"loaded concurrently, default {DEFAULT_MAX_WORKERS}",
+        )
+        subparser.add_argument(
+            "--plan",
+            action="store_true",
+            default=False,
+            help="Only compare the extracted files against Airbyte and print the "
+            "sources, destinations and connections that would be created, "
+            "updated or deleted",
+        )
+        subparser.add_argument(
+            "--plan-file",
+            type=str,
+            help="Along with --plan, path of the JSON file where the plan is saved",
+        )
+        subparser.add_argument(
+            "--apply-plan",
+            type=str,
+            help="Path of a plan saved with --plan --plan-file. "
+            "Only the changes listed in it are loaded",
+        )
+        subparser.add_argument(
+            "--allow-deletes",
+            action="store_true",
+            default=False,
+            help="Along with --apply-plan, also delete the objects the plan removes",
+        )
         subparser.set_defaults(cls=cls, which="airbyte")
         return subparser
 
     @trackable
     def run(self):
-        self.loading_results = {
-            "sources": {"updated": [], "created": []},
-            "destinations": {"updated": [], "created": []},
-            "connections": {"updated": [], "created": []},
-        }
+        self.loading_results = []
+        self.results_lock = threading.Lock()
+        self.prompt_lock = threading.Lock()
         self.load_destination = self.get_config_value("path")
         self.airbyte_host = self.get_config_value("host")
         self.airbyte_port = self.get_config_value("port")
         self.airbyte_api_key = self.get_config_value("api_key")
         self.secrets_path = self.get_config_value("secrets_path")
         self.secrets_manager = self.get_config_value("secrets_manager")
+        self.max_workers = self.get_config_value("max_workers") or DEFAULT_MAX_WORKERS
+        self.plan_only = self.get_config_value("plan")
+        plan_file = self.get_config_value("plan_file")
+        apply_plan = self.get_config_value("apply_plan")
+        self.allow_deletes = self.get_config_value("allow_deletes")
 
         if not (self.airbyte_host and self.load_destination):
             raise AirbyteLoaderException(
@@ -103,8 +143,19 @@ class LoadAirbyteTask(BaseLoadTask):
             raise AirbyteLoaderException(
                 "Can't use 'secrets_path' and 'secrets_manager' simultaneously."
             )
+        if self.plan_only and apply_plan:
+            raise AirbyteLoaderException(
+                "Can't use 'plan' and 'apply_plan' simultaneously."
+            )
+        if plan_file and not self.plan_only:
+            raise AirbyteLoaderException("'plan_file' can only be used with 'plan'.")
+        if self.allow_deletes and not apply_plan:
+            raise AirbyteLoaderException(
+                "'allow_deletes' can only be used with 'apply_plan'."
+            )
 
-        if self.secrets_manager:
+        # Planning never writes, so secrets aren't needed
+        if self.secrets_manager and not self.plan_only:
             self.secrets_data = load_secret_manager_data(self)
 
         if self.secrets_path:
@@ -139,24 +190,359 @@ class LoadAirbyteTask(BaseLoadTask):
         extracted_connections = self.retrieve_all_jsons_from_path(
             self.connections_load_destination
         )
-        for source in extracted_sources:
-            self._create_or_update_source(source)
-        for destination in extracted_destinations:
-            self._create_or_update_destination(destination)
-        for connection in extracted_connections:
-            self._create_or_update_connection(connection)
+
+        if self.plan_only:
+            actions = self._plan_changes(
+                extracted_sources, extracted_destinations, extracted_connections
+            )
+            self.print_plan(actions, "Airbyte")
+            if plan_file:
+                self.save_plan(plan_file, actions, "Airbyte")
+            return 0
+
+        if apply_plan:
+            actions = self.load_plan(apply_plan, "Airbyte")
+            self._apply_planned_deletes(actions)
+            (
+                extracted_sources,
+                extracted_destinations,
+                extracted_connections,
+            ) = self._filter_planned_objects(
+                actions,
+                extracted_sources,
+                extracted_destinations,
+                extracted_connections,
+            )
+
+        self._load_concurrently(
+            extracted_sources, extracted_destinations, extracted_connections
+        )
 
         self._print_load_results()
+        failed = [
+            result["name"]
+            for result in self.loading_results
+            if result["action"] == "failed"
+        ]
+        if failed:
+            raise AirbyteLoaderException(
+                f"{len(failed)} object(s) could not be loaded: {', '.join(failed)}"
+            )
         return 0
 
-    def _print_load_results(self):
-        console.print("[green][b]Load successful :heavy_check_mark:[/b][/green]")
-        for obj_type, result_dict in self.loading_results.items():
-            for action, results in result_dict.items():
-                if len(results) > 0:
-                    console.print(
-                        f"[green]{obj_type.capitalize()} {action}:[/green] {', '.join(results)}"
+    def _plan_changes(self, sources, destinations, connections):
+        """
+        Compare extracted objects against the Airbyte inventory fetched on startup,
+        without any further API call.
+        """
+        actions = []
+        for object_type, extracted_objects, remote_objects, id_field, equivalent in (
+            (
+                "sources",
+                sources,
+                self.airbyte_api.sources_list,
+                "sourceId",
+                self._sources_are_equivalent,
+            ),
+            (
+                "destinations",
+                destinations,
+                self.airbyte_api.destinations_list,
+                "destinationId",
+                self._destinations_are_equivalent,
+            ),
+        ):
+            remote_by_name = {remote["name"]: remote for remote in remote_objects}
+            for exported_data in extracted_objects:
+                current = remote_by_name.get(exported_data["name"])
+                if not current:
+                    actions.append(
+                        self.plan_action(object_type, exported_data["name"], "create")
+                    )
+                elif not equivalent(exported_data, current):
+                    actions.append(
+                        self.plan_action(
+                            object_type,
+                            exported_data["name"],
+                            "update",
+                            current[id_field],
+                        )
+                    )
+            extracted_names = {exported["name"] for exported in extracted_objects}
+            for name, current in remote_by_name.items():
+                if name not in extracted_names:
+                    actions.append(
+                        self.plan_action(object_type, name, "delete", current[id_field])
+                    )
+
+        planned_sources = {a["name"] for a in actions if a["object_type"] == "sources"}
+        planned_destinations = {
+            a["name"] for a in actions if a["object_type"] == "destinations"
+        }
+        extracted_endpoints = set()
+        for exported_connection in connections:
+            source_name = exported_connection["sourceName"]
+            destination_name = exported_connection["destinationName"]
+            connection_name = f"{source_name}-{destination_name}"
+            extracted_endpoints.add((source_name, destination_name))
+            source_id = self._get_source_id_by_name(source_name)
+            destination_id = self._get_destination_id_by_name(destination_name)
+            if not (source_id or source_name in planned_sources) or not (
+                destination_id or destination_name in planned_destinations
+            ):
+                console.print(
+                    f"No existent source-destination pair found for connection "
+                    f"({source_name} → {destination_name})"
+                )
+                continue
+            current = self._get_connection_by_endpoints(source_id, destination_id)
+            exported_copy = copy(exported_connection)
+            exported_copy.pop("sourceCatalogId", None)
+            if not current:
+                actions.append(
+                    self.plan_action("connections", connection_name, "create")
+                )
+            elif not self._connection_already_updated(exported_copy, current):
+                actions.append(
+                    self.plan_action(
+                        "connections",
+                        connection_name,
+                        "update",
+                        current["connectionId"],
+                        "re-created",
+                    )
+                )
+        source_names = {s["sourceId"]: s["name"] for s in self.airbyte_api.sources_list}
+        destination_names = {
+            d["destinationId"]: d["name"] for d in self.airbyte_api.destinations_list
+        }
+        for current in self.airbyte_api.connections_list:
+            endpoints = (
+                source_names.get(current["sourceId"]),
+                destination_names.get(current["destinationId"]),
+            )
+            if endpoints not in extracted_endpoints:
+                actions.append(
+                    self.plan_action(
+                        "connections",
+                        current.get("name") or "-".join(filter(None, endpoints)),
+                        "delete",
+                        current["connectionId"],
                     )
+                )
+        return actions
+
+    def _filter_planned_objects(self, actions, sources, destinations, connections):
+        """Keep only the extracted objects a plan creates or updates"""
+        planned = {
+            (action["object_type"], action["name"])
+            for action in actions
+            if action["action"] in ("create", "update")
+        }
+        return (
+            [s for s in sources if ("sources", s["name"]) in planned],
+            [d for d in destinations if ("destinations", d["name"]) in planned],
+            [
+                c
+                for c in connections
+                if ("connections", f"{c['sourceName']}-{c['destinationName']}")
+                in planned
+            ],
+        )
+
+    def _apply_planned_deletes(self, actions):
+        """
+        Delete the objects a plan removes, connections first, if deletes are allowed.
+        Objects are looked up again by name, as IDs may have changed since planning.
+        """
+        deletes = {"connections": [], "sources": [], "destinations": []}
+        for action in actions:
+            if action["action"] == "delete":
+                deletes[action["object_type"]].append(action)
+        lookups = {
+            "connections": lambda action: next(
+                (
+                    c["connectionId"]
+                    for c in self.airbyte_api.connections_list
+                    if c["connectionId"] == action.get("id")
+                    or c.get("name") == action["name"]
+                ),
+                None,
+            ),
+            "sources": lambda action: self._get_source_id_by_name(action["name"]),
+            "destinations": lambda action: self._get_destination_id_by_name(
+                action["name"]
+            ),
+        }
+        deleters = {
+            "connections": self.airbyte_api.delete_connection,
+            "sources": self.airbyte_api.delete_source,
+            "destinations": self.airbyte_api.delete_destination,
+        }
+        for object_type, object_deletes in deletes.items():
+            for action in object_deletes:
+                started = time.monotonic()
+                if not self.allow_deletes:
+                    self._record_result(
+                        object_type,
+                        action["name"],
+                        "skipped",
+                        started,
+                        "deletes not allowed, see --allow-deletes",
+                    )
+                    continue
+                object_id = lookups[object_type](action)
+                if not object_id:
+                    self._record_result(
+                        object_type, action["name"], "skipped", started, "not found"
+                    )
+                    continue
+                try:
+                    deleters[object_type](object_id)
+                except AirbyteApiCallerException as e:
+                    self._record_result(
+                        object_type, action["name"], "failed", started, str(e)
+                    )
+                    continue
+                self._record_result(object_type, action["name"], "deleted", started)
+
+    def _load_concurrently(self, sources, destinations, connections):
+        """
+        Upsert sources and destinations in a bounded worker pool, and schedule each
+        connection as soon as both of its endpoints have been processed.
+        """
+        endpoint_futures = {"sources": {}, "destinations": {}}
+        all_futures = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for object_type, loader, exported_objects in (
+                ("sources", self._create_or_update_source, sources),
+                ("destinations", self._create_or_update_destination, destinations),
+            ):
+                for exported_data in exported_objects:
+                    future = executor.submit(
+                        self._run_load_job,
+                        object_type,
+                        exported_data["name"],
+                        loader,
+                        exported_data,
+                    )
+                    endpoint_futures[object_type][exported_data["name"]] = future
+                    all_futures.append(future)
+
+            waiting = list(connections)
+            while waiting:
+                blocked = []
+                blocking_futures = set()
+                for connection in waiting:
+                    endpoints = {
+                        "source": endpoint_futures["sources"].get(
+                            connection["sourceName"]
+                        ),
+                        "destination": endpoint_futures["destinations"].get(
+                            connection["destinationName"]
+                        ),
+                    }
+                    pending = [
+                        future
+                        for future in endpoints.values()
+                        if future and not future.done()
+                    ]
+                    if pending:
+                        blocked.append(connection)
+                        blocking_futures.update(pending)
+                        continue
+                    connection_name = (
+                        f"{connection['sourceName']}-{connection['destinationName']}"
+                    )
+                    failed_endpoints = [
+                        endpoint
+                        for endpoint, future in endpoints.items()
+                        if future and not future.result()
+                    ]
+                    if failed_endpoints:
+                        self._record_result(
+                            "connections",
+                            connection_name,
+                            "skipped",
+                            time.monotonic(),
+                            f"{' and '.join(failed_endpoints)} not loaded",
+                        )
+                        continue
+                    all_futures.append(
+                        executor.submit(
+                            self._run_load_job,
+                            "connections",
+                            connection_name,
+                            self._create_or_update_connection,
+                            connection,
+                        )
+                    )
+                waiting = blocked
+                if waiting:
+                    wait(blocking_futures, return_when=FIRST_COMPLETED)
+
+        # Surface unexpected (non-loader) errors raised inside the workers
+        for future in all_futures:
+            future.result()
+
+    def _run_load_job(self, object_type, object_name, loader, exported_data):
+        """
+        Run a single create/update, recording its outcome.
+        Returns whether the object is available in Airbyte afterwards.
+        """
+        started = time.monotonic()
+        try:
+            action = loader(exported_data)
+        except (AirbyteLoaderException, AirbyteApiCallerException) as e:
+            console.print(f"[red]Error loading {object_name}:[/red] {e}")
+            self._record_result(object_type, object_name, "failed", started, str(e))
+            return False
+        self._record_result(object_type, object_name, action, started)
+        return action != "discarded"
+
+    def _record_result(self, object_type, object_name, action, started, detail=""):
+        with self.results_lock:
+            self.loading_results.append(
+                {
+                    "type": object_type,
+                    "name": object_name,
+                    "action": action,
+                    "seconds": time.monotonic() - started,
+                    "detail": detail,
+                }
+            )
+
+    def _print_load_results(self):
+        action_styles = {
+            "created": "green",
+            "updated": "green",
+            "deleted": "green",
+            "skipped": "yellow",
+            "discarded": "yellow",
+            "failed": "red",
+        }
+        table = Table(title="Airbyte load results")
+        table.add_column("Type")
+        table.add_column("Name")
+        table.add_column("Action")
+        table.add_column("Time (s)", justify="right")
+        table.add_column("Detail")
+        type_order = ["sources", "destinations", "connections"]
+        for result in sorted(
+            self.loading_results,
+            key=lambda r: (type_order.index(r["type"]), r["name"]),
+        ):
+            style = action_styles.get(result["action"], "")
+            table.add_row(
+                result["type"].capitalize(),
+                result["name"],
+                f"[{style}]{result['action']}[/{style}]",
+                f"{result['seconds']:.1f}",
+                result["detail"],
+            )
+        console.print(table)
+        if not any(r["action"] == "failed" for r in self.loading_results):
+            console.print("[green][b]Load successful :heavy_check_mark:[/b][/green]")
 
     def _get_secret_value_for_field(self, secret_data, field, secret_target_name):
         for k, v in secret_data.items():
@@ -276,20 +662,21 @@ class LoadAirbyteTask(BaseLoadTask):
                 f"Connection test for {exported_data['name']} failed:\n "
                 f"{conn_status.get('message', '')}"
             )
-            update = questionary.confirm(
-                "Would you like to continue updating it?"
-            ).ask()
-        if update:
-            update_body = {
-                "name": exported_data["name"],
-                "configuration": exported_data.get("configuration", {}),
-            }
-            if object_type == "sources":
-                response = self.airbyte_api.update_source(object_id, update_body)
-            else:
-                response = self.airbyte_api.update_destination(object_id, update_body)
-            self._add_update_result(object_type, exported_data["name"])
-            return response.get("sourceId", response.get("destinationId"))
+            with self.prompt_lock:
+                update = questionary.confirm(
+                    "Would you like to continue updating it?"
+                ).ask()
+        if not update:
+            return "skipped"
+        update_body = {
+            "name": exported_data["name"],
+            "configuration": exported_data.get("configuration", {}),
+        }
+        if object_type == "sources":
+            self.airbyte_api.update_source(object_id, update_body)
+        else:
+            self.airbyte_api.update_destination(object_id, update_body)
+        return "updated"
 
     def _create_source_or_destination(self, exported_data, object_type):
         if object_type == "sources":
@@ -298,7 +685,6 @@ class LoadAirbyteTask(BaseLoadTask):
             response = self.airbyte_api.create_destination(exported_data)
 
         object_id = response.get("sourceId", response.get("destinationId", ""))
-        object_name = response.get("name", "")
 
         conn_status = self._test_existing_object(object_id, object_type)
         create = True
@@ -307,22 +693,24 @@ class LoadAirbyteTask(BaseLoadTask):
                 f"Connection test for {exported_data['name']} failed:\n "
                 f"{conn_status.get('message', '')}"
             )
-            create = questionary.confirm(
-                "Would you like to continue creating it?"
-            ).ask()
+            with self.prompt_lock:
+                create = questionary.confirm(
+                    "Would you like to continue creating it?"
+                ).ask()
 
         if create:
-            if object_type == "sources":
-                self.airbyte_api.sources_list.append(response)
-            else:
-                self.airbyte_api.destinations_list.append(response)
-            self.loading_results[object_type]["created"].append(object_name)
-            return object_id
+            with self.results_lock:
+                if object_type == "sources":
+                    self.airbyte_api.sources_list.append(response)
+                else:
+                    self.airbyte_api.destinations_list.append(response)
+            return "created"
         else:
             if object_type == "sources":
                 self.airbyte_api.delete_source(object_id)
             else:
                 self.airbyte_api.delete_destination(object_id)
+            return "discarded"
 
     def _test_existing_object(self, object_id, object_type, timeout=30):
         """Test connection for an existing source or destination by ID."""
@@ -341,12 +729,12 @@ class LoadAirbyteTask(BaseLoadTask):
         exported_data = self._get_secrets(exported_data, "sources")
         exported_data["workspaceId"] = self.airbyte_api.workspace_id
         # sourceType is already in the exported JSON from extract — no definition ID lookup needed
-        self._create_source_or_destination(exported_data, "sources")
+        return self._create_source_or_destination(exported_data, "sources")
 
     def _update_source(self, exported_data, source_id):
         exported_data.pop("connectorVersion", None)
         exported_data = self._get_secrets(exported_data, "sources")
-        self._update_source_or_destination(exported_data, "sources", source_id)
+        return self._update_source_or_destination(exported_data, "sources", source_id)
 
     def _sources_are_equivalent(self, exported_source, current_source):
         current_copy = copy(current_source)
@@ -369,7 +757,7 @@ class LoadAirbyteTask(BaseLoadTask):
                     console.print(
                         f"Source [green]{src['name']}[/green] already up to date. Skipping"
                     )
-                    return
+                    return "skipped"
                 else:
                     return self._update_source(exported_json_data, src["sourceId"])
 
@@ -407,12 +795,12 @@ class LoadAirbyteTask(BaseLoadTask):
         exported_data.pop("connectorVersion", None)
         exported_data = self._get_secrets(exported_data, "destinations")
         exported_data["workspaceId"] = self.airbyte_api.workspace_id
-        self._create_source_or_destination(exported_data, "destinations")
+        return self._create_source_or_destination(exported_data, "destinations")
 
     def _update_destination(self, exported_data, destination_id):
         exported_data.pop("connectorVersion", None)
         exported_data = self._get_secrets(exported_data, "destinations")
-        self._update_source_or_destination(
+        return self._update_source_or_destination(
             exported_data, "destinations", destination_id
         )
 
@@ -437,7 +825,7 @@ class LoadAirbyteTask(BaseLoadTask):
                         f"Destination [green]{destination['name']}[/green] "
                         f"already up to date. Skipping"
                     )
-                    return
+                    return "skipped"
                 else:
                     return self._update_destination(
                         exported_json_data, destination["destinationId"]
@@ -531,7 +919,8 @@ class LoadAirbyteTask(BaseLoadTask):
         try:
             response = self.airbyte_api.create_connection(exported_json_data)
             if response:
-                self.airbyte_api.connections_list.append(response)
+                with self.results_lock:
+                    self.airbyte_api.connections_list.append(response)
                 return connection_name
         except AirbyteApiCallerException as ex:
             raise AirbyteApiCallerException(
@@ -594,32 +983,22 @@ class LoadAirbyteTask(BaseLoadTask):
                 f"No existent source-destination pair found for connection "
                 f"({source_name} → {destination_name})"
             )
-            return
+            return "skipped"
         connection = self._get_connection_by_endpoints(source_id, destination_id)
         if connection:
             if self._connection_already_updated(connection_json, connection):
                 console.print(
                     f"Connection [green]{connection['name']}[/green] already up to date. Skipping"
                 )
-                return
+                return "skipped"
             else:
                 connection_id = connection["connectionId"]
                 self._delete_connection(connection_id)
-                conn_name = self._create_connection(
-                    connection_json, source_id, destination_id
-                )
-                self._add_update_result("connections", conn_name)
+                self._create_connection(connection_json, source_id, destination_id)
+                return "updated"
         else:
-            conn_name = self._create_connection(
-                connection_json, source_id, destination_id
-            )
-            self.loading_results["connections"]["created"].append(conn_name)
-
-    def _add_update_result(self, obj_type, obj_name):
-        if (obj_name not in self.loading_results[obj_type]["updated"]) and (
-            obj_name not in self.loading_results[obj_type]["created"]
-        ):
-            self.loading_results[obj_type]["updated"].append(obj_name)
+            self._create_connection(connection_json, source_id, destination_id)
+            return "created"
 
     def _connector_versions_mismatch(self, exported_json_data, object_type):
         try:
@@ -1,13 +1,17 @@
 import glob
 import json
+from datetime import datetime, timezone
 from pathlib import Path
 
 from rich.console import Console
+from rich.table import Table
 
 from dbt_coves.tasks.base import NonDbtBaseTask
 
 console = Console()
 
+PLAN_ACTIONS = ("create", "update", "delete")
+
 
 class LoadException(Exception):
     pass
@@ -26,3 +30,82 @@ class BaseLoadTask(NonDbtBaseTask):
                 with open(filepath, "r") as json_file:
                     jsons.append(json.load(json_file))
         return jsons
+
+    def plan_action(
+        self, object_type, name, action, object_id=None, detail="", parent=None
+    ):
+        """Build a single plan entry"""
+        plan_action = {"object_type": object_type, "name": name, "action": action}
+        if object_id:
+            plan_action["id"] = object_id
+        if parent:
+            plan_action["parent"] = parent
+        if detail:
+            plan_action["detail"] = detail
+        return plan_action
+
+    def print_plan(self, actions, loader):
+        """Print a plan of creates, updates and deletes, and a summary line"""
+        if not actions:
+            console.print(
+                f"[green]No changes. {loader} is up to date with the extracted "
+                "configuration.[/green]"
+            )
+            return
+        action_styles = {"create": "green", "update": "yellow", "delete": "red"}
+        table = Table(title=f"{loader} load plan")
+        table.add_column("Type")
+        table.add_column("Name")
+        table.add_column("Action")
+        table.add_column("Detail")
+        for action in actions:
+            style = action_styles[action["action"]]
+            table.add_row(
+                action["object_type"].capitalize(),
+                action["name"],
+                f"[{style}]{action['action']}[/{style}]",
+                action.get("detail", ""),
+            )
+        console.print(table)
+        counts = {
+            plan_action: len([a for a in actions if a["action"] == plan_action])
+            for plan_action in PLAN_ACTIONS
+        }
+        console.print(
+            f"Plan: {counts['create']} to create, {counts['update']} to update, "
+            f"{counts['delete']} to delete."
+        )
+
+    def save_plan(self, plan_path, actions, loader):
+        plan = {
+            "loader": loader.lower(),
+            "path": str(Path(self.get_config_value("path")).absolute()),
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "actions": actions,
+        }
+        try:
+            with open(plan_path, "w") as plan_file:
+                json.dump(plan, plan_file, indent=4)
+                plan_file.write("\n")
+        except OSError as e:
+            raise LoadException(f"Couldn't write plan {plan_path}: {e}")
+        console.print(f"Plan saved to [b]{plan_path}[/b]")
+
+    def load_plan(self, plan_path, loader):
+        """Read a plan saved with `--plan --plan-file` and validate it's for `loader`"""
+        try:
+            with open(plan_path, "r") as plan_file:
+                plan = json.load(plan_file)
+        except (OSError, json.JSONDecodeError) as e:
+            raise LoadException(f"Couldn't read plan {plan_path}: {e}")
+        if plan.get("loader") != loader.lower():
+            raise LoadException(
+                f"Plan {plan_path} was generated for '{plan.get('loader')}', "
+                f"not '{loader.lower()}'"
+            )
+        for action in plan.get("actions", []):
+            if action.get("action") not in PLAN_ACTIONS:
+                raise LoadException(
+                    f"Plan {plan_path} contains an unknown action: {action}"
+                )
+        return plan["actions"]
@@ -1,9 +1,12 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import questionary
 from rich.console import Console
 
-from dbt_coves.utils.api_caller import FivetranApiCaller
+from dbt_coves.utils.api_caller import FivetranApiCaller, FivetranApiCallerException
 from dbt_coves.utils.secrets import load_secret_manager_data
 from dbt_coves.utils.tracking import trackable
 from dbt_coves.utils.yaml import open_yaml
@@ -12,6 +15,21 @@ from .base import BaseLoadTask
 
 console = Console()
 
+DEFAULT_MAX_WORKERS = 8
+# Connector fields the loader PATCHes. The rest, like `status`, `succeeded_at` or
+# `failed_at`, are kept by Fivetran and change with every sync
+CONNECTOR_SETTINGS = (
+    "config",
+    "paused",
+    "pause_after_trial",
+    "sync_frequency",
+    "daily_sync_time",
+    "schedule_type",
+    "trust_certificates",
+    "trust_fingerprints",
+    "networking_method",
+)
+
 
 class FivetranLoaderException(Exception):
     pass
@@ -68,6 +86,36 @@ class LoadFivetranTask(BaseLoadTask):
             "--secrets-tags", type=str, help="Secret credentials tags"
         )
         subparser.add_argument("--secrets-key", type=str, help="Secret credentials key")
+        subparser.add_argument(
+            "--max-workers",
+            type=int,
+            help="Maximum number of concurrent connector and table configuration "
+            f"updates, default {DEFAULT_MAX_WORKERS}",
+        )
+        subparser.add_argument(
+            "--plan",
+            action="store_true",
+            default=False,
+            help="Only compare the extracted files against Fivetran and print the "
+            "destinations and connectors that would be created, updated or deleted",
+        )
+        subparser.add_argument(
+            "--plan-file",
+            type=str,
+            help="Along with --plan, path of the JSON file where the plan is saved",
+        )
+        subparser.add_argument(
+            "--apply-plan",
+            type=str,
+            help="Path of a plan saved with --plan --plan-file. "
+            "Only the changes listed in it are loaded",
+        )
+        subparser.add_argument(
+            "--allow-deletes",
+            action="store_true",
+            default=False,
+            help="Along with --apply-plan, also delete the objects the plan removes",
+        )
         subparser.set_defaults(cls=cls, which="fivetran")
         return subparser
 
@@ -78,9 +126,10 @@ class LoadFivetranTask(BaseLoadTask):
         for obj_type, result_dict in self.load_results.items():
             for activity, result in result_dict.items():
                 if len(result) > 0:
+                    style = "red" if activity == "failed" else "green"
                     console.print(
                         f"{obj_type.capitalize()} {activity}: "
-                        f"[green]{', '.join(result)}[/green]"
+                        f"[{style}]{', '.join(sorted(result))}[/{style}]"
                     )
 
     @trackable
@@ -88,7 +137,12 @@ class LoadFivetranTask(BaseLoadTask):
         self.load_results = {
             "groups": {"created": set()},
             "destinations": {"created": set(), "updated": set()},
-            "connectors": {"created": set(), "updated": set()},
+            "connectors": {
+                "created": set(),
+                "updated": set(),
+                "deleted": set(),
+                "failed": set(),
+            },
             "schemas": {"updated": set()},
             "tables": {"updated": set()},
         }
@@ -99,7 +153,24 @@ class LoadFivetranTask(BaseLoadTask):
         self.secrets_manager = self.get_config_value("secrets_manager")
         api_credentials_path = self.get_config_value("credentials")
         secrets_path = self.get_config_value("secrets_path")
-
+        self.max_workers = self.get_config_value("max_workers") or DEFAULT_MAX_WORKERS
+        self.results_lock = threading.Lock()
+        self.prompt_lock = threading.Lock()
+        plan_only = self.get_config_value("plan")
+        plan_file = self.get_config_value("plan_file")
+        apply_plan = self.get_config_value("apply_plan")
+        self.allow_deletes = self.get_config_value("allow_deletes")
+
+        if plan_only and apply_plan:
+            raise FivetranLoaderException(
+                "Can't use 'plan' and 'apply_plan' simultaneously."
+            )
+        if plan_file and not plan_only:
+            raise FivetranLoaderException("'plan_file' can only be used with 'plan'.")
+        if self.allow_deletes and not apply_plan:
+            raise FivetranLoaderException(
+                "'allow_deletes' can only be used with 'apply_plan'."
+            )
         if secrets_path and self.secrets_manager:
             raise FivetranLoaderException(
                 "Can't use 'secrets_path' and 'secrets_manager' simultaneously."
@@ -135,6 +206,17 @@ class LoadFivetranTask(BaseLoadTask):
                 f"No Fivetran extracted data found on {self.extract_destination.absolute()}"
             )
 
+        if plan_only:
+            actions = self._plan_changes()
+            self.print_plan(actions, "Fivetran")
+            if plan_file:
+                self.save_plan(plan_file, actions, "Fivetran")
+            return 0
+
+        if apply_plan:
+            actions = self.load_plan(apply_plan, "Fivetran")
+            self._filter_planned_objects(actions)
+
         self.local_secrets = []
         self.secret_manager_data = {}
 
@@ -147,6 +229,178 @@ class LoadFivetranTask(BaseLoadTask):
         if self.secrets_manager:
             self.secret_manager_data = load_secret_manager_data(self)
 
+        # Table configuration PATCHes get their own pool: connector jobs block on
+        # them, so sharing a single pool could starve it
+        self.connectors_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.tables_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            self._load_extracted_destinations()
+        finally:
+            self.connectors_executor.shutdown()
+            self.tables_executor.shutdown()
+        if apply_plan:
+            self._apply_planned_deletes(actions)
+        self._print_load_results()
+
+        failed = self.load_results["connectors"]["failed"]
+        if failed:
+            raise FivetranLoaderException(
+                f"{len(failed)} connector(s) could not be deleted: "
+                f"{', '.join(sorted(failed))}"
+            )
+        return 0
+
+    def _plan_changes(self):
+        """
+        Compare extracted destinations and connectors against the Fivetran inventory
+        fetched on startup, without any further API call.
+        """
+        actions = []
+        for fivetran_destination in self.extracted_destinations:
+            for destination_data in fivetran_destination.values():
+                exported_details = destination_data["details"]
+                group_id = exported_details["group_id"]
+                current_destination = self.fivetran_api.fivetran_data.get(group_id, {})
+                group_name = self.fivetran_api.fivetran_groups.get(group_id, {}).get(
+                    "name", group_id
+                )
+                if not current_destination:
+                    actions.append(
+                        self.plan_action(
+                            "destinations",
+                            group_name,
+                            "create",
+                            group_id,
+                            "group selected on apply",
+                        )
+                    )
+                elif exported_details != current_destination["details"]:
+                    actions.append(
+                        self.plan_action("destinations", group_name, "update", group_id)
+                    )
+
+                current_connectors = {
+                    connector["details"]["schema"]: connector
+                    for connector in current_destination.get("connectors", {}).values()
+                }
+                exported_connectors = destination_data.get("connectors", {}).values()
+                for exported_connector in exported_connectors:
+                    actions.extend(
+                        self._plan_connector_changes(
+                            exported_connector,
+                            current_connectors,
+                            group_id,
+                            group_name,
+                        )
+                    )
+                exported_schemas = {
+                    connector["details"]["schema"] for connector in exported_connectors
+                }
+                for schema, current_connector in current_connectors.items():
+                    if schema not in exported_schemas:
+                        actions.append(
+                            self.plan_action(
+                                "connectors",
+                                f"{group_name}.{schema}",
+                                "delete",
+                                current_connector["details"]["id"],
+                                parent=group_id,
+                            )
+                        )
+        return actions
+
+    def _plan_connector_changes(
+        self, exported_connector, current_connectors, group_id, group_name
+    ):
+        exported_details = exported_connector["details"]
+        connector_name = f"{group_name}.{exported_details['schema']}"
+        current_connector = current_connectors.get(exported_details["schema"])
+        if not current_connector:
+            return [
+                self.plan_action(
+                    "connectors", connector_name, "create", parent=group_id
+                )
+            ]
+
+        changes = []
+        if self._connector_settings(exported_details) != self._connector_settings(
+            current_connector["details"]
+        ):
+            changes.append("details")
+        changed_schemas, changed_tables = self._get_changed_schema_tables(
+            exported_connector.get("schemas", {}),
+            current_connector.get("schemas", {}),
+        )
+        if changed_schemas:
+            changes.append(f"schema config ({len(changed_tables)} tables)")
+        if not changes:
+            return []
+        return [
+            self.plan_action(
+                "connectors",
+                connector_name,
+                "update",
+                current_connector["details"]["id"],
+                ", ".join(changes),
+                parent=group_id,
+            )
+        ]
+
+    def _filter_planned_objects(self, actions):
+        """
+        Keep only the extracted destinations and connectors a plan creates or updates
+        """
+        planned_destinations = set()
+        planned_connectors = set()
+        for action in actions:
+            if action["action"] not in ("create", "update"):
+                continue
+            if action["object_type"] == "destinations":
+                planned_destinations.add(action["id"])
+            else:
+                planned_destinations.add(action["parent"])
+                planned_connectors.add((action["parent"], action["name"]))
+
+        filtered_destinations = []
+        for fivetran_destination in self.extracted_destinations:
+            for destination_data in fivetran_destination.values():
+                group_id = destination_data["details"]["group_id"]
+                group_name = self.fivetran_api.fivetran_groups.get(group_id, {}).get(
+                    "name", group_id
+                )
+                destination_data["connectors"] = {
+                    connector_id: connector
+                    for connector_id, connector in destination_data.get(
+                        "connectors", {}
+                    ).items()
+                    if (group_id, f"{group_name}.{connector['details']['schema']}")
+                    in planned_connectors
+                }
+                if group_id in planned_destinations:
+                    filtered_destinations.append(fivetran_destination)
+        self.extracted_destinations = filtered_destinations
+
+    def _apply_planned_deletes(self, actions):
+        """Delete the connectors a plan removes, if deletes are allowed"""
+        deletes = [action for action in actions if action["action"] == "delete"]
+        if deletes and not self.allow_deletes:
+            console.print(
+                f"[yellow]Skipping {len(deletes)} planned connector deletion(s), "
+                "use --allow-deletes to apply them[/yellow]"
+            )
+            return
+        for action in deletes:
+            try:
+                self.fivetran_api.delete_connector(action["id"])
+            except FivetranApiCallerException as e:
+                console.print(
+                    f"[red]Couldn't delete connector {action['name']}: {e}[/red]"
+                )
+                self._add_load_result("connectors", "failed", action["name"])
+                continue
+            self._add_load_result("connectors", "deleted", action["name"])
+
+    def _load_extracted_destinations(self):
         for fivetran_destination in self.extracted_destinations:
             if self.local_secrets:
                 self._load_fivetran_local_secrets(fivetran_destination)
@@ -171,9 +425,6 @@ class LoadFivetranTask(BaseLoadTask):
                 self._update_or_create_fivetran_destination(
                     fivetran_destination, target_group_id
                 )
-        self._print_load_results()
-
-        return 0
 
     def _connect_to_api_using_credentials_file(self, credentials_path):
         api_key = None
@@ -229,7 +480,12 @@ class LoadFivetranTask(BaseLoadTask):
         current_connector = self.fivetran_api._get_connector_details(
             connector_details["id"]
         )
-        return connector_details == current_connector
+        return self._connector_settings(connector_details) == self._connector_settings(
+            current_connector
+        )
+
+    def _connector_settings(self, connector_details):
+        return {field: connector_details.get(field) for field in CONNECTOR_SETTINGS}
 
     def _update_fivetran_connector(self, connector_details, group_name):
         connector_id = connector_details["id"]
@@ -244,7 +500,7 @@ class LoadFivetranTask(BaseLoadTask):
             connector_id, connector_details
         )
         connector_schema = updated_connector["schema"]
-        self.load_results["connectors"]["updated"].add(connector_schema)
+        self._add_load_result("connectors", "updated", connector_schema)
         return updated_connector
 
     def _create_fivetran_connector(self, connector_details):
@@ -253,30 +509,90 @@ class LoadFivetranTask(BaseLoadTask):
         connector_details["run_setup_tests"] = False
         created_connector = self.fivetran_api.create_connector(connector_details)
         connector_schema = created_connector["schema"]
-        self.load_results["connectors"]["created"].add(connector_schema)
+        self._add_load_result("connectors", "created", connector_schema)
         return created_connector
 
+    def _add_load_result(self, obj_type, activity, name):
+        with self.results_lock:
+            self.load_results[obj_type][activity].add(name)
+
+    def _get_changed_schema_tables(self, extracted_schemas, connector_schemas):
+        """
+        Diff extracted schema configs against the live ones.
+        Returns the schemas that differ at all, and the (schema, table) configs
+        that differ at table level.
+        """
+        changed_schemas = []
+        changed_tables = []
+        for schema_key, extracted_schema in extracted_schemas.items():
+            live_schema = connector_schemas.get(schema_key, {})
+            if extracted_schema != live_schema:
+                changed_schemas.append(schema_key)
+            live_tables = live_schema.get("tables", {})
+            for table_key, table_config in extracted_schema.get("tables", {}).items():
+                if table_config != live_tables.get(table_key):
+                    changed_tables.append((extracted_schema, table_config))
+        return changed_schemas, changed_tables
+
     def _update_target_connector_schema_config(self, connector, extracted_schemas):
         connector_id = connector["id"]
+        connector_name = connector.get("schema", connector_id)
+        started = time.monotonic()
         connector_schemas = self.fivetran_api._get_connector_schemas(connector_id)
-        if connector_schemas:
-            self.fivetran_api.update_connector_schema_config(
-                connector_id, extracted_schemas
+        if not connector_schemas:
+            return
+        changed_schemas, changed_tables = self._get_changed_schema_tables(
+            extracted_schemas, connector_schemas
+        )
+        if not changed_schemas:
+            console.print(
+                f"Connector [green]{connector_name}[/green] schema config already "
+                "up to date. Skipping"
+            )
+            return
+
+        self.fivetran_api.update_connector_schema_config(
+            connector_id, extracted_schemas
+        )
+        for schema_key in changed_schemas:
+            self._add_load_result(
+                "schemas",
+                "updated",
+                extracted_schemas[schema_key]["name_in_destination"],
             )
-            for extracted_schema in extracted_schemas.values():
-                schema_name_in_destination = extracted_schema["name_in_destination"]
-                self.load_results["schemas"]["updated"].add(schema_name_in_destination)
-                for table_config in extracted_schema.get("tables", {}).values():
-                    table_name_in_destination = table_config["name_in_destination"]
-                    self.fivetran_api.update_connector_table_config(
-                        connector_id,
-                        schema_name_in_destination,
-                        table_name_in_destination,
-                        table_config,
-                    )
-                    self.load_results["tables"]["updated"].add(
-                        table_name_in_destination
-                    )
+
+        table_updates = [
+            self.tables_executor.submit(
+                self._update_connector_table_config,
+                connector_id,
+                extracted_schema["name_in_destination"],
+                table_config,
+            )
+            for extracted_schema, table_config in changed_tables
+        ]
+        for table_update in table_updates:
+            table_update.result()
+
+        total_tables = sum(
+            len(schema.get("tables", {})) for schema in extracted_schemas.values()
+        )
+        console.print(
+            f"Connector [green]{connector_name}[/green]: updated "
+            f"{len(changed_tables)} of {total_tables} tables in "
+            f"{time.monotonic() - started:.1f}s"
+        )
+
+    def _update_connector_table_config(
+        self, connector_id, schema_name_in_destination, table_config
+    ):
+        table_name_in_destination = table_config["name_in_destination"]
+        self.fivetran_api.update_connector_table_config(
+            connector_id,
+            schema_name_in_destination,
+            table_name_in_destination,
+            table_config,
+        )
+        self._add_load_result("tables", "updated", table_name_in_destination)
 
     def _get_existent_destination(self, target_group_id):
         for dest_data in self.fivetran_api.fivetran_data.values():
@@ -329,27 +645,39 @@ class LoadFivetranTask(BaseLoadTask):
             # create
             self._create_fivetran_destination(exported_dest_details)
 
-        for exported_connector in exported_dest_connectors.values():
-            exported_connector_details = exported_connector["details"]
-            if current_destination and self._exported_connector_exists_in_destination(
-                exported_connector_details, current_destination
-            ):
-                target_connector = self._update_fivetran_connector(
-                    exported_connector_details, group_name
-                )
-            else:
-                self._fill_required_config_fields(
-                    exported_connector_details, group_name
-                )
-                target_connector = self._create_fivetran_connector(
-                    exported_connector_details
-                )
+        connector_loads = [
+            self.connectors_executor.submit(
+                self._update_or_create_fivetran_connector,
+                exported_connector,
+                current_destination,
+                group_name,
+            )
+            for exported_connector in exported_dest_connectors.values()
+        ]
+        for connector_load in connector_loads:
+            connector_load.result()
 
-            exported_schemas = exported_connector.get("schemas", {})
-            if exported_schemas:
-                self._update_target_connector_schema_config(
-                    target_connector, exported_schemas
-                )
+    def _update_or_create_fivetran_connector(
+        self, exported_connector, current_destination, group_name
+    ):
+        exported_connector_details = exported_connector["details"]
+        if current_destination and self._exported_connector_exists_in_destination(
+            exported_connector_details, current_destination
+        ):
+            target_connector = self._update_fivetran_connector(
+                exported_connector_details, group_name
+            )
+        else:
+            self._fill_required_config_fields(exported_connector_details, group_name)
+            target_connector = self._create_fivetran_connector(
+                exported_connector_details
+            )
+
+        exported_schemas = exported_connector.get("schemas", {})
+        if exported_schemas:
+            self._update_target_connector_schema_config(
+                target_connector, exported_schemas
+            )
 
     def _fill_required_config_fields(self, connector_details, group_name):
         """
@@ -365,10 +693,12 @@ class LoadFivetranTask(BaseLoadTask):
         )
         for field in required_config_fields:
             if not connector_config.get(field):
-                connector_config[field] = questionary.text(
-                    f"Enter new {field} for exported {service_type} "
-                    f"Connector {connector_details['schema']} in Destination {group_name}:"
-                ).ask()
+                with self.prompt_lock:
+                    connector_config[field] = questionary.text(
+                        f"Enter new {field} for exported {service_type} "
+                        f"Connector {connector_details['schema']} "
+                        f"in Destination {group_name}:"
+                    ).ask()
 
         # Avoid field repetition in Config and Reports (PATCH/POST legacy mode workaround)
         if connector_config.get("reports"):
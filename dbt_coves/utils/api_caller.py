@@ -1,4 +1,7 @@
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
 import requests
@@ -24,6 +27,9 @@ FIVETRAN_API_ENDPOINTS = {
     + "/connectors/{connector}/schemas/{schema}/tables/{table}",
     "SOURCE_METADATA": FIVETRAN_API_BASE_URL + "/metadata/connectors/{service}",
 }
+FIVETRAN_MAX_RETRIES = 5
+FIVETRAN_DEFAULT_RETRY_AFTER = 2
+INVENTORY_MAX_WORKERS = 8
 
 
 def api_call(
@@ -40,6 +46,8 @@ def api_call(
     try:
         if response.status_code == 404:
             return {}
+        elif response.status_code == 429:
+            raise FivetranApiRateLimitException(response.headers.get("Retry-After"))
         else:
             response.raise_for_status()
             return json.loads(response.text)
@@ -56,43 +64,81 @@ class FivetranApiCallerException(Exception):
     pass
 
 
+class FivetranApiRateLimitException(FivetranApiCallerException):
+    def __init__(self, retry_after=None):
+        try:
+            self.retry_after = float(retry_after)
+        except (TypeError, ValueError):
+            self.retry_after = None
+        super().__init__("Fivetran API rate limit exceeded")
+
+
 class AirbyteApiCaller:
     """
     API caller for Airbyte's public REST API (/api/public/v1).
     Replaces the old internal config API (/api/v1) which used POST for all operations.
     """
 
-    def __init__(self, api_host, api_port=None, api_key=None):
-        host = api_host.rstrip("/")
-        if api_port:
-            host = f"{host}:{api_port}"
-        self.base_url = f"{host}/api/public/v1"
-        self.headers = {
-            "accept": "application/json",
-            "content-type": "application/json",
-        }
-        if api_key:
-            self.headers["authorization"] = f"Bearer {api_key}"
+    # Attributes crawled on init, see `inventory` and `from_inventory`
+    INVENTORY_ATTRIBUTES = (
+        "workspace_id",
+        "connections_list",
+        "sources_list",
+        "destinations_list",
+        "source_definitions",
+        "destination_definitions",
+    )
 
+    def __init__(self, api_host, api_port=None, api_key=None):
+        self._configure(api_host, api_port, api_key)
         try:
             console.print("Querying [i]Airbyte[/i] connections")
             workspaces = self._get_all("workspaces")
             if not workspaces:
                 raise AirbyteApiCallerException("No Airbyte workspaces found")
             self.workspace_id = workspaces[0]["workspaceId"]
-            self.connections_list = self._get_all(
-                "connections", workspaceIds=self.workspace_id
-            )
-            self.sources_list = self._get_all("sources", workspaceIds=self.workspace_id)
-            self.destinations_list = self._get_all(
-                "destinations", workspaceIds=self.workspace_id
-            )
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                (
+                    self.connections_list,
+                    self.sources_list,
+                    self.destinations_list,
+                ) = executor.map(
+                    lambda resource: self._get_all(
+                        resource, workspaceIds=self.workspace_id
+                    ),
+                    ["connections", "sources", "destinations"],
+                )
         except AirbyteApiCallerException as e:
             raise AirbyteApiCallerException(
                 f"Couldn't retrieve Airbyte connections, sources and destinations: {e}"
             )
         self.load_definitions()
 
+    def _configure(self, api_host, api_port, api_key):
+        host = api_host.rstrip("/")
+        if api_port:
+            host = f"{host}:{api_port}"
+        self.base_url = f"{host}/api/public/v1"
+        self.headers = {
+            "accept": "application/json",
+            "content-type": "application/json",
+        }
+        if api_key:
+            self.headers["authorization"] = f"Bearer {api_key}"
+
+    def inventory(self) -> Dict[str, Any]:
+        """Everything crawled on init, JSON-serializable"""
+        return {attr: getattr(self, attr) for attr in self.INVENTORY_ATTRIBUTES}
+
+    @classmethod
+    def from_inventory(cls, inventory, api_host, api_port=None, api_key=None):
+        """Build an API caller from a previous crawl's `inventory`, without crawling"""
+        api_caller = cls.__new__(cls)
+        api_caller._configure(api_host, api_port, api_key)
+        for attr in cls.INVENTORY_ATTRIBUTES:
+            setattr(api_caller, attr, inventory[attr])
+        return api_caller
+
     def _request(self, method, path, body=None, params=None, timeout=None):
         url = f"{self.base_url}/{path.lstrip('/')}"
         response = requests.request(
@@ -214,25 +260,70 @@ class AirbyteApiCaller:
 
 
 class FivetranApiCaller:
+    # Attributes crawled on init, see `inventory` and `from_inventory`
+    INVENTORY_ATTRIBUTES = ("fivetran_data", "fivetran_groups")
+
     def __init__(self, api_key, api_secret):
+        self._configure(api_key, api_secret)
+        self.fivetran_data = self._populate_fivetran_data()
+
+    def _configure(self, api_key, api_secret):
         self.auth = HTTPBasicAuth(api_key, api_secret)
         self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json;version=2",
         }
-        self.fivetran_data = self._populate_fivetran_data()
+        # Shared across threads: once any call gets rate-limited, every caller
+        # waits until the API's Retry-After window has passed
+        self._throttle_lock = threading.Lock()
+        self._throttled_until = 0.0
+
+    def inventory(self) -> Dict[str, Any]:
+        """Everything crawled on init, JSON-serializable"""
+        return {attr: getattr(self, attr) for attr in self.INVENTORY_ATTRIBUTES}
+
+    @classmethod
+    def from_inventory(cls, inventory, api_key, api_secret):
+        """Build an API caller from a previous crawl's `inventory`, without crawling"""
+        api_caller = cls.__new__(cls)
+        api_caller._configure(api_key, api_secret)
+        for attr in cls.INVENTORY_ATTRIBUTES:
+            setattr(api_caller, attr, inventory[attr])
+        return api_caller
+
+    def _wait_for_throttle(self):
+        with self._throttle_lock:
+            delay = self._throttled_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _throttle(self, retry_after):
+        with self._throttle_lock:
+            self._throttled_until = max(
+                self._throttled_until, time.monotonic() + retry_after
+            )
 
     def _fivetran_api_call(self, method: str, endpoint: str, payload=None):
         """
         Common method to reach Fivetran API, extensible for future Methods and Endpoints
+        Rate-limited (429) calls are retried after the API's Retry-After delay
         """
-        return api_call(
-            method,
-            endpoint,
-            body=payload,
-            headers=self.headers,
-            auth=self.auth,
-        )
+        for attempt in range(FIVETRAN_MAX_RETRIES):
+            self._wait_for_throttle()
+            try:
+                return api_call(
+                    method,
+                    endpoint,
+                    body=payload,
+                    headers=self.headers,
+                    auth=self.auth,
+                )
+            except FivetranApiRateLimitException as e:
+                if attempt == FIVETRAN_MAX_RETRIES - 1:
+                    raise
+                self._throttle(
+                    e.retry_after or FIVETRAN_DEFAULT_RETRY_AFTER * 2**attempt
+                )
 
     def _get_destination_details(self, destination_id) -> Dict[Any, Any]:
         """
@@ -276,17 +367,22 @@ class FivetranApiCaller:
                 destination=destination_id
             ),
         )
-        connector_data = {}
-        for connector in destination_connectors.get("data", {}).get("items", []):
-            connector_id = connector["id"]
-            connector_data[connector_id] = {}
-            connector_data[connector_id]["details"] = self._get_connector_details(
-                connector_id
-            )
-            connector_data[connector_id]["schemas"] = self._get_connector_schemas(
-                connector_id
-            )
-        return connector_data
+        connector_ids = [
+            connector["id"]
+            for connector in destination_connectors.get("data", {}).get("items", [])
+        ]
+        with ThreadPoolExecutor(max_workers=INVENTORY_MAX_WORKERS) as executor:
+            details = executor.map(self._get_connector_details, connector_ids)
+            schemas = executor.map(self._get_connector_schemas, connector_ids)
+            return {
+                connector_id: {
+                    "details": connector_details,
+                    "schemas": connector_schemas,
+                }
+                for connector_id, connector_details, connector_schemas in zip(
+                    connector_ids, details, schemas
+                )
+            }
 
     def create_group(self, group_name, service) -> str:
         payload = {"name": group_name}
@@ -308,24 +404,38 @@ class FivetranApiCaller:
         fivetran_groups = self._fivetran_api_call(
             "GET", FIVETRAN_API_ENDPOINTS.get("DESTINATION_LIST")
         )
-        for group in fivetran_groups.get("data", {}).get("items", []):
-            destination_data = {}
-            destination_id = group["id"]
-            fivetran_group_map[destination_id] = {}
-            fivetran_group_map[destination_id]["name"] = group["name"]
-            destination_details = self._get_destination_details(destination_id)
-            if destination_details:
-                fivetran_group_map[destination_id]["service"] = destination_details.get(
-                    "service", ""
-                )
-                destination_data["details"] = destination_details
-                destination_data["connectors"] = self._get_destination_connectors(
-                    destination_id
-                )
-                fivetran_data[destination_id] = destination_data
+        groups = fivetran_groups.get("data", {}).get("items", [])
+        # Destinations are crawled concurrently; each one crawls its own connectors
+        with ThreadPoolExecutor(max_workers=INVENTORY_MAX_WORKERS) as executor:
+            destinations = executor.map(
+                self._get_destination_inventory, [group["id"] for group in groups]
+            )
+            for group, (destination_details, destination_connectors) in zip(
+                groups, destinations
+            ):
+                destination_id = group["id"]
+                fivetran_group_map[destination_id] = {}
+                fivetran_group_map[destination_id]["name"] = group["name"]
+                if destination_details:
+                    fivetran_group_map[destination_id]["service"] = (
+                        destination_details.get("service", "")
+                    )
+                    fivetran_data[destination_id] = {
+                        "details": destination_details,
+                        "connectors": destination_connectors,
+                    }
         self.fivetran_groups = fivetran_group_map
         return fivetran_data
 
+    def _get_destination_inventory(self, destination_id):
+        """
+        Get a destination's details, and its connectors if the destination exists
+        """
+        destination_details = self._get_destination_details(destination_id)
+        if not destination_details:
+            return destination_details, {}
+        return destination_details, self._get_destination_connectors(destination_id)
+
     def update_destination(self, destination_id, destination_details):
         destination = self._fivetran_api_call(
             "PATCH",
@@ -353,6 +463,12 @@ class FivetranApiCaller:
         )
         return connector["data"]
 
+    def delete_connector(self, connector_id):
+        self._fivetran_api_call(
+            "DELETE",
+            FIVETRAN_API_ENDPOINTS["CONNECTOR_DETAILS"].format(connector=connector_id),
+        )
+
     def create_connector(self, connector_details):
         connector = self._fivetran_api_call(
             "POST", FIVETRAN_API_ENDPOINTS["CONNECTOR_CREATE"], connector_details
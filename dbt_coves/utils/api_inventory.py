@@ -0,0 +1,129 @@
+"""
+Per-run registry of Airbyte and Fivetran API inventories.
+
+Crawling an Airbyte workspace or a Fivetran account is expensive, so generators
+get their API callers from the current registry: each host/credentials pair is
+crawled once per run, and optionally restored from (and saved to) a JSON snapshot.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from rich.console import Console
+
+from dbt_coves.utils import profiling
+from dbt_coves.utils.api_caller import AirbyteApiCaller, FivetranApiCaller
+from dbt_coves.utils.hashing import canonical_hash
+
+console = Console()
+
+_registry = None
+
+
+class ApiInventoryException(Exception):
+    pass
+
+
+class ApiInventoryRegistry:
+    def __init__(self, snapshot_path: Optional[str] = None):
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        # Inventories by key, a hash of the API host and credentials
+        self.inventories = self._load_snapshot()
+        self.lock = threading.Lock()
+        self.api_callers = {}
+
+    def __getstate__(self):
+        # API callers are rebuilt from inventories in each process
+        state = self.__dict__.copy()
+        state["api_callers"] = {}
+        return state
+
+    def share(self, manager):
+        """
+        Share inventories through a multiprocessing `manager`, so worker processes
+        crawl each API once for all of them
+        """
+        self.inventories = manager.dict(self.inventories)
+        self.lock = manager.Lock()
+
+    def unshare(self):
+        """Stop sharing inventories, before the multiprocessing manager shuts down"""
+        self.inventories = dict(self.inventories)
+        self.lock = threading.Lock()
+
+    def airbyte(self, host, port=None, api_key=None) -> AirbyteApiCaller:
+        return self._get_api_caller(
+            canonical_hash(["airbyte", host, port, api_key]),
+            lambda: AirbyteApiCaller(host, api_port=port, api_key=api_key),
+            lambda inventory: AirbyteApiCaller.from_inventory(
+                inventory, host, api_port=port, api_key=api_key
+            ),
+        )
+
+    def fivetran(self, api_key, api_secret) -> FivetranApiCaller:
+        return self._get_api_caller(
+            canonical_hash(["fivetran", api_key, api_secret]),
+            lambda: FivetranApiCaller(api_key, api_secret),
+            lambda inventory: FivetranApiCaller.from_inventory(
+                inventory, api_key, api_secret
+            ),
+        )
+
+    def _get_api_caller(
+        self, key: str, crawl: Callable[[], Any], restore: Callable[[Dict], Any]
+    ):
+        if key not in self.api_callers:
+            with self.lock, profiling.phase("api_inventory"):
+                inventory = self.inventories.get(key)
+                if inventory is None:
+                    api_caller = crawl()
+                    self.inventories[key] = api_caller.inventory()
+                else:
+                    api_caller = restore(inventory)
+            self.api_callers[key] = api_caller
+        return self.api_callers[key]
+
+    def _load_snapshot(self) -> Dict[str, Any]:
+        if not (self.snapshot_path and self.snapshot_path.exists()):
+            return {}
+        try:
+            with open(self.snapshot_path) as snapshot_file:
+                return json.load(snapshot_file)["inventories"]
+        except (OSError, ValueError, KeyError) as e:
+            raise ApiInventoryException(
+                f"Couldn't read inventory snapshot {self.snapshot_path}: {e}"
+            )
+
+    def save_snapshot(self):
+        if not self.snapshot_path:
+            return
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.snapshot_path, "w") as snapshot_file:
+                json.dump({"inventories": dict(self.inventories)}, snapshot_file)
+        except OSError as e:
+            raise ApiInventoryException(
+                f"Couldn't write inventory snapshot {self.snapshot_path}: {e}"
+            )
+        console.print(f"Saved API inventories to {self.snapshot_path}")
+
+
+def start_registry(snapshot_path: Optional[str] = None) -> ApiInventoryRegistry:
+    """Start a new registry, i.e. at the beginning of a run"""
+    return set_registry(ApiInventoryRegistry(snapshot_path))
+
+
+def set_registry(registry: ApiInventoryRegistry) -> ApiInventoryRegistry:
+    global _registry
+    _registry = registry
+    return registry
+
+
+def get_registry() -> ApiInventoryRegistry:
+    """The current run's registry"""
+    global _registry
+    if _registry is None:
+        _registry = ApiInventoryRegistry()
+    return _registry
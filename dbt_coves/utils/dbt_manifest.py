@@ -0,0 +1,233 @@
+"""
+In-process evaluation of dbt node selection over a `manifest.json`.
+
+Supports the selection syntax `dbt ls` is commonly called with: `--select`/`--models`
+and `--exclude`, unions (spaces), intersections (commas), graph operators (`+`, `N+`,
+`@`) and the `fqn`, `tag`, `source`, `path`, `file`, `package`, `resource_type` and
+`config.*` methods. Anything else raises `UnsupportedSelectionException`, so callers
+can fall back to running dbt.
+"""
+
+import json
+import re
+import shlex
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+# Flags that don't change which nodes `dbt ls` lists
+IGNORED_FLAGS = {
+    "--resource-type": 1,
+    "--resource-types": 1,
+    "--output": 1,
+    "-o": 1,
+    "--output-keys": 1,
+    "--indirect-selection": 1,
+    "--quiet": 0,
+    "-q": 0,
+}
+SELECT_FLAGS = ("--select", "-s", "--models", "-m")
+EXCLUDE_FLAGS = ("--exclude",)
+CRITERION_PATTERN = re.compile(
+    r"^(?P<childrens_parents>@)?(?P<parents>(?P<parents_depth>\d*)\+)?"
+    r"(?P<value>.*?)"
+    r"(?P<children>\+(?P<children_depth>\d*))?$"
+)
+
+
+class UnsupportedSelectionException(Exception):
+    pass
+
+
+def load_manifest(manifest_path: Path) -> Dict[str, Any]:
+    with open(manifest_path) as manifest_file:
+        return json.load(manifest_file)
+
+
+def parse_list_args(list_args: str) -> Dict[str, List[str]]:
+    """Split `dbt ls` arguments into `select` and `exclude` selection criteria"""
+    selection = {"select": [], "exclude": []}
+    current = None
+    args = shlex.split(list_args or "")
+    position = 0
+    while position < len(args):
+        arg = args[position]
+        position += 1
+        if arg in SELECT_FLAGS:
+            current = selection["select"]
+        elif arg in EXCLUDE_FLAGS:
+            current = selection["exclude"]
+        elif arg in IGNORED_FLAGS:
+            current = None
+            position += IGNORED_FLAGS[arg]
+        elif arg.startswith("-"):
+            raise UnsupportedSelectionException(f"Unsupported dbt ls argument {arg}")
+        elif current is None:
+            raise UnsupportedSelectionException(f"Unexpected dbt ls argument {arg}")
+        else:
+            current.append(arg)
+    return selection
+
+
+class ManifestSelector:
+    def __init__(self, manifest: Dict[str, Any]):
+        self.manifest = manifest
+        self.nodes = {
+            **manifest.get("nodes", {}),
+            **manifest.get("sources", {}),
+            **manifest.get("exposures", {}),
+            **manifest.get("metrics", {}),
+            **manifest.get("semantic_models", {}),
+        }
+        self.parent_map = manifest.get("parent_map", {})
+        self.child_map = manifest.get("child_map", {})
+
+    def select_sources(self, list_args: str) -> List[str]:
+        """Unique ids of the sources `dbt ls --resource-type source <list_args>` lists"""
+        selection = parse_list_args(list_args)
+        selected = (
+            self.select(selection["select"]) if selection["select"] else set(self.nodes)
+        )
+        selected -= self.select(selection["exclude"])
+        return sorted(
+            unique_id
+            for unique_id in selected
+            if self.nodes.get(unique_id, {}).get("resource_type") == "source"
+        )
+
+    def select(self, specs: List[str]) -> Set[str]:
+        """Nodes selected by space-separated (union) specs, each maybe intersected with commas"""
+        selected = set()
+        for spec in specs:
+            for union_member in spec.split():
+                intersection = None
+                for criterion in union_member.split(","):
+                    criterion_nodes = self._select_criterion(criterion)
+                    intersection = (
+                        criterion_nodes
+                        if intersection is None
+                        else intersection & criterion_nodes
+                    )
+                selected |= intersection or set()
+        return selected
+
+    def _select_criterion(self, criterion: str) -> Set[str]:
+        match = CRITERION_PATTERN.match(criterion)
+        value = match.group("value")
+        if ":" in value:
+            method, value = value.split(":", 1)
+        elif "/" in value or value.endswith((".sql", ".py", ".csv", ".yml")):
+            method = "path"
+        else:
+            method = "fqn"
+        selected = {
+            unique_id
+            for unique_id, node in self.nodes.items()
+            if self._matches(method, value, node)
+        }
+
+        result = set(selected)
+        if match.group("childrens_parents"):
+            descendants = self._walk(selected, self.child_map, None)
+            result |= descendants | self._walk(descendants | selected, self.parent_map)
+            return result
+        if match.group("parents"):
+            result |= self._walk(
+                selected, self.parent_map, _depth(match.group("parents_depth"))
+            )
+        if match.group("children"):
+            result |= self._walk(
+                selected, self.child_map, _depth(match.group("children_depth"))
+            )
+        return result
+
+    def _walk(
+        self, start: Set[str], edges: Dict[str, List[str]], depth: Optional[int] = None
+    ) -> Set[str]:
+        visited = set()
+        frontier = set(start)
+        while frontier and (depth is None or depth > 0):
+            frontier = {
+                neighbor
+                for unique_id in frontier
+                for neighbor in edges.get(unique_id, [])
+                if neighbor not in visited
+            }
+            visited |= frontier
+            depth = None if depth is None else depth - 1
+        return visited
+
+    def _matches(self, method: str, value: str, node: Dict[str, Any]) -> bool:
+        if method == "fqn":
+            return _fqn_matches(value, node)
+        if method == "tag":
+            return any(fnmatch(tag, value) for tag in node.get("tags", []))
+        if method == "source":
+            return node.get("resource_type") == "source" and _source_matches(
+                value, node
+            )
+        if method in ("path", "file"):
+            node_path = node.get("original_file_path", "")
+            if method == "file":
+                return fnmatch(Path(node_path).name, value) or (
+                    Path(node_path).stem == value
+                )
+            value = value.rstrip("/")
+            return fnmatch(node_path, value) or node_path.startswith(f"{value}/")
+        if method == "package":
+            return fnmatch(node.get("package_name", ""), value)
+        if method == "resource_type":
+            return node.get("resource_type") == value
+        if method.startswith("config."):
+            config_value = node.get("config", {}).get(method[len("config.") :])
+            if isinstance(config_value, list):
+                return any(str(item) == value for item in config_value)
+            if config_value is None:
+                return False
+            return str(config_value).lower() == value.lower()
+        raise UnsupportedSelectionException(f"Unsupported selection method {method}")
+
+
+def _depth(depth: str) -> Optional[int]:
+    return int(depth) if depth else None
+
+
+def _fqn_prefix_matches(parts: List[str], fqn: List[str]) -> bool:
+    if len(parts) > len(fqn):
+        return False
+    for part, fqn_part in zip(parts, fqn):
+        if part == "*":
+            return True
+        if not fnmatch(fqn_part, part):
+            return False
+    return True
+
+
+def _fqn_matches(value: str, node: Dict[str, Any]) -> bool:
+    # Like dbt, sources aren't selected by name, i.e. `dbt ls -s my_table`
+    fqn = node.get("fqn", [])
+    if not fqn or node.get("resource_type") == "source":
+        return False
+    if fqn[-1] == value:
+        return True
+    parts = value.split(".")
+    # With or without the project name, i.e. `my_project.staging` or `staging`
+    return _fqn_prefix_matches(parts, fqn) or _fqn_prefix_matches(parts, fqn[1:])
+
+
+def _source_matches(value: str, node: Dict[str, Any]) -> bool:
+    parts = value.split(".")
+    candidates = (
+        [node.get("source_name", "")],
+        [node.get("source_name", ""), node.get("name", "")],
+        [
+            node.get("package_name", ""),
+            node.get("source_name", ""),
+            node.get("name", ""),
+        ],
+    )
+    return any(
+        len(parts) == len(candidate)
+        and all(fnmatch(actual, part) for actual, part in zip(candidate, parts))
+        for candidate in candidates
+    )
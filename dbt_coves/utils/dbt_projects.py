@@ -0,0 +1,98 @@
+"""
+Per-run registry of the dbt commands run to prepare dbt projects.
+
+dbt-backed generators that need `dbt deps` or `dbt compile` run them through the
+current registry, so each project (and virtual environment) is prepared once per
+run, however many generators use it, and they all share the resulting manifest.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+
+from dbt_coves.utils.hashing import canonical_hash
+
+_registry = None
+
+# Seconds between checks of a step being run by another thread or process
+STEP_WAIT_INTERVAL = 0.1
+
+
+class DbtProjectRegistry:
+    def __init__(self):
+        # Steps already run, by hash of the project path, virtualenv and step
+        self.steps_run = {}
+        # Steps being run, by the same hash. The lock only guards both dicts, so
+        # steps of different projects run concurrently
+        self.steps_running = {}
+        self.lock = threading.Lock()
+
+    def share(self, manager):
+        """
+        Share the steps run through a multiprocessing `manager`, so worker processes
+        prepare each project once for all of them
+        """
+        self.steps_run = manager.dict(self.steps_run)
+        self.steps_running = manager.dict(self.steps_running)
+        self.lock = manager.Lock()
+
+    def unshare(self):
+        """Stop sharing the steps run, before the multiprocessing manager shuts down"""
+        self.steps_run = dict(self.steps_run)
+        self.steps_running = dict(self.steps_running)
+        self.lock = threading.Lock()
+
+    def prepare(
+        self,
+        project_path: Union[str, Path],
+        virtualenv_path: Optional[Union[str, Path]],
+        steps: Iterable[str],
+        run_step: Callable[[str], None],
+    ):
+        """
+        Run each of `steps` (i.e. "deps", "compile") with `run_step`, unless it was
+        already run for the project in this run. If it's being run by another
+        caller, wait for it instead. A failing step is retried by the next caller
+        """
+        for step in steps:
+            key = canonical_hash([str(project_path), str(virtualenv_path), step])
+            while not self._run_step_once(key, step, run_step):
+                time.sleep(STEP_WAIT_INTERVAL)
+
+    def _run_step_once(self, key: str, step: str, run_step: Callable[[str], None]):
+        """
+        Run `step` unless it was already run. False if another caller is running it
+        """
+        with self.lock:
+            if key in self.steps_run:
+                return True
+            if key in self.steps_running:
+                return False
+            self.steps_running[key] = True
+        try:
+            run_step(step)
+            self.steps_run[key] = True
+        finally:
+            with self.lock:
+                self.steps_running.pop(key, None)
+        return True
+
+
+def start_registry() -> DbtProjectRegistry:
+    """Start a new registry, i.e. at the beginning of a run"""
+    return set_registry(DbtProjectRegistry())
+
+
+def set_registry(registry: DbtProjectRegistry) -> DbtProjectRegistry:
+    global _registry
+    _registry = registry
+    return registry
+
+
+def get_registry() -> DbtProjectRegistry:
+    """The current run's registry"""
+    global _registry
+    if _registry is None:
+        _registry = DbtProjectRegistry()
+    return _registry
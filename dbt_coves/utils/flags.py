@@ -87,6 +87,14 @@ class DbtCovesFlags:
                 "secrets_environment": None,
                 "secrets_tags": None,
                 "secrets_key": None,
+                "jobs": None,
+                "force": False,
+                "format_with_black": False,
+                "inventory_snapshot": None,
+                "manifest": None,
+                "profiling": False,
+                "profiling_report": None,
+                "profiling_cprofile": None,
             },
         }
         self.extract = {
@@ -114,6 +122,11 @@ class DbtCovesFlags:
                 "secrets_environment": None,
                 "secrets_tags": None,
                 "secrets_key": None,
+                "max_workers": None,
+                "plan": False,
+                "plan_file": None,
+                "apply_plan": None,
+                "allow_deletes": False,
             },
             "fivetran": {
                 "path": None,
@@ -127,6 +140,11 @@ class DbtCovesFlags:
                 "secrets_environment": None,
                 "secrets_tags": None,
                 "secrets_key": None,
+                "max_workers": None,
+                "plan": False,
+                "plan_file": None,
+                "apply_plan": None,
+                "allow_deletes": False,
             },
         }
         self.init = {
@@ -139,8 +157,36 @@ class DbtCovesFlags:
             "project_dir": None,
             "virtualenv": None,
             "cleanup": False,
+            "full_copy": False,
+        }
+        self.data_sync = {
+            "redshift": {
+                "tables": [],
+                "extract_workers": None,
+                "normalize_workers": None,
+                "load_workers": None,
+                "refresh_reflection": False,
+                "chunk_bytes": None,
+                "page_size": None,
+                "max_pages": None,
+                "detect_cursors": False,
+                "metrics_path": None,
+                "metrics_table": None,
+            },
+            "snowflake": {
+                "tables": [],
+                "extract_workers": None,
+                "normalize_workers": None,
+                "load_workers": None,
+                "refresh_reflection": False,
+                "chunk_bytes": None,
+                "page_size": None,
+                "max_pages": None,
+                "detect_cursors": False,
+                "metrics_path": None,
+                "metrics_table": None,
+            },
         }
-        self.data_sync = {"redshift": {"tables": []}, "snowflake": {"tables": []}}
         self.blue_green = {
             "prod_db_env_var": None,
             "staging_database": None,
@@ -349,6 +395,30 @@ class DbtCovesFlags:
                     )
                 if self.args.secrets_key:
                     self.generate["airflow_dags"]["secrets_key"] = self.args.secrets_key
+                if self.args.jobs:
+                    self.generate["airflow_dags"]["jobs"] = self.args.jobs
+                if self.args.force:
+                    self.generate["airflow_dags"]["force"] = self.args.force
+                if self.args.inventory_snapshot:
+                    self.generate["airflow_dags"]["inventory_snapshot"] = (
+                        self.args.inventory_snapshot
+                    )
+                if self.args.manifest:
+                    self.generate["airflow_dags"]["manifest"] = self.args.manifest
+                if self.args.format_with_black:
+                    self.generate["airflow_dags"]["format_with_black"] = (
+                        self.args.format_with_black
+                    )
+                if self.args.profiling:
+                    self.generate["airflow_dags"]["profiling"] = self.args.profiling
+                if self.args.profiling_report:
+                    self.generate["airflow_dags"]["profiling_report"] = (
+                        self.args.profiling_report
+                    )
+                if self.args.profiling_cprofile:
+                    self.generate["airflow_dags"]["profiling_cprofile"] = (
+                        self.args.profiling_cprofile
+                    )
 
             # load airbyte
             if self.args.cls.__name__ == "LoadAirbyteTask":
@@ -376,6 +446,16 @@ class DbtCovesFlags:
                     ]
                 if self.args.secrets_key:
                     self.load["airbyte"]["secrets_key"] = self.args.secrets_key
+                if self.args.max_workers:
+                    self.load["airbyte"]["max_workers"] = self.args.max_workers
+                if self.args.plan:
+                    self.load["airbyte"]["plan"] = self.args.plan
+                if self.args.plan_file:
+                    self.load["airbyte"]["plan_file"] = self.args.plan_file
+                if self.args.apply_plan:
+                    self.load["airbyte"]["apply_plan"] = self.args.apply_plan
+                if self.args.allow_deletes:
+                    self.load["airbyte"]["allow_deletes"] = self.args.allow_deletes
 
             # load fivetran
             if self.args.cls.__name__ == "LoadFivetranTask":
@@ -405,6 +485,16 @@ class DbtCovesFlags:
                     ]
                 if self.args.secrets_key:
                     self.load["fivetran"]["secrets_key"] = self.args.secrets_key
+                if self.args.max_workers:
+                    self.load["fivetran"]["max_workers"] = self.args.max_workers
+                if self.args.plan:
+                    self.load["fivetran"]["plan"] = self.args.plan
+                if self.args.plan_file:
+                    self.load["fivetran"]["plan_file"] = self.args.plan_file
+                if self.args.apply_plan:
+                    self.load["fivetran"]["apply_plan"] = self.args.apply_plan
+                if self.args.allow_deletes:
+                    self.load["fivetran"]["allow_deletes"] = self.args.allow_deletes
 
             # extract airbyte
             if self.args.cls.__name__ == "ExtractAirbyteTask":
@@ -446,6 +536,8 @@ class DbtCovesFlags:
                     self.dbt["virtualenv"] = self.args.virtualenv
                 if self.args.cleanup:
                     self.dbt["cleanup"] = self.args.cleanup
+                if self.args.full_copy:
+                    self.dbt["full_copy"] = self.args.full_copy
 
             # data sync
             if self.args.cls.__name__ == "RedshiftDataSyncTask":
@@ -453,11 +545,53 @@ class DbtCovesFlags:
                     self.data_sync["redshift"]["tables"] = [
                         table.strip() for table in self.args.tables.split(",")
                     ]
+                for workers in ("extract_workers", "normalize_workers", "load_workers"):
+                    if getattr(self.args, workers):
+                        self.data_sync["redshift"][workers] = getattr(
+                            self.args, workers
+                        )
+                if self.args.refresh_reflection:
+                    self.data_sync["redshift"]["refresh_reflection"] = True
+                if self.args.chunk_bytes:
+                    self.data_sync["redshift"]["chunk_bytes"] = self.args.chunk_bytes
+                if self.args.page_size:
+                    self.data_sync["redshift"]["page_size"] = self.args.page_size
+                if self.args.max_pages:
+                    self.data_sync["redshift"]["max_pages"] = self.args.max_pages
+                if self.args.detect_cursors:
+                    self.data_sync["redshift"]["detect_cursors"] = True
+                if self.args.metrics_path:
+                    self.data_sync["redshift"]["metrics_path"] = self.args.metrics_path
+                if self.args.metrics_table:
+                    self.data_sync["redshift"]["metrics_table"] = (
+                        self.args.metrics_table
+                    )
             if self.args.cls.__name__ == "SnowflakeDataSyncTask":
                 if self.args.tables:
                     self.data_sync["snowflake"]["tables"] = [
                         table.strip() for table in self.args.tables.split(",")
                     ]
+                for workers in ("extract_workers", "normalize_workers", "load_workers"):
+                    if getattr(self.args, workers):
+                        self.data_sync["snowflake"][workers] = getattr(
+                            self.args, workers
+                        )
+                if self.args.refresh_reflection:
+                    self.data_sync["snowflake"]["refresh_reflection"] = True
+                if self.args.chunk_bytes:
+                    self.data_sync["snowflake"]["chunk_bytes"] = self.args.chunk_bytes
+                if self.args.page_size:
+                    self.data_sync["snowflake"]["page_size"] = self.args.page_size
+                if self.args.max_pages:
+                    self.data_sync["snowflake"]["max_pages"] = self.args.max_pages
+                if self.args.detect_cursors:
+                    self.data_sync["snowflake"]["detect_cursors"] = True
+                if self.args.metrics_path:
+                    self.data_sync["snowflake"]["metrics_path"] = self.args.metrics_path
+                if self.args.metrics_table:
+                    self.data_sync["snowflake"]["metrics_table"] = (
+                        self.args.metrics_table
+                    )
 
             # blue green
             if self.args.cls.__name__ == "BlueGreenTask":
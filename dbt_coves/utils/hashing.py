@@ -0,0 +1,21 @@
+"""Content hashing helpers used to detect unchanged files between runs."""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+
+def canonical_hash(object: Any) -> str:
+    """Hash of a JSON-serializable object that doesn't depend on key order or formatting"""
+    canonical = json.dumps(object, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def file_hash(path: Path) -> Optional[str]:
+    """Hash of a file's content, None if it can't be read"""
+    try:
+        with open(path, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    except OSError:
+        return None
@@ -0,0 +1,251 @@
+"""
+Timing profiles of `generate airflow-dags` runs.
+
+When profiling is enabled, code wrapped in `phase(name)` is timed per DAG and for
+the whole run, and HTTP requests and subprocesses are counted. Phases nest: each
+phase's time excludes the phases it contains, and the time of a DAG not spent in
+other phases is its "render" phase.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+COUNTERS = ("http_requests", "subprocesses")
+SLOWEST_DAGS = 10
+
+_profiler = None
+
+
+class RunProfiler:
+    def __init__(self, cprofile=False):
+        self.started = time.perf_counter()
+        self.seconds = None
+        self.phases = {}
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.dags = {}
+        self.cprofile = cprofile
+        self.cprofile_paths = []
+        self._stack = []
+        self._dag = None
+        self._patched = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the code run within it as phase `name`"""
+        frame = {"started": time.perf_counter(), "children": 0.0}
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame["started"]
+            if self._stack:
+                self._stack[-1]["children"] += elapsed
+            self._add_phase(self.phases, name, elapsed - frame["children"])
+            if self._dag is not None:
+                self._add_phase(self._dag["phases"], name, elapsed - frame["children"])
+
+    @contextmanager
+    def dag(self, name: str):
+        """Time a DAG's generation, and its phases and counters separately"""
+        self._dag = {
+            "seconds": 0.0,
+            "phases": {},
+            "counters": dict.fromkeys(COUNTERS, 0),
+        }
+        profile = cProfile.Profile() if self.cprofile else None
+        started = time.perf_counter()
+        try:
+            if profile:
+                profile.enable()
+            # Whatever isn't in other phases is building the DAG's code
+            with self.phase("render"):
+                yield self._dag
+        finally:
+            if profile:
+                profile.disable()
+                self.cprofile_paths.append(self._dump_profile(profile))
+            self._dag["seconds"] = time.perf_counter() - started
+            self.dags[name] = self._dag
+            self._dag = None
+
+    def count(self, counter: str):
+        self.counters[counter] += 1
+        if self._dag is not None:
+            self._dag["counters"][counter] += 1
+
+    def add_dag(self, name: str, dag: Dict[str, Any], cprofile_path=None):
+        """Add a DAG profiled by another process (a `--jobs` worker)"""
+        self.dags[name] = dag
+        for name, phase in dag["phases"].items():
+            self._add_phase(self.phases, name, phase["seconds"], phase["calls"])
+        for counter, count in dag["counters"].items():
+            self.counters[counter] += count
+        if cprofile_path:
+            self.cprofile_paths.append(cprofile_path)
+
+    def install_hooks(self):
+        """Count HTTP requests and subprocesses"""
+        send = requests.Session.send
+        popen_init = subprocess.Popen.__init__
+        profiler = self
+
+        def counted_send(session, *args, **kwargs):
+            profiler.count("http_requests")
+            return send(session, *args, **kwargs)
+
+        def counted_popen_init(popen, *args, **kwargs):
+            profiler.count("subprocesses")
+            return popen_init(popen, *args, **kwargs)
+
+        self._patched = {
+            (requests.Session, "send"): send,
+            (subprocess.Popen, "__init__"): popen_init,
+        }
+        requests.Session.send = counted_send
+        subprocess.Popen.__init__ = counted_popen_init
+
+    def uninstall_hooks(self):
+        for (owner, attribute), original in self._patched.items():
+            setattr(owner, attribute, original)
+        self._patched = {}
+
+    def stop(self):
+        self.uninstall_hooks()
+        self.seconds = time.perf_counter() - self.started
+
+    def report(self) -> Dict[str, Any]:
+        seconds = self.seconds or (time.perf_counter() - self.started)
+        return {
+            "seconds": seconds,
+            "counters": self.counters,
+            "phases": dict(
+                sorted(
+                    self.phases.items(),
+                    key=lambda phase: phase[1]["seconds"],
+                    reverse=True,
+                )
+            ),
+            "dags": self.dags,
+        }
+
+    def print_summary(self):
+        report = self.report()
+        phases_table = Table(title="generate airflow-dags profile")
+        for column in ("Phase", "Seconds", "%", "Calls"):
+            phases_table.add_column(
+                column, justify="left" if column == "Phase" else "right"
+            )
+        dags_seconds = sum(phase["seconds"] for phase in report["phases"].values())
+        for name, phase in report["phases"].items():
+            phases_table.add_row(
+                name,
+                f"{phase['seconds']:.3f}",
+                f"{100 * phase['seconds'] / dags_seconds:.1f}" if dags_seconds else "",
+                str(phase["calls"]),
+            )
+        console.print(phases_table)
+
+        dags_table = Table(title=f"Slowest DAGs (of {len(report['dags'])})")
+        for column in ("DAG", "Seconds", "Slowest phase", *COUNTERS):
+            dags_table.add_column(
+                column, justify="left" if column == "DAG" else "right"
+            )
+        slowest = sorted(
+            report["dags"].items(), key=lambda dag: dag[1]["seconds"], reverse=True
+        )
+        for name, dag in slowest[:SLOWEST_DAGS]:
+            slowest_phase = max(
+                dag["phases"].items(),
+                key=lambda phase: phase[1]["seconds"],
+                default=("", None),
+            )[0]
+            dags_table.add_row(
+                Path(name).stem,
+                f"{dag['seconds']:.3f}",
+                slowest_phase,
+                *[str(dag["counters"][counter]) for counter in COUNTERS],
+            )
+        console.print(dags_table)
+        console.print(
+            f"Total: {report['seconds']:.3f}s, "
+            + ", ".join(
+                f"{count} {counter.replace('_', ' ')}"
+                for counter, count in report["counters"].items()
+            )
+        )
+
+    def write_report(self, report_path: Path):
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, "w") as report_file:
+            json.dump(self.report(), report_file, indent=4)
+        console.print(f"Profile report written to {report_path}")
+
+    def write_cprofile(self, cprofile_path: Path):
+        """Merge DAGs' cProfile stats into `cprofile_path`, readable with pstats"""
+        if not self.cprofile_paths:
+            return
+        stats = pstats.Stats(*self.cprofile_paths)
+        cprofile_path.parent.mkdir(parents=True, exist_ok=True)
+        stats.dump_stats(cprofile_path)
+        for path in self.cprofile_paths:
+            os.remove(path)
+        self.cprofile_paths = []
+        console.print(f"cProfile stats written to {cprofile_path}")
+
+    def _add_phase(self, phases, name, seconds, calls=1):
+        phase = phases.setdefault(name, {"seconds": 0.0, "calls": 0})
+        phase["seconds"] += seconds
+        phase["calls"] += calls
+
+    def _dump_profile(self, profile: cProfile.Profile) -> str:
+        file_descriptor, path = tempfile.mkstemp(prefix="dbt_coves_", suffix=".prof")
+        os.close(file_descriptor)
+        profile.dump_stats(path)
+        return path
+
+
+def start_profiler(cprofile=False) -> RunProfiler:
+    """Start profiling, until `stop_profiler()`"""
+    global _profiler
+    _profiler = RunProfiler(cprofile=cprofile)
+    _profiler.install_hooks()
+    return _profiler
+
+
+def stop_profiler() -> Optional[RunProfiler]:
+    global _profiler
+    profiler = _profiler
+    _profiler = None
+    if profiler:
+        profiler.stop()
+    return profiler
+
+
+def get_profiler() -> Optional[RunProfiler]:
+    """The active profiler, None if not profiling"""
+    return _profiler
+
+
+def phase(name: str):
+    """Time the code run within it as phase `name`, if profiling"""
+    return _profiler.phase(name) if _profiler else nullcontext()
+
+
+def dag(name: str):
+    """Profile a DAG's generation separately, if profiling"""
+    return _profiler.dag(name) if _profiler else nullcontext()
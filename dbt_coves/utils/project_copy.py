@@ -0,0 +1,136 @@
+"""
+Writable copies of read-only dbt projects.
+
+Instead of copying the whole project, an overlay is created: the project's
+directories are symlinked, its top-level files (`dbt_project.yml`, `packages.yml`,
+`package-lock.yml`...) are copied, and the directories dbt writes to get their own
+writable directory: `target/` (with its top-level files, i.e. the manifest and
+partial parse file), an empty `logs/` and `dbt_packages/` (with installed packages
+symlinked, as `dbt deps` replaces them rather than writing into them).
+
+Copies of git projects are cached by commit in the temp directory, so they're
+reused across invocations. If an overlay can't be created, the whole project is
+copied instead.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+from rich.console import Console
+
+from dbt_coves.utils.hashing import canonical_hash
+
+console = Console()
+
+# Directories dbt writes to, or replaces
+TARGET_DIRS = ("target",)
+LOG_DIRS = ("logs",)
+PACKAGE_DIRS = ("dbt_packages", "dbt_modules")
+CACHE_DIR_NAME = "dbt_coves_project_copies"
+
+
+def project_commit(project_dir: Union[str, Path]) -> str:
+    """The git commit checked out in `project_dir`, "" if it's not a git repository"""
+    try:
+        process = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=project_dir,
+        )
+    except OSError:
+        return ""
+    return process.stdout.strip() if process.returncode == 0 else ""
+
+
+def cached_copy_path(project_dir: Union[str, Path]) -> Optional[Path]:
+    """Where the copy of `project_dir` is cached, None if it can't be (no git commit)"""
+    project_dir = Path(project_dir).resolve()
+    commit = project_commit(project_dir)
+    if not commit:
+        return None
+    key = canonical_hash([str(project_dir), commit])[:16]
+    return Path(tempfile.gettempdir()) / CACHE_DIR_NAME / f"{project_dir.name}-{key}"
+
+
+def create_writable_copy(
+    project_dir: Union[str, Path], copy_path: Union[str, Path], full_copy=False
+) -> Path:
+    """
+    Create a writable copy of `project_dir` at `copy_path`, an overlay unless
+    `full_copy`. The copy is built aside and moved in place once complete, so
+    concurrent callers never see a partial copy
+    """
+    project_dir = Path(project_dir).resolve()
+    copy_path = Path(copy_path)
+    copy_path.parent.mkdir(parents=True, exist_ok=True)
+    build_path = Path(
+        tempfile.mkdtemp(prefix=f".{copy_path.name}-", dir=copy_path.parent)
+    )
+    try:
+        if not full_copy:
+            try:
+                _create_overlay(project_dir, build_path)
+            except OSError as e:
+                console.print(
+                    f"Couldn't create an overlay of {project_dir} ({e}), copying it"
+                )
+                full_copy = True
+        if full_copy:
+            shutil.rmtree(build_path)
+            shutil.copytree(
+                project_dir,
+                build_path,
+                symlinks=True,
+                copy_function=shutil.copyfile,
+            )
+        try:
+            os.rename(build_path, copy_path)
+        except OSError:
+            # Someone else created it meanwhile
+            if not copy_path.exists():
+                raise
+    finally:
+        shutil.rmtree(build_path, ignore_errors=True)
+    return copy_path
+
+
+def writable_copy(project_dir: Union[str, Path], full_copy=False) -> Optional[Path]:
+    """
+    Cached writable copy of a git `project_dir`, created if missing.
+    None if the project can't be cached
+    """
+    copy_path = cached_copy_path(project_dir)
+    if copy_path is None:
+        return None
+    if not copy_path.exists():
+        console.print(f"Creating a writable copy of {project_dir} in {copy_path}")
+        create_writable_copy(project_dir, copy_path, full_copy=full_copy)
+    return copy_path
+
+
+def _create_overlay(project_dir: Path, overlay_path: Path):
+    for entry in os.scandir(project_dir):
+        source = Path(entry.path)
+        destination = overlay_path / entry.name
+        if entry.name in LOG_DIRS:
+            destination.mkdir()
+        elif entry.name in TARGET_DIRS and entry.is_dir(follow_symlinks=False):
+            destination.mkdir()
+            # Compiled and run SQL are regenerated
+            for target_entry in os.scandir(source):
+                if target_entry.is_file(follow_symlinks=False):
+                    shutil.copyfile(target_entry.path, destination / target_entry.name)
+        elif entry.name in PACKAGE_DIRS and entry.is_dir(follow_symlinks=False):
+            destination.mkdir()
+            for package in os.scandir(source):
+                os.symlink(package.path, destination / package.name)
+        elif entry.is_file(follow_symlinks=False):
+            # Writable, even if the project's files aren't
+            shutil.copyfile(source, destination)
+        else:
+            os.symlink(source, destination)
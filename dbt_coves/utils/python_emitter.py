@@ -0,0 +1,436 @@
+"""
+Deterministic Python source emitter for generated code.
+
+The source is parsed and printed back with a black-like layout (double quotes,
+88 columns, exploded brackets with trailing commas, blank lines around functions)
+and its leading imports merged and sorted in isort-like sections. It's a fraction
+of the cost of running black and isort on every generated file.
+"""
+
+import ast
+import io
+import sys
+import tokenize
+from typing import Dict, List, Optional, Tuple
+
+LINE_LENGTH = 88
+INDENT_WIDTH = 4
+IMPORT_SECTIONS = ("future", "stdlib", "thirdparty", "localfolder")
+STDLIB_MODULES = set(sys.stdlib_module_names)
+
+# (prefix, node) pairs rendered inside brackets, i.e. ("key=", <value node>)
+BracketItem = Tuple[str, ast.expr]
+
+
+def emit_python(source: str, line_length: int = LINE_LENGTH) -> str:
+    """Return `source` formatted and with sorted imports. Raises SyntaxError if invalid."""
+    return _Emitter(source, line_length).emit()
+
+
+def _import_section(module: str, level: int) -> str:
+    if level:
+        return "localfolder"
+    top_level = module.split(".")[0]
+    if top_level == "__future__":
+        return "future"
+    if top_level in STDLIB_MODULES:
+        return "stdlib"
+    return "thirdparty"
+
+
+def _imported_name_key(name: str) -> Tuple[int, str, str]:
+    # CONSTANTS, then Classes, then functions and modules
+    if name.isupper() and len(name) > 1:
+        rank = 0
+    elif name[:1].isupper():
+        rank = 1
+    else:
+        rank = 2
+    return (rank, name.lower(), name)
+
+
+def _from_import_lines(module: str, names: List[str], line_length: int) -> List[str]:
+    line = f"from {module} import {', '.join(names)}"
+    if len(line) <= line_length:
+        return [line]
+    indent = " " * INDENT_WIDTH
+    return [f"from {module} import (", *[f"{indent}{name}," for name in names], ")"]
+
+
+def sorted_imports(nodes: List[ast.stmt], line_length: int = LINE_LENGTH) -> List[str]:
+    """Merge and sort import statements into sections separated by a blank line"""
+    plain_imports = {section: set() for section in IMPORT_SECTIONS}
+    from_imports = {section: {} for section in IMPORT_SECTIONS}
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                section = _import_section(alias.name, 0)
+                plain_imports[section].add((alias.name, alias.asname or ""))
+        else:
+            module = "." * node.level + (node.module or "")
+            section = _import_section(node.module or "", node.level)
+            imported = from_imports[section].setdefault(module, (set(), set()))
+            for alias in node.names:
+                if alias.asname:
+                    imported[1].add((alias.name, alias.asname))
+                else:
+                    imported[0].add(alias.name)
+
+    lines = []
+    for section in IMPORT_SECTIONS:
+        section_lines = []
+        for module, asname in sorted(
+            plain_imports[section], key=lambda imp: (imp[0].lower(), imp)
+        ):
+            section_lines.append(
+                f"import {module}" + (f" as {asname}" if asname else "")
+            )
+        for module in sorted(from_imports[section], key=lambda m: (m.lower(), m)):
+            names, aliases = from_imports[section][module]
+            if names:
+                section_lines.extend(
+                    _from_import_lines(
+                        module, sorted(names, key=_imported_name_key), line_length
+                    )
+                )
+            for name, asname in sorted(aliases):
+                section_lines.extend(
+                    _from_import_lines(module, [f"{name} as {asname}"], line_length)
+                )
+        if section_lines:
+            if lines:
+                lines.append("")
+            lines.extend(section_lines)
+    return lines
+
+
+def _string_literal(value: str) -> str:
+    # Prefer double quotes, as black does
+    literal = repr(value)
+    if literal.startswith("'") and '"' not in value:
+        literal = '"' + literal[1:-1].replace("\\'", "'") + '"'
+    return literal
+
+
+def _docstring_literal(value: str) -> str:
+    if '"""' in value or value.endswith('"'):
+        return _string_literal(value)
+    return '"""' + value.replace("\\", "\\\\") + '"""'
+
+
+def _is_docstring(node: ast.stmt) -> bool:
+    return (
+        isinstance(node, ast.Expr)
+        and isinstance(node.value, ast.Constant)
+        and isinstance(node.value.value, str)
+    )
+
+
+def _normalize_comment(comment: str) -> str:
+    if comment[1:2] not in ("", " ", "!", ":", "#"):
+        return "# " + comment[1:]
+    return comment.rstrip()
+
+
+def _collect_comments(source: str) -> Tuple[Dict[int, str], Dict[int, str]]:
+    """Standalone and trailing comments of `source`, by line number"""
+    standalone, trailing = {}, {}
+    source_lines = source.splitlines()
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if token.type != tokenize.COMMENT:
+            continue
+        row, column = token.start
+        comments = trailing if source_lines[row - 1][:column].strip() else standalone
+        comments[row] = _normalize_comment(token.string)
+    return standalone, trailing
+
+
+class _Emitter:
+    def __init__(self, source: str, line_length: int):
+        self.tree = ast.parse(source)
+        # AST column offsets are UTF-8 byte offsets
+        self.source_lines = [line.encode() for line in source.splitlines()]
+        self.line_length = line_length
+        self.standalone_comments, self.trailing_comments = _collect_comments(source)
+        self.lines: List[str] = []
+
+    def emit(self) -> str:
+        body = list(self.tree.body)
+        if body and _is_docstring(body[0]):
+            docstring = body.pop(0)
+            self._emit_standalone_comments(docstring.lineno, "")
+            self.lines.append(self._docstring(docstring))
+        imports = []
+        while body and isinstance(body[0], (ast.Import, ast.ImportFrom)):
+            imports.append(body.pop(0))
+        if imports:
+            self._blank_lines(1)
+            self._emit_standalone_comments(imports[-1].end_lineno + 1, "")
+            self.lines.extend(sorted_imports(imports, self.line_length))
+            for node in imports:
+                self._pop_trailing_comments(node.lineno, node.end_lineno)
+        self._emit_block(body, 0)
+        self._emit_standalone_comments(sys.maxsize, "")
+        while self.lines and not self.lines[-1]:
+            self.lines.pop()
+        return "\n".join(self.lines) + "\n" if self.lines else ""
+
+    # Layout
+
+    def _blank_lines(self, count: int):
+        if not self.lines:
+            return
+        while self.lines and not self.lines[-1]:
+            self.lines.pop()
+        self.lines.extend([""] * count)
+
+    def _emit_block(self, statements: List[ast.stmt], depth: int):
+        indent = " " * (INDENT_WIDTH * depth)
+        previous_is_def = False
+        for position, statement in enumerate(statements):
+            is_def = isinstance(
+                statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+            )
+            if depth == 0:
+                if position == 0:
+                    self._blank_lines(2 if is_def else 1)
+                elif is_def or previous_is_def:
+                    self._blank_lines(2)
+                else:
+                    self._blank_lines(min(2, self._source_blank_lines(statement)))
+            elif position and (is_def or previous_is_def):
+                self._blank_lines(1)
+            elif position:
+                self._blank_lines(min(1, self._source_blank_lines(statement)))
+            self._emit_standalone_comments(self._first_line(statement), indent)
+            if position == 0 and depth and _is_docstring(statement):
+                self.lines.append(indent + self._docstring(statement))
+            else:
+                self._emit_statement(statement, depth)
+            previous_is_def = is_def
+
+    def _docstring(self, statement: ast.Expr) -> str:
+        # Triple-quoted docstrings are kept verbatim, escapes included
+        value = statement.value
+        segment = self._source(
+            value.lineno, value.col_offset, value.end_lineno, value.end_col_offset
+        )
+        if segment.startswith('"""'):
+            return segment
+        return _docstring_literal(statement.value.value)
+
+    def _source(self, lineno: int, col: int, end_lineno: int, end_col: int) -> str:
+        """Source code between two AST positions"""
+        if lineno == end_lineno:
+            return self.source_lines[lineno - 1][col:end_col].decode()
+        return b"\n".join(
+            [
+                self.source_lines[lineno - 1][col:],
+                *self.source_lines[lineno : end_lineno - 1],
+                self.source_lines[end_lineno - 1][:end_col],
+            ]
+        ).decode()
+
+    def _source_blank_lines(self, statement: ast.stmt) -> int:
+        """Blank lines right before `statement` in the source"""
+        row = self._first_line(statement) - 2
+        blank_lines = 0
+        while row >= 0 and not self.source_lines[row].strip():
+            blank_lines += 1
+            row -= 1
+        return blank_lines
+
+    def _first_line(self, statement: ast.stmt) -> int:
+        decorators = getattr(statement, "decorator_list", [])
+        return min([statement.lineno, *[d.lineno for d in decorators]])
+
+    # Comments
+
+    def _emit_standalone_comments(self, before_line: int, indent: str):
+        for row in sorted(self.standalone_comments):
+            if row >= before_line:
+                break
+            self.lines.append(indent + self.standalone_comments.pop(row))
+
+    def _pop_trailing_comments(self, first_line: int, last_line: int) -> str:
+        comments = [
+            self.trailing_comments.pop(row)
+            for row in range(first_line, last_line + 1)
+            if row in self.trailing_comments
+        ]
+        return "  " + " ".join(comments) if comments else ""
+
+    # Statements
+
+    def _emit_statement(self, statement: ast.stmt, depth: int):
+        indent = " " * (INDENT_WIDTH * depth)
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            self._emit_function(statement, depth)
+            return
+        # Rendered expressions are already indented past their first line
+        indent_all_lines = False
+        if isinstance(statement, ast.Assign):
+            targets = "".join(f"{self._flat(t)} = " for t in statement.targets)
+            code = targets + self._expr(
+                statement.value, len(indent), len(indent) + len(targets)
+            )
+        elif isinstance(statement, ast.Expr):
+            code = self._expr(statement.value, len(indent), len(indent))
+        elif isinstance(statement, ast.Return) and statement.value is not None:
+            code = "return " + self._expr(
+                statement.value, len(indent), len(indent) + len("return ")
+            )
+        elif isinstance(statement, (ast.Import, ast.ImportFrom)):
+            code = "\n".join(
+                sorted_imports([statement], self.line_length - len(indent))
+            )
+            indent_all_lines = True
+        else:
+            # Anything else is printed as-is, i.e. classes or control flow statements
+            code = ast.unparse(statement)
+            indent_all_lines = True
+        code_lines = code.split("\n")
+        code_lines[-1] += self._pop_trailing_comments(
+            statement.lineno, statement.end_lineno
+        )
+        self.lines.append(indent + code_lines[0])
+        self.lines.extend(
+            indent + line if line and indent_all_lines else line
+            for line in code_lines[1:]
+        )
+
+    def _emit_function(self, function: ast.FunctionDef, depth: int):
+        indent = " " * (INDENT_WIDTH * depth)
+        for decorator in function.decorator_list:
+            decorator_code = self._expr(decorator, len(indent), len(indent) + 1)
+            self.lines.append(f"{indent}@{decorator_code}")
+        prefix = "async def" if isinstance(function, ast.AsyncFunctionDef) else "def"
+        header = f"{prefix} {function.name}({ast.unparse(function.args)})"
+        if function.returns is not None:
+            header += f" -> {ast.unparse(function.returns)}"
+        header += ":" + self._pop_trailing_comments(
+            self._first_line(function), function.body[0].lineno - 1
+        )
+        self.lines.append(indent + header)
+        self._emit_block(function.body, depth + 1)
+
+    # Expressions
+
+    def _flat(self, node: ast.expr) -> str:
+        """Single-line rendering of an expression"""
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, str):
+                return _string_literal(node.value)
+            return ast.unparse(node)
+        if isinstance(node, ast.Name):
+            return node.id
+        if isinstance(node, ast.Attribute) and isinstance(
+            node.value, (ast.Name, ast.Attribute, ast.Call)
+        ):
+            return f"{self._flat(node.value)}.{node.attr}"
+        items = self._bracket_items(node)
+        if items is not None:
+            opener, closer = self._brackets(node)
+            content = ", ".join(prefix + self._flat(item) for prefix, item in items)
+            if isinstance(node, ast.Tuple) and len(items) == 1:
+                content += ","
+            return f"{opener}{content}{closer}"
+        return ast.unparse(node)
+
+    def _brackets(self, node: ast.expr) -> Tuple[str, str]:
+        if isinstance(node, ast.Call):
+            return f"{self._flat(node.func)}(", ")"
+        if isinstance(node, ast.List):
+            return "[", "]"
+        if isinstance(node, ast.Tuple):
+            return "(", ")"
+        return "{", "}"
+
+    def _bracket_items(self, node: ast.expr) -> Optional[List[BracketItem]]:
+        """Items of a call or a collection display, None if `node` isn't one"""
+        simple = (ast.Name, ast.Attribute, ast.Call, ast.Constant, ast.Subscript)
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, (ast.Name, ast.Attribute, ast.Call)):
+                return None
+            items = []
+            for arg in node.args:
+                if isinstance(arg, ast.GeneratorExp):
+                    return None
+                if isinstance(arg, ast.Starred):
+                    if not isinstance(arg.value, simple):
+                        return None
+                    items.append(("*", arg.value))
+                else:
+                    items.append(("", arg))
+            for keyword in node.keywords:
+                if keyword.arg is None and not isinstance(keyword.value, simple):
+                    return None
+                prefix = "**" if keyword.arg is None else f"{keyword.arg}="
+                items.append((prefix, keyword.value))
+            return items
+        if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            if any(isinstance(element, ast.Starred) for element in node.elts):
+                return None
+            return [("", element) for element in node.elts]
+        if isinstance(node, ast.Dict):
+            items = []
+            for key, value in zip(node.keys, node.values):
+                if key is None:
+                    if not isinstance(value, simple):
+                        return None
+                    items.append(("**", value))
+                else:
+                    items.append((f"{self._flat(key)}: ", value))
+            return items
+        return None
+
+    def _has_magic_trailing_comma(
+        self, node: ast.expr, items: List[BracketItem]
+    ) -> bool:
+        """Whether the source ends the items with a comma, which keeps them exploded"""
+        if isinstance(node, ast.Tuple) and len(items) == 1:
+            return False
+        last_item = items[-1][1]
+        between = self._source(
+            last_item.end_lineno,
+            last_item.end_col_offset,
+            node.end_lineno,
+            node.end_col_offset,
+        )
+        return "," in between.split("#")[0]
+
+    def _expr(self, node: ast.expr, indent: int, column: int, trailer: int = 0) -> str:
+        """
+        Render an expression starting at `column` of a line indented `indent` columns,
+        followed by `trailer` characters. Brackets are split when they don't fit or
+        when the source ends their items with a comma.
+        """
+        items = self._bracket_items(node)
+        magic_trailing_comma = bool(items) and self._has_magic_trailing_comma(
+            node, items
+        )
+        flat = self._flat(node)
+        if (
+            not magic_trailing_comma
+            and column + len(flat) + trailer <= self.line_length
+        ):
+            return flat
+        if not items:
+            return flat
+        opener, closer = self._brackets(node)
+        inner = indent + INDENT_WIDTH
+        closing_line = " " * indent + closer
+        if not magic_trailing_comma:
+            hugged = ", ".join(prefix + self._flat(item) for prefix, item in items)
+            single_tuple = isinstance(node, ast.Tuple) and len(items) == 1
+            if inner + len(hugged) <= self.line_length and not single_tuple:
+                return f"{opener}\n{' ' * inner}{hugged}\n{closing_line}"
+            if len(items) == 1 and not single_tuple:
+                prefix, item = items[0]
+                rendered = self._expr(item, inner, inner + len(prefix))
+                return f"{opener}\n{' ' * inner}{prefix}{rendered}\n{closing_line}"
+        lines = [
+            " " * inner + prefix + self._expr(item, inner, inner + len(prefix), 1) + ","
+            for prefix, item in items
+        ]
+        return "\n".join([opener, *lines, closing_line])
@@ -1,5 +1,6 @@
 import os
 import re
+from typing import Any, Dict, List, Optional, Union
 
 import requests
 
@@ -46,27 +47,47 @@ def load_secret_manager_data(task_instance) -> dict:
     raise DbtCovesException(f"'{manager}' not recognized as a valid secrets manager.")
 
 
-def replace_secrets(secrets_list, dictionary, errors: set = set()):
+def index_secrets(secrets_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Secrets manager values by slug, so templated values don't scan the whole list"""
+    return {secret.get("slug", ""): secret.get("value") for secret in secrets_list}
+
+
+def _replace_secrets(secrets_index, dictionary, errors):
     for key, value in dictionary.items():
         if isinstance(value, dict):
-            replace_secrets(secrets_list, value, errors)
+            _replace_secrets(secrets_index, value, errors)
         elif isinstance(value, str):
             value_secret = SECRET_PATTERN.search(value)
             if value_secret:
                 secret_key = value_secret.group(1)
-                secret_found = False
-                for secret in secrets_list:
-                    if secret.get("slug", "").lower() == secret_key.lower():
-                        secret_found = True
-                        if secret.get("slug", "") == secret_key:
-                            dictionary[key] = secret.get("value")
-                        else:
-                            errors.add(
-                                f"Secret [red]{secret_key}[/red] not found in secrets, "
-                                f"did you mean [red]{secret.get('slug')}[/red]"
-                            )
-                if not secret_found:
+                if secret_key in secrets_index:
+                    dictionary[key] = secrets_index[secret_key]
+                    continue
+                similar_slugs = [
+                    slug for slug in secrets_index if slug.lower() == secret_key.lower()
+                ]
+                for slug in similar_slugs:
+                    errors.add(
+                        f"Secret [red]{secret_key}[/red] not found in secrets, "
+                        f"did you mean [red]{slug}[/red]"
+                    )
+                if not similar_slugs:
                     errors.add(f"Secret [red]{secret_key}[/red] not found in secrets")
+
+
+def replace_secrets(
+    secrets: Union[List[Dict[str, Any]], Dict[str, Any]],
+    dictionary: Dict[str, Any],
+    errors: Optional[set] = None,
+):
+    """
+    Replace `{{ secret('slug') }}` values of `dictionary` in place.
+    `secrets` is the secrets manager list, or its `index_secrets` index.
+    """
+    if not isinstance(secrets, dict):
+        secrets = index_secrets(secrets)
+    errors = set() if errors is None else errors
+    _replace_secrets(secrets, dictionary, errors)
     if errors:
         error_message = "Errors found:\n"
         error_message += "\n".join(errors)
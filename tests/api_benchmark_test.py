@@ -0,0 +1,657 @@
+"""
+Tests and benchmarks for the API-bound commands (extract, load and generate
+airflow-dags) against local Airbyte and Fivetran stand-ins (see mock_api_server.py).
+
+Benchmarks run for 100 objects by default. Use these environment variables to tune them:
+- DBT_COVES_BENCHMARK_MAX_OBJECTS: largest workspace to benchmark (100, 1000 or 5000)
+- DBT_COVES_BENCHMARK_LATENCY: seconds every mocked request takes
+- DBT_COVES_BENCHMARK_RATE_LIMIT_EVERY: answer every N-th Fivetran request with a 429
+- DBT_COVES_BENCHMARK_REPORT: path of a JSON file where results are written
+
+i.e. `DBT_COVES_BENCHMARK_MAX_OBJECTS=5000 pytest -m benchmark tests/api_benchmark_test.py`
+"""
+
+import argparse
+import json
+import os
+import pstats
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+from mock_api_server import AirbyteMockApi, FivetranMockApi, MockApiServer
+
+from dbt_coves.core.main import _load_task, base_subparser, handle
+from dbt_coves.tasks.generate.airflow_generators import (
+    AirbyteGenerator,
+    FivetranGenerator,
+)
+from dbt_coves.tasks.generate.airflow_generators.airbyte import (
+    AirbyteGeneratorException,
+)
+from dbt_coves.tasks.generate.airflow_generators.fivetran import (
+    FivetranGeneratorException,
+)
+from dbt_coves.tasks.load.fivetran import FivetranLoaderException
+from dbt_coves.utils import api_caller, api_inventory
+
+BENCHMARK_SIZES = [100, 1000, 5000]
+MAX_OBJECTS = int(os.environ.get("DBT_COVES_BENCHMARK_MAX_OBJECTS", 100))
+LATENCY = float(os.environ.get("DBT_COVES_BENCHMARK_LATENCY", 0))
+RATE_LIMIT_EVERY = int(os.environ.get("DBT_COVES_BENCHMARK_RATE_LIMIT_EVERY", 0))
+REPORT_PATH = os.environ.get("DBT_COVES_BENCHMARK_REPORT")
+
+benchmark_results = []
+
+
+def run_dbt_coves(*cli_args):
+    """Run a dbt-coves command in-process, so it reaches the mocked APIs"""
+    parser = argparse.ArgumentParser(prog="dbt-coves")
+    sub_parsers = parser.add_subparsers(dest="task")
+    _load_task(cli_args[0]).register_parser(sub_parsers, base_subparser)
+    return handle(parser, [*cli_args, "--disable-tracking"])
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    # No .dbt_coves config is picked up from the repo
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def fivetran_server(monkeypatch):
+    def start(objects=100, **server_kwargs):
+        server = MockApiServer(FivetranMockApi(objects), **server_kwargs)
+        monkeypatch.setattr(
+            api_caller,
+            "FIVETRAN_API_ENDPOINTS",
+            {
+                name: endpoint.replace(
+                    api_caller.FIVETRAN_API_BASE_URL, f"{server.url}/v1"
+                )
+                for name, endpoint in api_caller.FIVETRAN_API_ENDPOINTS.items()
+            },
+        )
+        return server
+
+    return start
+
+
+@pytest.fixture(scope="module", autouse=True)
+def benchmark_report(pytestconfig):
+    yield
+    if not benchmark_results:
+        return
+    capture_manager = pytestconfig.pluginmanager.getplugin("capturemanager")
+    reporter = pytestconfig.pluginmanager.getplugin("terminalreporter")
+    with capture_manager.global_and_fixture_disabled():
+        reporter.write_line("")
+        reporter.write_line(
+            f"{'command':<32}{'objects':>8}{'seconds':>10}{'requests':>10}{'429s':>6}"
+        )
+        for result in benchmark_results:
+            reporter.write_line(
+                f"{result['command']:<32}{result['objects']:>8}"
+                f"{result['seconds']:>10.2f}{result['requests']:>10}"
+                f"{result['rate_limited']:>6}"
+            )
+    if REPORT_PATH:
+        with open(REPORT_PATH, "w") as report_file:
+            json.dump(benchmark_results, report_file, indent=4)
+
+
+def measure(command, objects, servers, *cli_args):
+    for server in servers:
+        server.reset_counts()
+    started = time.monotonic()
+    assert run_dbt_coves(*cli_args) == 0
+    result = {
+        "command": command,
+        "objects": objects,
+        "seconds": time.monotonic() - started,
+        "requests": sum(server.total_requests for server in servers),
+        "rate_limited": sum(server.rate_limited for server in servers),
+        "requests_by_route": {
+            route: count
+            for server in servers
+            for route, count in sorted(server.request_counts.items())
+        },
+    }
+    benchmark_results.append(result)
+    return result
+
+
+def benchmark_sizes():
+    return [
+        pytest.param(
+            size,
+            marks=pytest.mark.skipif(
+                size > MAX_OBJECTS,
+                reason="set DBT_COVES_BENCHMARK_MAX_OBJECTS to benchmark it",
+            ),
+        )
+        for size in BENCHMARK_SIZES
+    ]
+
+
+def airbyte_args(server):
+    host, port = server.url.rsplit(":", 1)
+    return ["--host", host, "--port", port]
+
+
+def test_airbyte_api_caller_paginates():
+    with MockApiServer(AirbyteMockApi(objects=250)) as server:
+        airbyte_api = api_caller.AirbyteApiCaller(server.url)
+
+        assert len(airbyte_api.sources_list) == 250
+        assert len(airbyte_api.connections_list) == 250
+        assert len(airbyte_api.destinations_list) == 2
+        assert (
+            server.request_counts[
+                "GET /api/public/v1/(?P<resource>sources|destinations|connections)"
+            ]
+            == 3 + 3 + 1
+        )
+
+
+def test_fivetran_api_caller_retries_rate_limited_calls(fivetran_server):
+    with fivetran_server(objects=50, rate_limit_every=7) as server:
+        fivetran_api = api_caller.FivetranApiCaller("key", "secret")
+
+        connectors = fivetran_api.fivetran_data["group_0"]["connectors"]
+        assert len(connectors) == 50
+        assert all(connector["schemas"] for connector in connectors.values())
+        assert server.rate_limited > 0
+
+
+def test_extract_airbyte_only_rewrites_changed_files(workdir):
+    extract_path = workdir / "airbyte"
+    connections_path = extract_path / "connections"
+    with MockApiServer(AirbyteMockApi(objects=20)) as server:
+        cli_args = ["extract", "airbyte", "--path", str(extract_path)]
+        assert run_dbt_coves(*cli_args, *airbyte_args(server)) == 0
+        for connection_file in connections_path.glob("*.json"):
+            os.utime(connection_file, (0, 0))
+        (connections_path / "deleted_connection.json").write_text("{}")
+
+        server.api.mutate(every=10)
+        assert run_dbt_coves(*cli_args, *airbyte_args(server)) == 0
+
+    rewritten = [
+        connection_file.name
+        for connection_file in sorted(connections_path.glob("*.json"))
+        if connection_file.stat().st_mtime > 0
+    ]
+    assert rewritten == [
+        "postgres_00000-warehouse_0.json",
+        "postgres_00010-warehouse_0.json",
+    ]
+    assert not (connections_path / "deleted_connection.json").exists()
+
+
+def test_load_airbyte_restores_drifted_objects(workdir):
+    extract_path = workdir / "airbyte"
+    with MockApiServer(AirbyteMockApi(objects=30)) as server:
+        assert (
+            run_dbt_coves(
+                "extract", "airbyte", "--path", str(extract_path), *airbyte_args(server)
+            )
+            == 0
+        )
+        server.api.mutate(every=10)
+        assert (
+            run_dbt_coves(
+                "load", "airbyte", "--path", str(extract_path), *airbyte_args(server)
+            )
+            == 0
+        )
+
+        objects = server.api.objects
+        assert {s["configuration"]["port"] for s in objects["sources"].values()} == {
+            5432
+        }
+        assert {c["status"] for c in objects["connections"].values()} == {"active"}
+        assert len(objects["connections"]) == 30
+
+
+def test_load_fivetran_restores_drifted_connectors(workdir, fivetran_server):
+    extract_path = workdir / "fivetran"
+    credentials = ["--api-key", "key", "--api-secret", "secret"]
+    with fivetran_server(objects=30) as server:
+        assert (
+            run_dbt_coves(
+                "extract", "fivetran", "--path", str(extract_path), *credentials
+            )
+            == 0
+        )
+        server.api.mutate(every=10)
+        assert (
+            run_dbt_coves("load", "fivetran", "--path", str(extract_path), *credentials)
+            == 0
+        )
+
+        assert not any(c["paused"] for c in server.api.connectors.values())
+        assert all(
+            table["enabled"]
+            for schemas in server.api.schemas.values()
+            for table in schemas["public"]["tables"].values()
+        )
+
+
+def planned_actions(plan_path):
+    return [
+        (action["object_type"], action["name"], action["action"])
+        for action in json.loads(plan_path.read_text())["actions"]
+    ]
+
+
+def write_requests(server):
+    """Requests other than GETs, by route"""
+    return {
+        route: count
+        for route, count in server.request_counts.items()
+        if not route.startswith("GET ")
+    }
+
+
+def test_plan_airbyte_changes(workdir):
+    extract_path = workdir / "airbyte"
+    plan_path = workdir / "plan.json"
+    with MockApiServer(AirbyteMockApi(objects=30)) as server:
+        load_args = ["load", "airbyte", "--path", str(extract_path)]
+        load_args += airbyte_args(server)
+        plan_args = [*load_args, "--plan", "--plan-file", str(plan_path)]
+        assert (
+            run_dbt_coves(
+                "extract", "airbyte", "--path", str(extract_path), *airbyte_args(server)
+            )
+            == 0
+        )
+        server.reset_counts()
+        assert run_dbt_coves(*plan_args) == 0
+        assert planned_actions(plan_path) == []
+        assert write_requests(server) == {}
+
+        server.api.mutate(every=10)
+        server.api.objects["sources"]["source-extra"] = {
+            "sourceId": "source-extra",
+            "name": "postgres_extra",
+            "sourceType": "postgres",
+            "workspaceId": server.api.workspace_id,
+            "configuration": {},
+        }
+        assert run_dbt_coves(*plan_args) == 0
+        assert sorted(planned_actions(plan_path)) == [
+            ("connections", "postgres_00000-warehouse_0", "update"),
+            ("connections", "postgres_00010-warehouse_0", "update"),
+            ("connections", "postgres_00020-warehouse_0", "update"),
+            ("sources", "postgres_00000", "update"),
+            ("sources", "postgres_00010", "update"),
+            ("sources", "postgres_00020", "update"),
+            ("sources", "postgres_extra", "delete"),
+        ]
+
+        server.reset_counts()
+        assert run_dbt_coves(*load_args, "--apply-plan", str(plan_path)) == 0
+        # Only the planned sources are updated and connections re-created, and
+        # deletes are skipped without --allow-deletes
+        resource_route = "/api/public/v1/(?P<resource>sources|destinations|connections)"
+        assert write_requests(server) == {
+            f"PATCH {resource_route}/(?P<id>[^/]+)": 3,
+            f"DELETE {resource_route}/(?P<id>[^/]+)": 3,
+            f"POST {resource_route}": 3,
+            "POST /api/public/v1/(?P<resource>sources|destinations)/(?P<id>[^/]+)/check": 3,
+        }
+        assert "source-extra" in server.api.objects["sources"]
+
+        assert (
+            run_dbt_coves(*load_args, "--apply-plan", str(plan_path), "--allow-deletes")
+            == 0
+        )
+        assert "source-extra" not in server.api.objects["sources"]
+
+
+def test_plan_fivetran_changes(workdir, fivetran_server):
+    extract_path = workdir / "fivetran"
+    plan_path = workdir / "plan.json"
+    credentials = ["--api-key", "key", "--api-secret", "secret"]
+    load_args = ["load", "fivetran", "--path", str(extract_path), *credentials]
+    plan_args = [*load_args, "--plan", "--plan-file", str(plan_path)]
+    with fivetran_server(objects=30) as server:
+        assert (
+            run_dbt_coves(
+                "extract", "fivetran", "--path", str(extract_path), *credentials
+            )
+            == 0
+        )
+        # Connectors' status and sync timestamps changing isn't a change to load
+        server.api.sync()
+        server.reset_counts()
+        assert run_dbt_coves(*plan_args) == 0
+        assert planned_actions(plan_path) == []
+        assert write_requests(server) == {}
+
+        server.api.mutate(every=10)
+        extract_file = extract_path / "warehouse_0.json"
+        extracted = json.loads(extract_file.read_text())
+        del extracted["group_0"]["connectors"]["connector_00029"]
+        extract_file.write_text(json.dumps(extracted))
+        assert run_dbt_coves(*plan_args) == 0
+        assert planned_actions(plan_path) == [
+            ("connectors", "warehouse_0.postgres_00000", "update"),
+            ("connectors", "warehouse_0.postgres_00010", "update"),
+            ("connectors", "warehouse_0.postgres_00020", "update"),
+            ("connectors", "warehouse_0.postgres_00029", "delete"),
+        ]
+
+        server.reset_counts()
+        assert run_dbt_coves(*load_args, "--apply-plan", str(plan_path)) == 0
+        # Only the planned connectors are updated, and deletes are skipped without
+        # --allow-deletes
+        assert write_requests(server) == {
+            "PATCH /v1/connectors/(?P<id>[^/]+)": 3,
+            "PATCH /v1/connectors/(?P<id>[^/]+)/schemas": 3,
+            "PATCH /v1/connectors/(?P<id>[^/]+)/schemas/(?P<schema>[^/]+)"
+            "/tables/(?P<table>[^/]+)": 3,
+        }
+        assert not any(c["paused"] for c in server.api.connectors.values())
+        assert "connector_00029" in server.api.connectors
+
+        # A connector that can't be deleted is reported once the load is done
+        apply_args = [*load_args, "--apply-plan", str(plan_path), "--allow-deletes"]
+        server.api.undeletable.add("connector_00029")
+        with pytest.raises(FivetranLoaderException, match="postgres_00029"):
+            run_dbt_coves(*apply_args)
+        assert "connector_00029" in server.api.connectors
+
+        server.api.undeletable.clear()
+        assert run_dbt_coves(*apply_args) == 0
+        assert "connector_00029" not in server.api.connectors
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("objects", benchmark_sizes())
+def test_benchmark_extract(workdir, fivetran_server, objects):
+    with MockApiServer(AirbyteMockApi(objects), latency=LATENCY) as airbyte_server:
+        measure(
+            "extract airbyte",
+            objects,
+            [airbyte_server],
+            "extract",
+            "airbyte",
+            "--path",
+            str(workdir / "airbyte"),
+            *airbyte_args(airbyte_server),
+        )
+    with fivetran_server(
+        objects, latency=LATENCY, rate_limit_every=RATE_LIMIT_EVERY
+    ) as server:
+        measure(
+            "extract fivetran",
+            objects,
+            [server],
+            "extract",
+            "fivetran",
+            "--path",
+            str(workdir / "fivetran"),
+            "--api-key",
+            "key",
+            "--api-secret",
+            "secret",
+        )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("objects", benchmark_sizes())
+def test_benchmark_load(workdir, fivetran_server, objects):
+    airbyte_path = str(workdir / "airbyte")
+    with MockApiServer(AirbyteMockApi(objects), latency=LATENCY) as server:
+        assert (
+            run_dbt_coves(
+                "extract", "airbyte", "--path", airbyte_path, *airbyte_args(server)
+            )
+            == 0
+        )
+        server.api.mutate(every=10)
+        measure(
+            "load airbyte (10% drift)",
+            objects,
+            [server],
+            "load",
+            "airbyte",
+            "--path",
+            airbyte_path,
+            *airbyte_args(server),
+        )
+
+    fivetran_path = str(workdir / "fivetran")
+    credentials = ["--api-key", "key", "--api-secret", "secret"]
+    with fivetran_server(
+        objects, latency=LATENCY, rate_limit_every=RATE_LIMIT_EVERY
+    ) as server:
+        assert (
+            run_dbt_coves("extract", "fivetran", "--path", fivetran_path, *credentials)
+            == 0
+        )
+        server.api.mutate(every=10)
+        measure(
+            "load fivetran (10% drift)",
+            objects,
+            [server],
+            "load",
+            "fivetran",
+            "--path",
+            fivetran_path,
+            *credentials,
+        )
+
+
+def write_generator_dags(ymls_path, airbyte_server, objects, objects_per_dag=100):
+    """One DAG every `objects_per_dag` objects, each with Airbyte and Fivetran task groups"""
+    ymls_path.mkdir()
+    host, port = airbyte_server.url.rsplit(":", 1)
+    for dag in range(max(1, objects // objects_per_dag)):
+        dag_objects = range(
+            dag * objects_per_dag, min(objects, (dag + 1) * objects_per_dag)
+        )
+        yml_dag = {
+            "description": f"Benchmark DAG {dag}",
+            "schedule": "0 0 * * *",
+            "catchup": False,
+            "nodes": {
+                "extract_airbyte": {
+                    "type": "task_group",
+                    "generator": "AirbyteGenerator",
+                    "host": host,
+                    "port": port,
+                    "airbyte_conn_id": "airbyte_connection",
+                    "connection_ids": [f"connection-{i}" for i in dag_objects],
+                },
+                "extract_fivetran": {
+                    "type": "task_group",
+                    "generator": "FivetranGenerator",
+                    "api_key": "key",
+                    "api_secret": "secret",
+                    "wait_for_completion": True,
+                    "fivetran_conn_id": "fivetran_connection",
+                    "connection_ids": [f"connector_{i:05d}" for i in dag_objects],
+                },
+            },
+        }
+        with open(ymls_path / f"benchmark_dag_{dag}.yml", "w") as yml_file:
+            yaml.safe_dump(yml_dag, yml_file)
+
+
+def test_generate_airflow_dags_shares_inventories(workdir, fivetran_server):
+    ymls_path = workdir / "ymls"
+    snapshot_path = workdir / "inventories.json"
+    cli_args = ["generate", "airflow-dags", "--yml-path", str(ymls_path)]
+    cli_args += ["--inventory-snapshot", str(snapshot_path)]
+    with (
+        MockApiServer(AirbyteMockApi(40)) as airbyte_server,
+        fivetran_server(objects=40) as server,
+    ):
+        write_generator_dags(ymls_path, airbyte_server, 40, objects_per_dag=10)
+        assert run_dbt_coves(*cli_args, "--dags-path", str(workdir / "dags")) == 0
+        # 4 DAGs, but Airbyte and Fivetran were crawled once
+        assert airbyte_server.request_counts["GET /api/public/v1/workspaces"] == 1
+        assert server.request_counts["GET /v1/groups"] == 1
+        assert snapshot_path.exists()
+
+        # Worker processes read the snapshot too
+        airbyte_server.reset_counts()
+        server.reset_counts()
+        dags_2_path = str(workdir / "dags_2")
+        assert run_dbt_coves(*cli_args, "--dags-path", dags_2_path, "--jobs", "2") == 0
+        assert airbyte_server.total_requests == server.total_requests == 0
+
+    for dag_file in (workdir / "dags").glob("*.py"):
+        assert dag_file.read_text() == (workdir / "dags_2" / dag_file.name).read_text()
+
+
+def test_generators_index_source_tables(fivetran_server):
+    api_inventory.start_registry()
+    with (
+        MockApiServer(AirbyteMockApi(200)) as airbyte_server,
+        fivetran_server(objects=200),
+    ):
+        host, port = airbyte_server.url.rsplit(":", 1)
+        airbyte = AirbyteGenerator(host=host, port=port)
+        fivetran = FivetranGenerator("key", "secret", wait_for_completion=True)
+
+    assert airbyte.get_pipeline_connection_ids("raw_1", "public", "table_00003_1") == [
+        "connection-3"
+    ]
+    assert airbyte.get_pipeline_connection_ids(
+        "raw_1", "public", "_airbyte_raw_table_00003_1"
+    ) == ["connection-3"]
+    assert (
+        airbyte.get_pipeline_connection_ids("raw_0", "public", "table_00003_1") is None
+    )
+    assert fivetran.get_pipeline_connection_ids(
+        "RAW_1", "postgres_00003", "table_1"
+    ) == ["connector_00003"]
+    assert fivetran.get_pipeline_connection_ids("raw_1", "public", "table_1") is None
+
+    airbyte.connections_should_exist = True
+    fivetran.connectors_should_exist = True
+    with pytest.raises(AirbyteGeneratorException, match="no connections for table"):
+        airbyte.get_pipeline_connection_ids("raw_1", "other", "table_00003_1")
+    with pytest.raises(FivetranGeneratorException, match="no Fivetran Connector"):
+        fivetran.get_pipeline_connection_ids("raw_0", "postgres_00003", "table_1")
+
+
+def test_generate_airflow_dags_profile(workdir, fivetran_server):
+    ymls_path = workdir / "ymls"
+    cli_args = ["generate", "airflow-dags", "--yml-path", str(ymls_path), "--profiling"]
+    cli_args += ["--inventory-snapshot", str(workdir / "inventories.json")]
+    with (
+        MockApiServer(AirbyteMockApi(40)) as airbyte_server,
+        fivetran_server(objects=40) as server,
+    ):
+        write_generator_dags(ymls_path, airbyte_server, 40, objects_per_dag=10)
+        assert run_dbt_coves(*cli_args, "--dags-path", str(workdir / "dags")) == 0
+        requests = airbyte_server.total_requests + server.total_requests
+
+        report = json.loads(
+            (workdir / ".dbt_coves/airflow_dags_profile.json").read_text()
+        )
+        assert report["counters"] == {"http_requests": requests, "subprocesses": 0}
+        assert len(report["dags"]) == 4
+        assert {"yaml", "generators", "api_inventory", "format", "write"} <= set(
+            report["phases"]
+        )
+        assert sum(
+            dag["counters"]["http_requests"] for dag in report["dags"].values()
+        ) == (requests)
+
+        # Worker processes profile their DAGs
+        cprofile_path = workdir / "dags.prof"
+        report_path = workdir / "profile.json"
+        cli_args += ["--dags-path", str(workdir / "dags_2"), "--jobs", "2"]
+        cli_args += ["--profiling-report", str(report_path)]
+        assert run_dbt_coves(*cli_args, "--profiling-cprofile", str(cprofile_path)) == 0
+
+    report = json.loads(report_path.read_text())
+    assert len(report["dags"]) == 4
+    assert report["phases"]["render"]["calls"] == 4
+    assert report["phases"]["yaml"]["calls"] == 8
+    assert pstats.Stats(str(cprofile_path)).total_calls > 0
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("objects", benchmark_sizes())
+def test_benchmark_generate_airflow_dags(workdir, fivetran_server, objects):
+    """One DAG every 100 objects, each with Airbyte and Fivetran task groups"""
+    ymls_path = workdir / "ymls"
+    dags_path = workdir / "dags"
+    with (
+        MockApiServer(AirbyteMockApi(objects), latency=LATENCY) as airbyte_server,
+        fivetran_server(
+            objects, latency=LATENCY, rate_limit_every=RATE_LIMIT_EVERY
+        ) as server,
+    ):
+        write_generator_dags(ymls_path, airbyte_server, objects)
+        measure(
+            "generate airflow-dags",
+            objects,
+            [airbyte_server, server],
+            "generate",
+            "airflow-dags",
+            "--yml-path",
+            str(ymls_path),
+            "--dags-path",
+            str(dags_path),
+        )
+
+    assert len(list(Path(dags_path).glob("*.py"))) == max(1, objects // 100)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("dags", [10, 100])
+def test_benchmark_dag_formatting(workdir, dags):
+    """Per-DAG generation time with the built-in formatter and with black and isort"""
+    ymls_path = workdir / "ymls"
+    ymls_path.mkdir()
+    for dag in range(dags):
+        yml_dag = {
+            "description": f"Formatting benchmark DAG {dag}",
+            "schedule": "0 0 * * *",
+            "catchup": False,
+            "nodes": {
+                f"task_{task}": {
+                    "type": "task",
+                    "operator": "airflow.operators.bash.BashOperator",
+                    "bash_command": f"echo 'task {task}'",
+                    "dependencies": [f"task_{task - 1}"] if task else [],
+                }
+                for task in range(50)
+            },
+        }
+        with open(ymls_path / f"formatting_dag_{dag}.yml", "w") as yml_file:
+            yaml.safe_dump(yml_dag, yml_file)
+
+    outputs = {}
+    for formatter, extra_args in (("built-in", []), ("black", ["--format-with-black"])):
+        dags_path = workdir / formatter
+        result = measure(
+            f"generate airflow-dags ({formatter})",
+            dags,
+            [],
+            "generate",
+            "airflow-dags",
+            "--yml-path",
+            str(ymls_path),
+            "--dags-path",
+            str(dags_path),
+            "--force",
+            *extra_args,
+        )
+        result["seconds_per_dag"] = result["seconds"] / dags
+        outputs[formatter] = {
+            dag_file.name: dag_file.read_text() for dag_file in dags_path.glob("*.py")
+        }
+
+    assert outputs["built-in"] == outputs["black"]
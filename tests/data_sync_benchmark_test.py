@@ -0,0 +1,818 @@
+"""
+Tests and benchmarks for data-sync, against local SQLite databases shaped like
+Airflow's metadata database, synced into filesystem destinations.
+
+Source benchmarks read task_instance tables with each backend. data-sync benchmarks
+run `BaseDataSyncTask.perform_sync` on a whole Airflow database, in a process of its
+own to measure its peak memory: a full run, then an incremental one after new task
+instances and DAG runs were added and some were updated.
+
+Benchmarks run for 10000 task instances by default. Use these environment variables
+to tune them:
+- DBT_COVES_BENCHMARK_MAX_ROWS: largest table to benchmark (10000, 100000 or 1000000)
+- DBT_COVES_BENCHMARK_REPORT: path of a JSON file where results are written
+
+i.e. `DBT_COVES_BENCHMARK_MAX_ROWS=1000000 pytest -m benchmark tests/data_sync_benchmark_test.py`
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from argparse import Namespace
+from datetime import datetime, timedelta, timezone
+
+import dlt
+import pytest
+import sqlalchemy as sa
+
+from dbt_coves.tasks.data_sync import metrics
+from dbt_coves.tasks.data_sync.base import MEGABYTE, BaseDataSyncTask
+from dbt_coves.tasks.data_sync.catalog import build_catalog, detect_cursor
+from dbt_coves.tasks.data_sync.sql_database import reflection, sql_table
+from dbt_coves.tasks.data_sync.sql_database.helpers import LOAD_STATS, TableLoader
+
+BENCHMARK_SIZES = [10000, 100000, 1000000]
+MAX_ROWS = int(os.environ.get("DBT_COVES_BENCHMARK_MAX_ROWS", 10000))
+REPORT_PATH = os.environ.get("DBT_COVES_BENCHMARK_REPORT")
+STATES = ("success", "failed", "skipped", "upstream_failed")
+
+benchmark_results = []
+sync_benchmark_results = []
+
+
+def create_task_instances(database_path, rows, first_row=0):
+    engine = sa.create_engine(f"sqlite:///{database_path}")
+    metadata = sa.MetaData()
+    task_instance = sa.Table(
+        "task_instance",
+        metadata,
+        sa.Column("dag_id", sa.String(250), primary_key=True),
+        sa.Column("task_id", sa.String(250), primary_key=True),
+        sa.Column("run_id", sa.String(250), primary_key=True),
+        sa.Column("map_index", sa.Integer, primary_key=True),
+        sa.Column("start_date", sa.DateTime),
+        sa.Column("end_date", sa.DateTime),
+        sa.Column("duration", sa.Float),
+        sa.Column("state", sa.String(20)),
+        sa.Column("try_number", sa.Integer),
+        sa.Column("hostname", sa.String(1000)),
+        sa.Column("pool", sa.String(256), nullable=False),
+        sa.Column("queued_by_job_id", sa.Integer),
+        sa.Column("executor_config", sa.JSON),
+        sa.Column("updated_at", sa.DateTime),
+    )
+    metadata.create_all(engine)
+    started = datetime(2024, 1, 1)
+    with engine.begin() as connection:
+        for offset in range(first_row, rows, 10000):
+            connection.execute(
+                task_instance.insert(),
+                [
+                    {
+                        "dag_id": f"dag_{row % 100}",
+                        "task_id": f"task_{row % 10}",
+                        "run_id": f"scheduled__{row // 100}",
+                        "map_index": -1,
+                        "start_date": started + timedelta(seconds=row),
+                        "end_date": started + timedelta(seconds=row + 30),
+                        "duration": 30.5,
+                        "state": STATES[row % len(STATES)],
+                        "try_number": 1,
+                        "hostname": f"worker-{row % 8}",
+                        "pool": "default_pool",
+                        "queued_by_job_id": row // 10,
+                        "executor_config": {"pod_override": {"cpu": row % 4}},
+                        "updated_at": started + timedelta(seconds=row + 30),
+                    }
+                    for row in range(offset, min(offset + 10000, rows))
+                ],
+            )
+    return engine
+
+
+def create_airflow_database(database_path, task_instances, first_row=0):
+    """
+    Airflow's metadata tables synced by default, with about 10 task instances per
+    DAG run and job, of 100 DAGs. Rows from `first_row` are added to an existing
+    database, as if Airflow kept running
+    """
+    engine = create_task_instances(database_path, task_instances, first_row)
+    metadata = sa.MetaData()
+    columns = {
+        "ab_permission": [sa.Column("name", sa.String(100))],
+        "ab_role": [sa.Column("name", sa.String(64))],
+        "ab_user": [
+            sa.Column("username", sa.String(64)),
+            sa.Column("email", sa.String(256)),
+            sa.Column("created_on", sa.DateTime),
+        ],
+        "dag": [
+            sa.Column("is_paused", sa.Boolean),
+            sa.Column("last_parsed_time", sa.DateTime),
+            sa.Column("last_pickled", sa.DateTime),
+            sa.Column("fileloc", sa.String(2000)),
+            sa.Column("owners", sa.String(2000)),
+            sa.Column("timetable_description", sa.String(1000)),
+            sa.Column("schedule_interval", sa.JSON),
+        ],
+        "dag_run": [
+            sa.Column("dag_id", sa.String(250)),
+            sa.Column("run_id", sa.String(250)),
+            sa.Column("execution_date", sa.DateTime),
+            sa.Column("start_date", sa.DateTime),
+            sa.Column("end_date", sa.DateTime),
+            sa.Column("state", sa.String(50)),
+            sa.Column("run_type", sa.String(50)),
+            sa.Column("conf", sa.JSON),
+            sa.Column("data_interval_start", sa.DateTime),
+            sa.Column("data_interval_end", sa.DateTime),
+        ],
+        "dag_tag": [
+            sa.Column("name", sa.String(100)),
+            sa.Column("dag_id", sa.String(250)),
+        ],
+        "import_error": [
+            sa.Column("timestamp", sa.DateTime),
+            sa.Column("filename", sa.String(1024)),
+            sa.Column("stacktrace", sa.Text),
+        ],
+        "job": [
+            sa.Column("dag_id", sa.String(250)),
+            sa.Column("state", sa.String(20)),
+            sa.Column("job_type", sa.String(30)),
+            sa.Column("start_date", sa.DateTime),
+            sa.Column("end_date", sa.DateTime),
+            sa.Column("latest_heartbeat", sa.DateTime),
+            sa.Column("executor_class", sa.String(500)),
+            sa.Column("hostname", sa.String(500)),
+        ],
+        "task_fail": [
+            sa.Column("task_id", sa.String(250)),
+            sa.Column("dag_id", sa.String(250)),
+            sa.Column("run_id", sa.String(250)),
+            sa.Column("start_date", sa.DateTime),
+            sa.Column("end_date", sa.DateTime),
+            sa.Column("duration", sa.Integer),
+        ],
+    }
+    tables = {
+        name: sa.Table(
+            name,
+            metadata,
+            sa.Column("id", sa.Integer, primary_key=True),
+            *table_columns,
+        )
+        for name, table_columns in columns.items()
+    }
+    metadata.create_all(engine)
+    started = datetime(2024, 1, 1)
+    first_run, runs = first_row // 10, task_instances // 10
+
+    def dag_run(row):
+        execution_date = started + timedelta(seconds=10 * row)
+        return {
+            "id": row,
+            "dag_id": f"dag_{row % 100}",
+            "run_id": f"scheduled__{execution_date.isoformat()}",
+            "execution_date": execution_date,
+            "start_date": execution_date + timedelta(seconds=1),
+            "end_date": execution_date + timedelta(seconds=300),
+            "state": STATES[row % 2],
+            "run_type": "scheduled",
+            "conf": {"full_refresh": row % 7 == 0, "vars": {"day": row % 31}},
+            "data_interval_start": execution_date - timedelta(days=1),
+            "data_interval_end": execution_date,
+        }
+
+    def job(row):
+        start_date = started + timedelta(seconds=10 * row)
+        return {
+            "id": row,
+            "dag_id": f"dag_{row % 100}",
+            "state": STATES[row % 2],
+            "job_type": "LocalTaskJob",
+            "start_date": start_date,
+            "end_date": start_date + timedelta(seconds=30),
+            "latest_heartbeat": start_date + timedelta(seconds=25),
+            "executor_class": "KubernetesExecutor",
+            "hostname": f"worker-{row % 8}",
+        }
+
+    def task_fail(row):
+        start_date = started + timedelta(seconds=100 * row)
+        return {
+            "id": row,
+            "task_id": f"task_{row % 10}",
+            "dag_id": f"dag_{row % 100}",
+            "run_id": f"scheduled__{row}",
+            "start_date": start_date,
+            "end_date": start_date + timedelta(seconds=30),
+            "duration": 30,
+        }
+
+    rows = {
+        "dag_run": [dag_run(row) for row in range(first_run, runs)],
+        "job": [job(row) for row in range(first_run, runs)],
+        "task_fail": [task_fail(row) for row in range(first_row // 100, runs // 10)],
+    }
+    if not first_row:
+        rows["ab_permission"] = [{"id": row, "name": f"can_{row}"} for row in range(50)]
+        rows["ab_role"] = [{"id": row, "name": f"role_{row}"} for row in range(5)]
+        rows["ab_user"] = [
+            {
+                "id": row,
+                "username": f"user_{row}",
+                "email": f"user_{row}@example.com",
+                "created_on": started,
+            }
+            for row in range(20)
+        ]
+        rows["dag"] = [
+            {
+                "id": row,
+                "is_paused": row % 10 == 0,
+                "last_parsed_time": started,
+                "last_pickled": started + timedelta(seconds=row),
+                "fileloc": f"/opt/airflow/dags/repo/orchestrate/dags/dag_{row}.py",
+                "owners": "airflow",
+                "timetable_description": "At 00:00",
+                "schedule_interval": {"type": "cron", "value": "0 0 * * *"},
+            }
+            for row in range(100)
+        ]
+        rows["dag_tag"] = [
+            {"id": row, "name": f"tag_{row % 2}", "dag_id": f"dag_{row // 2}"}
+            for row in range(200)
+        ]
+        rows["import_error"] = [
+            {
+                "id": row,
+                "timestamp": started,
+                "filename": f"/opt/airflow/dags/broken_{row}.py",
+                "stacktrace": "Traceback (most recent call last):\n" * 20,
+            }
+            for row in range(5)
+        ]
+    with engine.begin() as connection:
+        for name, table_rows in rows.items():
+            for offset in range(0, len(table_rows), 10000):
+                connection.execute(
+                    tables[name].insert(), table_rows[offset : offset + 10000]
+                )
+    return engine
+
+
+class LocalDataSyncTask(BaseDataSyncTask):
+    """data-sync of the `airflow` source into a filesystem destination"""
+
+    def __init__(self, database_path, destination_path, **config):
+        super().__init__(Namespace(source="airflow", task="local"), config)
+        self.tables = []
+        self.destination = dlt.destinations.filesystem(bucket_url=str(destination_path))
+        self.source_connection_string = f"sqlite:///{database_path}"
+
+    def get_config_value(self, key):
+        return self.coves_config.get(key)
+
+
+def run_data_sync(database_path, destination_path, metrics_path, results):
+    """Sync in a process of its own, putting its peak memory in `results`"""
+    from dbt_coves.tasks.data_sync.sql_database.helpers import peak_rss_bytes
+
+    LocalDataSyncTask(
+        database_path, destination_path, metrics_path=str(metrics_path)
+    ).perform_sync()
+    results.put(peak_rss_bytes())
+
+
+@pytest.fixture
+def dlt_data_dir(tmp_path, monkeypatch):
+    """Keep the pipelines' state out of ~/.dlt, also for processes started by tests"""
+    monkeypatch.setenv("DLT_DATA_DIR", str(tmp_path / "dlt"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+@pytest.fixture(autouse=True)
+def reflection_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(reflection, "CACHE_DIR", tmp_path / "reflected_tables")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def benchmark_report(pytestconfig):
+    yield
+    if not benchmark_results and not sync_benchmark_results:
+        return
+    capture_manager = pytestconfig.pluginmanager.getplugin("capturemanager")
+    reporter = pytestconfig.pluginmanager.getplugin("terminalreporter")
+    with capture_manager.global_and_fixture_disabled():
+        if benchmark_results:
+            reporter.write_line("")
+            reporter.write_line(
+                f"{'backend':<16}{'rows':>10}{'extract':>10}{'normalize':>10}"
+                f"{'load':>10}{'rows/s':>10}"
+            )
+        for result in benchmark_results:
+            reporter.write_line(
+                f"{result['backend']:<16}{result['rows']:>10}"
+                f"{result['extract']:>10.2f}{result['normalize']:>10.2f}"
+                f"{result['load']:>10.2f}{result['rows_per_second']:>10.0f}"
+            )
+        if sync_benchmark_results:
+            reporter.write_line("")
+            reporter.write_line(
+                f"{'data-sync':<16}{'task inst.':>10}{'rows':>10}{'seconds':>10}"
+                f"{'rows/s':>10}{'RSS MB':>10}"
+            )
+        for result in sync_benchmark_results:
+            reporter.write_line(
+                f"{result['run']:<16}{result['task_instances']:>10}"
+                f"{result['rows']:>10}{result['seconds']:>10.2f}"
+                f"{result['rows_per_second']:>10.0f}{result['peak_rss_mb']:>10.0f}"
+            )
+    if REPORT_PATH:
+        with open(REPORT_PATH, "w") as report_file:
+            json.dump(
+                {"backends": benchmark_results, "data_sync": sync_benchmark_results},
+                report_file,
+                indent=4,
+            )
+
+
+def sync(engine, destination_path, backend, destination=None, **table_kwargs):
+    pipeline = dlt.pipeline(
+        pipeline_name=f"data_sync_{backend}",
+        pipelines_dir=str(destination_path / "pipelines"),
+        destination=destination
+        or dlt.destinations.filesystem(
+            bucket_url=str(destination_path / "destination")
+        ),
+        dataset_name="airflow",
+    )
+    resource = sql_table(
+        credentials=engine,
+        table="task_instance",
+        chunk_size=10000,
+        backend=backend,
+        **table_kwargs,
+    )
+    started = time.perf_counter()
+    pipeline.extract(resource)
+    extracted = time.perf_counter()
+    pipeline.normalize()
+    normalized = time.perf_counter()
+    pipeline.load()
+    return pipeline, {
+        "extract": extracted - started,
+        "normalize": normalized - extracted,
+        "load": time.perf_counter() - normalized,
+    }
+
+
+def synced_rows(pipeline):
+    return pipeline.last_trace.last_normalize_info.row_counts["task_instance"]
+
+
+@pytest.mark.parametrize("backend", ["sqlalchemy", "pyarrow", "pandas"])
+def test_backends_load_the_same_rows(tmp_path, backend):
+    if backend != "sqlalchemy":
+        pytest.importorskip(backend)
+    engine = create_task_instances(tmp_path / "airflow.db", 2500)
+
+    pipeline, _ = sync(engine, tmp_path, backend)
+    assert synced_rows(pipeline) == 2500
+
+    # Incremental cursors work alike, whatever the rows are yielded as: the last 130
+    # task instances were updated after 00:40, and 24 older ones of dag_1 are updated
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text(
+                "update task_instance set updated_at = '2025-01-01 00:00:00.000000'"
+                " where dag_id = 'dag_1'"
+            )
+        )
+    incremental = dlt.sources.incremental(
+        "updated_at", initial_value=datetime(2024, 1, 1, 0, 40)
+    )
+    pipeline, _ = sync(engine, tmp_path, backend, incremental=incremental)
+    assert synced_rows(pipeline) == 130 + 24
+
+
+# The first primary key column, an integer and a datetime column
+@pytest.mark.parametrize("partition_column", [None, "queued_by_job_id", "updated_at"])
+def test_partitioned_reads(tmp_path, partition_column):
+    engine = create_task_instances(tmp_path / "airflow.db", 2500)
+    loader = TableLoader(
+        engine,
+        sa.Table("task_instance", sa.MetaData(), autoload_with=engine),
+        chunk_size=100,
+        partitions=4,
+        partition_column=partition_column,
+    )
+
+    assert len(loader.make_partition_queries()) == 4
+    rows = [row for chunk in loader.load_rows() for row in chunk]
+    assert len(rows) == len({(row["dag_id"], row["run_id"]) for row in rows}) == 2500
+
+
+@pytest.mark.parametrize("write_disposition, rows", [("append", 2525), ("merge", 2500)])
+def test_merged_incremental_sync(tmp_path, write_disposition, rows):
+    engine = create_task_instances(tmp_path / "airflow.db", 2500)
+    # A SQLite destination, whose airflow dataset is attached as airflow.db
+    destination = dlt.destinations.sqlalchemy(f"sqlite:///{tmp_path / 'warehouse.db'}")
+
+    def sync_task_instances():
+        incremental = dlt.sources.incremental(
+            "updated_at", initial_value=datetime(2024, 1, 1)
+        )
+        sync(
+            engine,
+            tmp_path,
+            "sqlalchemy",
+            destination=destination,
+            incremental=incremental,
+            write_disposition=write_disposition,
+        )
+
+    sync_task_instances()
+    # The 25 task instances of dag_1 change state: merged, they replace their
+    # previous version instead of being appended again
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text(
+                "update task_instance set state = 'removed',"
+                " updated_at = '2025-01-01 00:00:00.000000' where dag_id = 'dag_1'"
+            )
+        )
+    sync_task_instances()
+
+    warehouse = sa.create_engine(f"sqlite:///{tmp_path / 'warehouse__airflow.db'}")
+    with warehouse.connect() as connection:
+        assert connection.execute(
+            sa.text(
+                "select count(*), sum(state = 'removed') from task_instance"
+                " where dag_id = 'dag_1'"
+            )
+        ).one() == (rows - 2475, 25)
+        assert (
+            connection.execute(sa.text("select count(*) from task_instance")).scalar()
+            == rows
+        )
+
+
+def test_partitioned_incremental_sync(tmp_path):
+    engine = create_task_instances(tmp_path / "airflow.db", 2500)
+    incremental = dlt.sources.incremental(
+        "updated_at", initial_value=datetime(2024, 1, 1, 0, 40)
+    )
+
+    pipeline, _ = sync(
+        engine, tmp_path, "sqlalchemy", incremental=incremental, partitions=4
+    )
+    assert synced_rows(pipeline) == 130
+
+
+def test_reflection_cache(tmp_path):
+    engine = create_task_instances(tmp_path / "airflow.db", 10)
+    statements = []
+    sa.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    def reflect(**kwargs):
+        statements.clear()
+        table = reflection.reflect_table(
+            engine, sa.MetaData(), "task_instance", **kwargs
+        )
+        return table, len(statements)
+
+    table, reflection_statements = reflect()
+    assert reflection_statements > 1
+    cached_table, statements_run = reflect()
+    assert statements_run == 1
+    assert [column.name for column in cached_table.primary_key] == [
+        "dag_id",
+        "task_id",
+        "run_id",
+        "map_index",
+    ]
+    assert isinstance(cached_table.c.executor_config.type, sa.JSON)
+    assert reflect(refresh=True)[1] == reflection_statements
+
+    with engine.begin() as connection:
+        connection.execute(sa.text("alter table task_instance add column note text"))
+    table, statements_run = reflect()
+    assert statements_run > reflection_statements
+    assert "note" in table.c
+    assert reflect()[1] == 1
+
+
+@pytest.mark.parametrize("backend", ["sqlalchemy", "pyarrow"])
+def test_chunks_sized_by_bytes(tmp_path, backend):
+    if backend != "sqlalchemy":
+        pytest.importorskip(backend)
+    engine = create_task_instances(tmp_path / "airflow.db", 5000)
+
+    def chunk_rows(columns, chunk_bytes):
+        table = sa.Table("task_instance", sa.MetaData(), autoload_with=engine)
+        for column in set(table.c.keys()) - set(columns or table.c.keys()):
+            table._columns.remove(table.c[column])
+        loader = TableLoader(
+            engine, table, chunk_size=1000, backend=backend, chunk_bytes=chunk_bytes
+        )
+        rows = [len(chunk) for chunk in loader.load_rows()]
+        assert sum(rows) == loader.stats["rows"] == 5000
+        assert loader.stats["max_chunk_bytes"] <= 1.5 * chunk_bytes
+        return rows
+
+    # A first small chunk measures rows, then chunks take as many as fit
+    wide_rows = chunk_rows(None, 512 * 1024)
+    narrow_rows = chunk_rows(["map_index"], 512 * 1024)
+    assert wide_rows[0] == narrow_rows[0] == 100
+    assert wide_rows[1] < narrow_rows[1]
+    assert narrow_rows[1] > 1000
+
+
+def sync_in_pages(engine, destination_path, page_size, max_pages, runs=10):
+    """Rows synced by each run, until a run reads its table completely"""
+    synced = []
+    while not synced or not LOAD_STATS["task_instance"]["complete"]:
+        assert len(synced) < runs, f"Sync isn't progressing: {synced}"
+        incremental = dlt.sources.incremental(
+            "updated_at", initial_value=datetime(2024, 1, 1)
+        )
+        pipeline, _ = sync(
+            engine,
+            destination_path,
+            "sqlalchemy",
+            incremental=incremental,
+            page_size=page_size,
+            max_pages=max_pages,
+        )
+        synced.append(synced_rows(pipeline))
+    return synced
+
+
+def test_keyset_pages_resume(tmp_path, monkeypatch):
+    engine = create_task_instances(tmp_path / "airflow.db", 2500)
+    page_queries = []
+
+    def cancel_a_page_once(conn, cursor, statement, *args):
+        if "ORDER BY" in statement and "LIMIT" in statement:
+            page_queries.append(statement)
+            if len(page_queries) == 2:
+                raise sa.exc.OperationalError(statement, (), Exception("canceled"))
+
+    sa.event.listen(engine, "before_cursor_execute", cancel_a_page_once)
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+
+    # Each run reads up to 3 pages, and the next one continues after its last row
+    assert sync_in_pages(engine, tmp_path, page_size=300, max_pages=3) == [
+        900,
+        900,
+        700,
+    ]
+    # 9 pages, one of them cancelled and read again
+    assert len(page_queries) == 10
+
+    # Runs progress even when more rows than a run reads share the cursor's value
+    same_cursor_path = tmp_path / "same_cursor"
+    same_cursor_path.mkdir()
+    engine = create_task_instances(same_cursor_path / "airflow.db", 1000)
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text(
+                "update task_instance set updated_at = '2024-06-01 00:00:00.000000'"
+            )
+        )
+    assert sync_in_pages(engine, same_cursor_path, page_size=300, max_pages=1) == [
+        300,
+        300,
+        300,
+        100,
+    ]
+
+
+def test_table_catalog(tmp_path):
+    engine = create_task_instances(tmp_path / "airflow.db", 10)
+    table = sa.Table("task_instance", sa.MetaData(), autoload_with=engine)
+    assert detect_cursor(table) == "updated_at"
+    table._columns.remove(table.c.updated_at)
+    assert detect_cursor(table) is None
+
+    catalog = build_catalog(
+        ["dag_tag", "variable"],
+        {
+            "task_instance": {"write_disposition": "merge", "partitions": 4},
+            "variable": {"cursor": "updated_at", "initial_value": "2024-01-01"},
+            "log": {"write_disposition": "merge"},
+        },
+    )
+    assert list(catalog)[-2:] == ["variable", "log"]
+    assert catalog["task_instance"]["cursor"] == "updated_at"
+    assert catalog["task_instance"]["write_disposition"] == "merge"
+    assert catalog["variable"]["initial_value"] == datetime(2024, 1, 1)
+    assert catalog["variable"]["write_disposition"] == "merge"
+    assert catalog["dag_tag"]["write_disposition"] == "replace"
+    with pytest.raises(ValueError):
+        build_catalog([], {"dag": {"write_disposition": "replace"}})
+
+
+def test_sync_metrics(tmp_path):
+    engine = create_task_instances(tmp_path / "airflow.db", 2500)
+    incremental = dlt.sources.incremental(
+        "updated_at", initial_value=datetime(2024, 1, 1)
+    )
+    pipeline, _ = sync(engine, tmp_path, "sqlalchemy", incremental=incremental)
+
+    seconds = metrics.step_seconds(pipeline.last_trace)
+    assert list(seconds) == ["extract", "normalize", "load"]
+    assert all(step_seconds > 0 for step_seconds in seconds.values())
+    high_water_mark = metrics.cursor_high_water_mark(
+        pipeline, "task_instance", "updated_at"
+    )
+    assert high_water_mark == datetime(2024, 1, 1) + timedelta(seconds=2499 + 30)
+    assert metrics.cursor_high_water_mark(pipeline, "task_instance", "state") is None
+
+    # SQLite's current time is naive, in UTC
+    now = metrics.source_now(engine)
+    assert 0 < metrics.lag_seconds(now, high_water_mark) < 10**10
+    assert (
+        metrics.lag_seconds(
+            datetime(2024, 1, 1, 1, tzinfo=timezone(timedelta(hours=1))),
+            datetime(2024, 1, 1),
+        )
+        == 0
+    )
+    assert metrics.lag_seconds(now, 100) is None
+
+    stats = LOAD_STATS["task_instance"]
+    table_metrics = metrics.table_metrics(
+        "task_instance",
+        {"write_disposition": "merge", "cursor": "updated_at"},
+        stats,
+        high_water_mark=high_water_mark,
+        now=now,
+    )
+    assert table_metrics["rows"] == 2500
+    assert table_metrics["high_water_mark"] == "2024-01-01T00:42:09"
+    assert table_metrics["rows_per_second"] == 2500 / stats["extract_seconds"]
+
+    # Normalize and load seconds are the sync's, shared by all its tables
+    rows = metrics.metrics_rows(
+        {
+            "source": "airflow",
+            "started_at": "2024-01-01T00:00:00+00:00",
+            "normalize_seconds": seconds["normalize"],
+            "load_seconds": seconds["load"],
+            "tables": [table_metrics],
+        }
+    )
+    assert rows[0]["sync_normalize_seconds"] == seconds["normalize"]
+    assert rows[0]["sync_load_seconds"] == seconds["load"]
+    assert "normalize_seconds" not in rows[0]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("backend", ["sqlalchemy", "pyarrow"])
+@pytest.mark.parametrize(
+    "rows",
+    [
+        pytest.param(
+            size,
+            marks=pytest.mark.skipif(
+                size > MAX_ROWS,
+                reason="set DBT_COVES_BENCHMARK_MAX_ROWS to benchmark it",
+            ),
+        )
+        for size in BENCHMARK_SIZES
+    ],
+)
+def test_benchmark_backends(tmp_path_factory, tmp_path, rows, backend):
+    if backend != "sqlalchemy":
+        pytest.importorskip(backend)
+    database_path = tmp_path_factory.getbasetemp() / f"task_instance_{rows}.db"
+    if database_path.exists():
+        engine = sa.create_engine(f"sqlite:///{database_path}")
+    else:
+        engine = create_task_instances(database_path, rows)
+
+    pipeline, seconds = sync(engine, tmp_path, backend)
+
+    assert synced_rows(pipeline) == rows
+    benchmark_results.append(
+        {
+            "backend": backend,
+            "rows": rows,
+            **seconds,
+            "rows_per_second": rows / sum(seconds.values()),
+        }
+    )
+
+
+def update_airflow_database(database_path, task_instances):
+    """A tenth more task instances, DAG runs and jobs, and dag_1's tasks cleared"""
+    engine = create_airflow_database(
+        database_path, task_instances + task_instances // 10, first_row=task_instances
+    )
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text(
+                "update task_instance set state = 'removed',"
+                " updated_at = '2025-01-01 00:00:00.000000' where dag_id = 'dag_1'"
+            )
+        )
+
+
+def test_data_sync_task(tmp_path, dlt_data_dir):
+    database_path = tmp_path / "airflow.db"
+    create_airflow_database(database_path, 2500)
+    metrics_path = tmp_path / "metrics.json"
+
+    def sync_tables():
+        LocalDataSyncTask(
+            database_path, tmp_path / "destination", metrics_path=str(metrics_path)
+        ).perform_sync()
+        with open(metrics_path) as metrics_file:
+            sync_metrics = json.load(metrics_file)
+        assert sync_metrics["normalize_seconds"] > 0
+        assert sync_metrics["load_seconds"] > 0
+        return {table["table"]: table["rows"] for table in sync_metrics["tables"]}
+
+    assert sync_tables() == {
+        "ab_permission": 50,
+        "ab_role": 5,
+        "ab_user": 20,
+        "dag": 100,
+        "dag_run": 250,
+        "dag_tag": 200,
+        "import_error": 5,
+        "job": 250,
+        "task_fail": 25,
+        "task_instance": 2500,
+    }
+    update_airflow_database(database_path, 2500)
+    # Incremental tables read the rows from their cursor's last value, that of their
+    # last row synced included: dag_1's 25 earlier task instances were updated
+    assert sync_tables() == {
+        "ab_permission": 50,
+        "ab_role": 5,
+        "ab_user": 20,
+        "dag": 1,
+        "dag_run": 25 + 1,
+        "dag_tag": 200,
+        "import_error": 5,
+        "job": 25 + 1,
+        "task_fail": 2 + 1,
+        "task_instance": 250 + 25 + 1,
+    }
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "task_instances",
+    [
+        pytest.param(
+            size,
+            marks=pytest.mark.skipif(
+                size > MAX_ROWS,
+                reason="set DBT_COVES_BENCHMARK_MAX_ROWS to benchmark it",
+            ),
+        )
+        for size in BENCHMARK_SIZES
+    ],
+)
+def test_benchmark_data_sync(tmp_path, dlt_data_dir, task_instances):
+    database_path = tmp_path / "airflow.db"
+    create_airflow_database(database_path, task_instances)
+    # Each sync runs in a fresh process, so its peak memory is its own
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+
+    for run in ("full", "incremental"):
+        if run == "incremental":
+            update_airflow_database(database_path, task_instances)
+        metrics_path = tmp_path / f"{run}_metrics.json"
+        process = context.Process(
+            target=run_data_sync,
+            args=(database_path, tmp_path / "destination", metrics_path, results),
+        )
+        process.start()
+        process.join()
+        assert process.exitcode == 0
+        with open(metrics_path) as metrics_file:
+            sync_metrics = json.load(metrics_file)
+        rows = sum(table["rows"] for table in sync_metrics["tables"])
+        sync_benchmark_results.append(
+            {
+                "run": run,
+                "task_instances": task_instances,
+                "rows": rows,
+                "seconds": sync_metrics["seconds"],
+                "rows_per_second": rows / sync_metrics["seconds"],
+                "peak_rss_mb": results.get(timeout=10) / MEGABYTE,
+                "tables": sync_metrics["tables"],
+            }
+        )
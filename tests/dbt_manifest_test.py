@@ -0,0 +1,188 @@
+import json
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from mock_api_server import AirbyteMockApi, MockApiServer
+
+from dbt_coves.tasks.generate.airflow_generators import AirbyteDbtGenerator
+from dbt_coves.utils import api_inventory, dbt_projects
+from dbt_coves.utils.dbt_manifest import (
+    ManifestSelector,
+    UnsupportedSelectionException,
+)
+
+
+def source(table, tags=()):
+    return {
+        "unique_id": f"source.analytics.airbyte.{table}",
+        "resource_type": "source",
+        "package_name": "analytics",
+        "source_name": "airbyte",
+        "name": table,
+        "identifier": table.upper(),
+        "database": "RAW_0",
+        "schema": "PUBLIC",
+        "fqn": ["analytics", "airbyte", table],
+        "original_file_path": "models/sources/airbyte.yml",
+        "tags": list(tags),
+        "config": {"enabled": True},
+    }
+
+
+def model(name, path, tags=()):
+    return {
+        "unique_id": f"model.analytics.{name}",
+        "resource_type": "model",
+        "package_name": "analytics",
+        "name": name,
+        "fqn": ["analytics", *path.split("/")[1:-1], name],
+        "original_file_path": path,
+        "tags": list(tags),
+        "config": {"enabled": True, "materialized": "view"},
+    }
+
+
+@pytest.fixture
+def manifest():
+    nodes = [
+        source("table_00001_0", tags=["daily"]),
+        source("table_00002_0"),
+        source("table_00003_0"),
+        model("stg_one", "models/staging/stg_one.sql"),
+        model("stg_two", "models/staging/stg_two.sql"),
+        model("orders", "models/marts/orders.sql", tags=["finance"]),
+    ]
+    edges = {
+        "source.analytics.airbyte.table_00001_0": ["model.analytics.stg_one"],
+        "source.analytics.airbyte.table_00002_0": ["model.analytics.stg_two"],
+        "source.analytics.airbyte.table_00003_0": [],
+        "model.analytics.stg_one": ["model.analytics.orders"],
+        "model.analytics.stg_two": ["model.analytics.orders"],
+        "model.analytics.orders": [],
+    }
+    parents = {unique_id: [] for unique_id in edges}
+    for parent, children in edges.items():
+        for child in children:
+            parents[child].append(parent)
+    return {
+        "nodes": {n["unique_id"]: n for n in nodes if n["resource_type"] != "source"},
+        "sources": {n["unique_id"]: n for n in nodes if n["resource_type"] == "source"},
+        "child_map": edges,
+        "parent_map": parents,
+    }
+
+
+@pytest.mark.parametrize(
+    "list_args, expected",
+    [
+        ("", ["table_00001_0", "table_00002_0", "table_00003_0"]),
+        ("--select tag:daily", ["table_00001_0"]),
+        ("-s +orders", ["table_00001_0", "table_00002_0"]),
+        ("-s 1+stg_two", ["table_00002_0"]),
+        ("-s +tag:finance --exclude +stg_one", ["table_00002_0"]),
+        (
+            "--select source:airbyte.table_00003_0 tag:daily",
+            ["table_00001_0", "table_00003_0"],
+        ),
+        ("--select source:airbyte,tag:daily", ["table_00001_0"]),
+        ("-s +models/staging", ["table_00001_0", "table_00002_0"]),
+        ("-s @stg_one", ["table_00001_0", "table_00002_0"]),
+        ("-m +staging.stg_one --resource-type model", ["table_00001_0"]),
+    ],
+)
+def test_select_sources(manifest, list_args, expected):
+    assert ManifestSelector(manifest).select_sources(list_args) == [
+        f"source.analytics.airbyte.{table}" for table in expected
+    ]
+
+
+@pytest.mark.parametrize(
+    "list_args", ["--selector nightly", "-s state:modified+", "--vars '{a: 1}'"]
+)
+def test_unsupported_selection(manifest, list_args):
+    with pytest.raises(UnsupportedSelectionException):
+        ManifestSelector(manifest).select_sources(list_args)
+
+
+def test_generator_discovers_sources_in_manifest(tmp_path, manifest, monkeypatch):
+    (tmp_path / "target").mkdir()
+    (tmp_path / "target" / "manifest.json").write_text(json.dumps(manifest))
+
+    def no_dbt(*args, **kwargs):
+        raise AssertionError("dbt shouldn't run when there's a manifest")
+
+    monkeypatch.setattr(subprocess, "run", no_dbt)
+    api_inventory.start_registry()
+    with MockApiServer(AirbyteMockApi(objects=5)) as server:
+        host, port = server.url.rsplit(":", 1)
+        generator = AirbyteDbtGenerator(
+            host=host,
+            port=port,
+            dbt_project_path=str(tmp_path),
+            dbt_list_args="--select +orders",
+            airbyte_conn_id="airbyte_connection",
+        )
+
+    assert generator.connection_ids == ["connection-1", "connection-2"]
+
+
+def test_generators_compile_each_project_once(tmp_path, manifest, monkeypatch):
+    dbt_commands = []
+
+    def fake_dbt(command, cwd, **kwargs):
+        dbt_commands.append(command)
+        if command[1] == "compile":
+            (tmp_path / "target").mkdir()
+            (tmp_path / "target" / "manifest.json").write_text(json.dumps(manifest))
+        return subprocess.CompletedProcess(command, 0, stdout=b"", stderr=b"")
+
+    monkeypatch.setattr(subprocess, "run", fake_dbt)
+    api_inventory.start_registry()
+    dbt_projects.start_registry()
+    with MockApiServer(AirbyteMockApi(objects=5)) as server:
+        host, port = server.url.rsplit(":", 1)
+        generators = [
+            AirbyteDbtGenerator(
+                host=host,
+                port=port,
+                dbt_project_path=str(tmp_path),
+                dbt_list_args=list_args,
+                run_dbt_deps=True,
+                run_dbt_compile=True,
+                airbyte_conn_id="airbyte_connection",
+            )
+            for list_args in ("--select +orders", "--select tag:daily", "")
+        ]
+
+    assert dbt_commands == [["dbt", "deps"], ["dbt", "compile"]]
+    assert [generator.connection_ids for generator in generators] == [
+        ["connection-1", "connection-2"],
+        ["connection-1"],
+        ["connection-1", "connection-2", "connection-3"],
+    ]
+
+
+def test_registry_prepares_projects_concurrently():
+    registry = dbt_projects.DbtProjectRegistry()
+    # Each project's step only finishes once the other project's is running too
+    both_running = threading.Barrier(2, timeout=5)
+    steps_run = []
+
+    def prepare(project_path):
+        def run_step(step):
+            both_running.wait()
+            steps_run.append((project_path, step))
+
+        registry.prepare(project_path, None, ["deps"], run_step)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(prepare, project_path)
+            for project_path in ("project_a", "project_b") * 2
+        ]
+        for future in futures:
+            future.result()
+
+    assert sorted(steps_run) == [("project_a", "deps"), ("project_b", "deps")]
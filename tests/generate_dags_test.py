@@ -43,3 +43,77 @@ def test_generate_airflow_dags(test_data_dir: Path, test_output_dir: Path):
         if file.endswith(".py"):
             os.remove(test_output_dir / file)
     assert not dag_bag.import_errors
+
+
+def test_generate_airflow_dags_in_parallel(test_data_dir: Path, tmp_path: Path):
+    """
+    Test that `--jobs` generates the same DAG files as a sequential run.
+    """
+    ymls_path = tmp_path / "ymls"
+    ymls_path.mkdir()
+    basic_dag = (test_data_dir / "basic_dag.yml").read_text()
+    for dag in range(4):
+        (ymls_path / f"basic_dag_{dag}.yml").write_text(basic_dag)
+
+    outputs = {}
+    for jobs in ("1", "3"):
+        dags_path = tmp_path / f"dags_jobs_{jobs}"
+        command = [
+            "python",
+            "../dbt_coves/core/main.py",
+            "generate",
+            "airflow-dags",
+            "--yml-path",
+            ymls_path,
+            "--dags-path",
+            dags_path,
+            "--jobs",
+            jobs,
+        ]
+        process = subprocess.run(
+            command,
+            check=True,
+            cwd=Path(__file__).parent.resolve(),
+            capture_output=True,
+            text=True,
+        )
+        generated = [
+            line for line in process.stdout.splitlines() if "Generating" in line
+        ]
+        assert generated == [f"Generating basic_dag_{dag}" for dag in range(4)]
+        outputs[jobs] = {
+            path.name: path.read_text() for path in sorted(dags_path.glob("*.py"))
+        }
+    assert len(outputs["1"]) == 4
+    assert outputs["1"] == outputs["3"]
+
+
+def test_generate_airflow_dags_skips_unchanged(test_data_dir: Path, tmp_path: Path):
+    """
+    Test that a second run skips DAGs whose YML didn't change, unless `--force` is used.
+    """
+    ymls_path = tmp_path / "ymls"
+    ymls_path.mkdir()
+    (ymls_path / "basic_dag.yml").write_text(
+        (test_data_dir / "basic_dag.yml").read_text()
+    )
+    command = [
+        "python",
+        Path(__file__).parent.parent.resolve() / "dbt_coves" / "core" / "main.py",
+        "generate",
+        "airflow-dags",
+        "--yml-path",
+        ymls_path,
+        "--dags-path",
+        tmp_path / "dags",
+    ]
+
+    def run(*args):
+        return subprocess.run(
+            [*command, *args], check=True, cwd=tmp_path, capture_output=True, text=True
+        ).stdout
+
+    assert "Generating basic_dag" in run()
+    assert "Skipping basic_dag: unchanged" in run()
+    assert "Generating basic_dag" in run("--force")
+    assert (tmp_path / ".dbt_coves" / ".dag_cache.json").exists()
@@ -0,0 +1,530 @@
+# Local stand-ins for Airbyte's public API and Fivetran's v1 API, used to test and
+# benchmark extract, load and generate airflow-dags without a live service
+
+import json
+import re
+import socketserver
+import threading
+import time
+from collections import Counter
+from copy import deepcopy
+from urllib.parse import parse_qs
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+HTTP_STATUSES = {
+    200: "200 OK",
+    201: "201 Created",
+    204: "204 No Content",
+    400: "400 Bad Request",
+    404: "404 Not Found",
+    429: "429 Too Many Requests",
+}
+
+
+class MockApiRequest:
+    def __init__(self, environ):
+        self.method = environ["REQUEST_METHOD"]
+        self.path = environ.get("PATH_INFO", "")
+        self.params = {
+            key: values[0]
+            for key, values in parse_qs(environ.get("QUERY_STRING", "")).items()
+        }
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(length) if length else b""
+        self.body = json.loads(body) if body else None
+
+
+class MockApi:
+    """
+    Base WSGI app: dispatches requests to the handler whose (method, pattern) matches.
+    Subclasses list their routes in `routes` as (method, pattern, handler name).
+    """
+
+    routes = []
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._routes = [
+            (method, pattern, re.compile(f"^{pattern}$"), getattr(self, handler))
+            for method, pattern, handler in self.routes
+        ]
+
+    def match(self, method, path):
+        for route_method, pattern, regex, handler in self._routes:
+            match = regex.match(path)
+            if route_method == method and match:
+                return f"{method} {pattern}", handler, match.groupdict()
+        return f"{method} {path}", None, {}
+
+    def not_found(self, message="Not found"):
+        return 404, {"message": message}
+
+
+class AirbyteMockApi(MockApi):
+    """
+    Airbyte public API (/api/public/v1) with `objects` sources and connections,
+    spread over one destination every 100 sources
+    """
+
+    routes = [
+        ("GET", "/api/public/v1/workspaces", "list_workspaces"),
+        (
+            "GET",
+            "/api/public/v1/(?P<resource>sources|destinations|connections)",
+            "list",
+        ),
+        (
+            "GET",
+            "/api/public/v1/connector_definitions/(?P<kind>sources|destinations)",
+            "list_definitions",
+        ),
+        (
+            "GET",
+            "/api/public/v1/connector_definitions/(?P<kind>sources|destinations)/(?P<id>[^/]+)",
+            "get_spec",
+        ),
+        (
+            "POST",
+            "/api/public/v1/(?P<resource>sources|destinations|connections)",
+            "create",
+        ),
+        (
+            "PATCH",
+            "/api/public/v1/(?P<resource>sources|destinations|connections)/(?P<id>[^/]+)",
+            "update",
+        ),
+        (
+            "DELETE",
+            "/api/public/v1/(?P<resource>sources|destinations|connections)/(?P<id>[^/]+)",
+            "delete",
+        ),
+        (
+            "POST",
+            "/api/public/v1/(?P<resource>sources|destinations)/(?P<id>[^/]+)/check",
+            "check",
+        ),
+    ]
+    id_fields = {
+        "sources": "sourceId",
+        "destinations": "destinationId",
+        "connections": "connectionId",
+    }
+
+    def __init__(self, objects=100, streams_per_connection=3):
+        super().__init__()
+        self.workspace_id = "workspace-0"
+        self.next_id = 0
+        self.definitions = {
+            "sources": [
+                {
+                    "sourceDefinitionId": "definition-source-postgres",
+                    "name": "Postgres",
+                    "dockerRepository": "airbyte/source-postgres",
+                    "dockerImageTag": "3.6.0",
+                }
+            ],
+            "destinations": [
+                {
+                    "destinationDefinitionId": "definition-destination-snowflake",
+                    "name": "Snowflake",
+                    "dockerRepository": "airbyte/destination-snowflake",
+                    "dockerImageTag": "3.11.0",
+                }
+            ],
+        }
+        destinations_count = max(1, objects // 100)
+        self.objects = {
+            "destinations": {
+                f"destination-{d}": {
+                    "destinationId": f"destination-{d}",
+                    "name": f"warehouse_{d}",
+                    "destinationType": "snowflake",
+                    "workspaceId": self.workspace_id,
+                    "configuration": {
+                        "host": "account.snowflakecomputing.com",
+                        "database": f"RAW_{d}",
+                        "schema": "PUBLIC",
+                        "username": "AIRBYTE",
+                    },
+                }
+                for d in range(destinations_count)
+            },
+            "sources": {},
+            "connections": {},
+        }
+        for i in range(objects):
+            source_id = f"source-{i}"
+            destination_id = f"destination-{i % destinations_count}"
+            self.objects["sources"][source_id] = {
+                "sourceId": source_id,
+                "name": f"postgres_{i:05d}",
+                "sourceType": "postgres",
+                "workspaceId": self.workspace_id,
+                "configuration": {
+                    "host": "db.internal",
+                    "port": 5432,
+                    "database": "app",
+                    "schema": f"app_{i:05d}",
+                    "username": "airbyte",
+                },
+            }
+            self.objects["connections"][f"connection-{i}"] = {
+                "connectionId": f"connection-{i}",
+                "name": f"postgres_{i:05d} → warehouse_{i % destinations_count}",
+                "sourceId": source_id,
+                "destinationId": destination_id,
+                "workspaceId": self.workspace_id,
+                "status": "active",
+                "namespaceDefinition": "destination",
+                "schedule": {"scheduleType": "manual"},
+                "configurations": {
+                    "streams": [
+                        {
+                            "name": f"table_{i:05d}_{s}",
+                            "syncMode": "full_refresh_overwrite",
+                        }
+                        for s in range(streams_per_connection)
+                    ]
+                },
+            }
+
+    def mutate(self, every=10):
+        """Drift every `every`-th source and connection away from its extracted state"""
+        with self.lock:
+            for i, source in enumerate(self.objects["sources"].values()):
+                if i % every == 0:
+                    source["configuration"]["port"] += 1
+            for i, connection in enumerate(self.objects["connections"].values()):
+                if i % every == 0:
+                    connection["status"] = "inactive"
+
+    def list_workspaces(self, request):
+        return 200, {"data": [{"workspaceId": self.workspace_id, "name": "Default"}]}
+
+    def list(self, request, resource):
+        limit = int(request.params.get("limit", 20))
+        offset = int(request.params.get("offset", 0))
+        with self.lock:
+            items = list(self.objects[resource].values())[offset : offset + limit]
+            return 200, {"data": deepcopy(items)}
+
+    def list_definitions(self, request, kind):
+        return 200, {"data": self.definitions[kind]}
+
+    def get_spec(self, request, kind, id):
+        return 200, {
+            "connectionSpecification": {
+                "properties": {"password": {"type": "string", "airbyte_secret": True}}
+            }
+        }
+
+    def create(self, request, resource):
+        id_field = self.id_fields[resource]
+        with self.lock:
+            self.next_id += 1
+            new_object = {id_field: f"{resource}-new-{self.next_id}", **request.body}
+            self.objects[resource][new_object[id_field]] = new_object
+            return 200, deepcopy(new_object)
+
+    def update(self, request, resource, id):
+        with self.lock:
+            if id not in self.objects[resource]:
+                return self.not_found()
+            self.objects[resource][id].update(request.body)
+            return 200, deepcopy(self.objects[resource][id])
+
+    def delete(self, request, resource, id):
+        with self.lock:
+            if self.objects[resource].pop(id, None) is None:
+                return self.not_found()
+        return 204, None
+
+    def check(self, request, resource, id):
+        return 200, {"status": "succeeded"}
+
+
+class FivetranMockApi(MockApi):
+    """
+    Fivetran v1 API with `objects` connectors of `tables_per_connector` tables each,
+    spread over one group/destination every 100 connectors
+    """
+
+    routes = [
+        ("GET", "/v1/groups", "list_groups"),
+        ("POST", "/v1/groups", "create_group"),
+        ("GET", "/v1/groups/(?P<id>[^/]+)", "get_group"),
+        ("GET", "/v1/groups/(?P<id>[^/]+)/connectors", "list_connectors"),
+        ("GET", "/v1/destinations/(?P<id>[^/]+)", "get_destination"),
+        ("PATCH", "/v1/destinations/(?P<id>[^/]+)", "update_destination"),
+        ("POST", "/v1/connectors/", "create_connector"),
+        ("GET", "/v1/connectors/(?P<id>[^/]+)", "get_connector"),
+        ("PATCH", "/v1/connectors/(?P<id>[^/]+)", "update_connector"),
+        ("DELETE", "/v1/connectors/(?P<id>[^/]+)", "delete_connector"),
+        ("GET", "/v1/connectors/(?P<id>[^/]+)/schemas", "get_schemas"),
+        ("PATCH", "/v1/connectors/(?P<id>[^/]+)/schemas", "update_schemas"),
+        (
+            "PATCH",
+            "/v1/connectors/(?P<id>[^/]+)/schemas/(?P<schema>[^/]+)/tables/(?P<table>[^/]+)",
+            "update_table",
+        ),
+        ("GET", "/v1/metadata/connectors/(?P<service>[^/]+)", "get_metadata"),
+    ]
+
+    def __init__(self, objects=100, tables_per_connector=5):
+        super().__init__()
+        self.next_id = 0
+        # Connectors whose DELETE is rejected
+        self.undeletable = set()
+        groups_count = max(1, objects // 100)
+        self.groups = {
+            f"group_{g}": {"id": f"group_{g}", "name": f"warehouse_{g}"}
+            for g in range(groups_count)
+        }
+        self.destinations = {
+            group_id: {
+                "id": group_id,
+                "group_id": group_id,
+                "service": "snowflake",
+                "region": "GCP_US_EAST4",
+                "time_zone_offset": "0",
+                "setup_status": "connected",
+                "config": {
+                    "host": "account.snowflakecomputing.com",
+                    "database": f"RAW_{g}",
+                    "user": "FIVETRAN",
+                    "password": "******",
+                },
+            }
+            for g, group_id in enumerate(self.groups)
+        }
+        self.connectors = {}
+        self.schemas = {}
+        for i in range(objects):
+            connector_id = f"connector_{i:05d}"
+            schema_name = f"postgres_{i:05d}"
+            self.connectors[connector_id] = {
+                "id": connector_id,
+                "group_id": f"group_{i % groups_count}",
+                "service": "postgres",
+                "schema": schema_name,
+                "paused": False,
+                "sync_frequency": 360,
+                "succeeded_at": None,
+                "failed_at": None,
+                "status": {"setup_state": "connected", "sync_state": "scheduled"},
+                "config": {
+                    "host": "db.internal",
+                    "port": 5432,
+                    "database": "app",
+                    "user": "fivetran",
+                },
+            }
+            self.schemas[connector_id] = {
+                "public": {
+                    "name_in_destination": schema_name,
+                    "enabled": True,
+                    "tables": {
+                        f"table_{t}": {
+                            "name_in_destination": f"table_{t}",
+                            "enabled": True,
+                            "sync_mode": "SOFT_DELETE",
+                        }
+                        for t in range(tables_per_connector)
+                    },
+                }
+            }
+
+    def mutate(self, every=10):
+        """Drift every `every`-th connector and one of its tables away from its extracted state"""
+        with self.lock:
+            for i, connector_id in enumerate(self.connectors):
+                if i % every == 0:
+                    self.connectors[connector_id]["paused"] = True
+                    tables = self.schemas[connector_id]["public"]["tables"]
+                    next(iter(tables.values()))["enabled"] = False
+
+    def sync(self, succeeded_at="2024-01-01T00:00:00.000Z"):
+        """Record a sync of every connector, as Fivetran does in their details"""
+        with self.lock:
+            for connector in self.connectors.values():
+                connector["succeeded_at"] = succeeded_at
+                connector["status"] = dict(connector["status"], sync_state="syncing")
+
+    def list_groups(self, request):
+        return 200, {"data": {"items": list(self.groups.values())}}
+
+    def create_group(self, request):
+        with self.lock:
+            self.next_id += 1
+            group = {"id": f"group_new_{self.next_id}", "name": request.body["name"]}
+            self.groups[group["id"]] = group
+        return 200, {"data": group}
+
+    def get_group(self, request, id):
+        if id not in self.groups:
+            return self.not_found()
+        return 200, {"data": self.groups[id]}
+
+    def list_connectors(self, request, id):
+        with self.lock:
+            items = [
+                {"id": connector["id"]}
+                for connector in self.connectors.values()
+                if connector["group_id"] == id
+            ]
+        return 200, {"data": {"items": items}}
+
+    def get_destination(self, request, id):
+        if id not in self.destinations:
+            return self.not_found()
+        return 200, {"data": deepcopy(self.destinations[id])}
+
+    def update_destination(self, request, id):
+        with self.lock:
+            if id not in self.destinations:
+                return self.not_found()
+            body = dict(request.body)
+            body.pop("run_setup_tests", None)
+            self.destinations[id].update(body)
+            return 200, {"data": deepcopy(self.destinations[id])}
+
+    def create_connector(self, request):
+        with self.lock:
+            self.next_id += 1
+            connector = dict(request.body, id=f"connector_new_{self.next_id}")
+            connector.pop("run_setup_tests", None)
+            self.connectors[connector["id"]] = connector
+            self.schemas[connector["id"]] = {}
+            return 201, {"data": deepcopy(connector)}
+
+    def get_connector(self, request, id):
+        if id not in self.connectors:
+            return self.not_found()
+        return 200, {"data": deepcopy(self.connectors[id])}
+
+    def update_connector(self, request, id):
+        with self.lock:
+            if id not in self.connectors:
+                return self.not_found()
+            body = dict(request.body)
+            body.pop("run_setup_tests", None)
+            self.connectors[id].update(body)
+            return 200, {"data": deepcopy(self.connectors[id])}
+
+    def delete_connector(self, request, id):
+        if id in self.undeletable:
+            return 400, {"message": f"Connector {id} can't be deleted"}
+        with self.lock:
+            if self.connectors.pop(id, None) is None:
+                return self.not_found()
+            self.schemas.pop(id, None)
+        return 200, {"code": "Success"}
+
+    def get_schemas(self, request, id):
+        if id not in self.schemas:
+            return self.not_found()
+        with self.lock:
+            return 200, {"data": {"schemas": deepcopy(self.schemas[id])}}
+
+    def update_schemas(self, request, id):
+        with self.lock:
+            if id not in self.schemas:
+                return self.not_found()
+            self.schemas[id] = deepcopy(request.body)
+            return 200, {"data": {"schemas": deepcopy(self.schemas[id])}}
+
+    def update_table(self, request, id, schema, table):
+        with self.lock:
+            for schema_config in self.schemas.get(id, {}).values():
+                if schema_config["name_in_destination"] != schema:
+                    continue
+                for table_config in schema_config["tables"].values():
+                    if table_config["name_in_destination"] == table:
+                        table_config.update(request.body)
+                        return 200, {"data": deepcopy(table_config)}
+        return self.not_found()
+
+    def get_metadata(self, request, service):
+        return 200, {"data": {"id": service, "config": {"required": []}}}
+
+
+class _ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class MockApiServer:
+    """
+    Serves a MockApi on localhost from a background thread.
+    - `latency`: seconds every request waits before being answered
+    - `rate_limit_every`: every N-th request is answered with a 429 and `retry_after`
+    Requests are counted per route in `request_counts`.
+    """
+
+    def __init__(self, api, latency=0.0, rate_limit_every=0, retry_after=0.01):
+        self.api = api
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.request_counts = Counter()
+        self.rate_limited = 0
+        self._counter_lock = threading.Lock()
+        self._server = make_server(
+            "127.0.0.1",
+            0,
+            self._app,
+            server_class=_ThreadingWSGIServer,
+            handler_class=_QuietHandler,
+        )
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def total_requests(self):
+        return sum(self.request_counts.values())
+
+    def reset_counts(self):
+        with self._counter_lock:
+            self.request_counts.clear()
+            self.rate_limited = 0
+
+    def _app(self, environ, start_response):
+        request = MockApiRequest(environ)
+        route, handler, kwargs = self.api.match(request.method, request.path)
+        with self._counter_lock:
+            self.request_counts[route] += 1
+            rate_limited = (
+                self.rate_limit_every
+                and sum(self.request_counts.values()) % self.rate_limit_every == 0
+            )
+            if rate_limited:
+                self.rate_limited += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        headers = [("Content-Type", "application/json")]
+        if rate_limited:
+            status, body = 429, {"message": "Rate limit exceeded"}
+            headers.append(("Retry-After", str(self.retry_after)))
+        elif handler:
+            status, body = handler(request, **kwargs)
+        else:
+            status, body = self.api.not_found(f"No route for {route}")
+
+        payload = json.dumps(body).encode() if body is not None else b""
+        headers.append(("Content-Length", str(len(payload))))
+        start_response(HTTP_STATUSES[status], headers)
+        return [payload]
@@ -0,0 +1,73 @@
+import os
+import subprocess
+import tempfile
+
+import pytest
+
+from dbt_coves.utils import project_copy
+
+
+def commit(project, message):
+    subprocess.run(["git", "add", "-A"], cwd=project, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=dbt", "-c", "user.email=dbt@coves"]
+        + ["commit", "-qm", message],
+        cwd=project,
+        check=True,
+    )
+
+
+@pytest.fixture
+def dbt_project(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path / "tmp"))
+    project = tmp_path / "project"
+    (project / "models").mkdir(parents=True)
+    (project / "models" / "orders.sql").write_text("select 1 as id")
+    (project / "dbt_project.yml").write_text("name: analytics\n")
+    (project / "target" / "compiled").mkdir(parents=True)
+    (project / "target" / "manifest.json").write_text("{}")
+    (project / "logs").mkdir()
+    (project / "logs" / "dbt.log").write_text("log")
+    (project / "dbt_packages" / "dbt_utils").mkdir(parents=True)
+    subprocess.run(["git", "init", "-q"], cwd=project, check=True)
+    commit(project, "init")
+    return project
+
+
+def test_writable_copy_overlays_project(dbt_project):
+    copy_path = project_copy.writable_copy(dbt_project)
+
+    assert (copy_path / "models").is_symlink()
+    assert (copy_path / "dbt_packages" / "dbt_utils").is_symlink()
+    assert not (copy_path / "dbt_project.yml").is_symlink()
+    assert os.listdir(copy_path / "target") == ["manifest.json"]
+    assert os.listdir(copy_path / "logs") == []
+    (copy_path / "target" / "manifest.json").write_text('{"nodes": {}}')
+    assert (dbt_project / "target" / "manifest.json").read_text() == "{}"
+
+    # Reused for the same commit
+    (copy_path / "logs" / "dbt.log").write_text("log")
+    assert project_copy.writable_copy(dbt_project) == copy_path
+    assert (copy_path / "logs" / "dbt.log").exists()
+
+    (dbt_project / "models" / "customers.sql").write_text("select 2 as id")
+    commit(dbt_project, "customers")
+    assert project_copy.writable_copy(dbt_project) != copy_path
+
+
+def test_writable_copy_falls_back_to_full_copy(dbt_project, monkeypatch):
+    def no_symlinks(*args):
+        raise OSError("Symlinks not supported")
+
+    monkeypatch.setattr(os, "symlink", no_symlinks)
+    copy_path = project_copy.writable_copy(dbt_project)
+
+    assert not (copy_path / "models").is_symlink()
+    assert (copy_path / "models" / "orders.sql").read_text() == "select 1 as id"
+    assert (copy_path / "logs" / "dbt.log").exists()
+
+
+def test_projects_without_git_arent_cached(tmp_path):
+    assert project_copy.writable_copy(tmp_path) is None
+    copy_path = project_copy.create_writable_copy(tmp_path, tmp_path.parent / "copy")
+    assert copy_path.is_dir()
@@ -0,0 +1,136 @@
+import ast
+import textwrap
+
+import pytest
+
+from dbt_coves.utils.python_emitter import emit_python
+
+GENERATED_DAG = '''"""
+## Sample DAG
+Runs \\\\ dbt
+"""
+from airflow.decorators import dag
+from time import sleep
+from airflow.decorators import task_group
+from kubernetes.client import models as k8s
+from airflow.operators.bash import BashOperator
+import os
+TRANSFORM_CONFIG={
+        "pod_override": k8s.V1Pod(
+            spec=k8s.V1PodSpec(
+                containers=[
+                    k8s.V1Container(
+                        name='base',
+                        image= 'datacoves/airflow-pandas:latest',
+resources=k8s.V1ResourceRequirements(requests={'memory': '8Gi', 'cpu': '1000m'}),
+
+                    )
+                ]
+            )
+        ),
+}
+@dag(
+  doc_md=__doc__,
+  schedule_interval="0 0 1 */12 *",
+  tags=['version_1'],
+  catchup=False,
+    on_success_callback=sleep(1),
+)
+def basic_dag():
+    transform = BashOperator(
+    task_id='transform',
+      bash_command="echo 'transform'",
+  executor_config=TRANSFORM_CONFIG,
+    )
+    @task_group(group_id='empty', tooltip='',)
+    def empty():
+        pass # XXX dbt-coves did not receive a task here
+    tg_empty = empty()
+    [transform] >> tg_empty
+dag = basic_dag()
+'''
+
+EXPECTED_DAG = '''"""
+## Sample DAG
+Runs \\\\ dbt
+"""
+
+import os
+from time import sleep
+
+from airflow.decorators import dag, task_group
+from airflow.operators.bash import BashOperator
+from kubernetes.client import models as k8s
+
+TRANSFORM_CONFIG = {
+    "pod_override": k8s.V1Pod(
+        spec=k8s.V1PodSpec(
+            containers=[
+                k8s.V1Container(
+                    name="base",
+                    image="datacoves/airflow-pandas:latest",
+                    resources=k8s.V1ResourceRequirements(
+                        requests={"memory": "8Gi", "cpu": "1000m"}
+                    ),
+                )
+            ]
+        )
+    ),
+}
+
+
+@dag(
+    doc_md=__doc__,
+    schedule_interval="0 0 1 */12 *",
+    tags=["version_1"],
+    catchup=False,
+    on_success_callback=sleep(1),
+)
+def basic_dag():
+    transform = BashOperator(
+        task_id="transform",
+        bash_command="echo 'transform'",
+        executor_config=TRANSFORM_CONFIG,
+    )
+
+    @task_group(
+        group_id="empty",
+        tooltip="",
+    )
+    def empty():
+        pass  # XXX dbt-coves did not receive a task here
+
+    tg_empty = empty()
+    [transform] >> tg_empty
+
+
+dag = basic_dag()
+'''
+
+
+def test_emit_generated_dag():
+    assert emit_python(GENERATED_DAG) == EXPECTED_DAG
+
+
+def test_emit_is_idempotent():
+    assert emit_python(EXPECTED_DAG) == EXPECTED_DAG
+
+
+def test_emit_keeps_semantics():
+    source = textwrap.dedent(
+        """
+        config = {'a': [1, (2,), {3}], **extra, 'b': f'{x}', 'c': lambda y: -y}
+        call(*args, key=value if flag else None, **kwargs)
+        result = function_with_a_long_name(first_argument_value, second_argument_value, third)
+        class Holder:
+            attribute = 'value'
+        """
+    )
+    emitted = emit_python(source)
+    assert ast.dump(ast.parse(emitted)) == ast.dump(ast.parse(source))
+    assert all(len(line) <= 88 for line in emitted.splitlines())
+
+
+def test_emit_rejects_invalid_code():
+    with pytest.raises(SyntaxError):
+        emit_python("def broken(:\n")
@@ -0,0 +1,30 @@
+import pytest
+
+from dbt_coves.core.exceptions import DbtCovesException
+from dbt_coves.utils.secrets import index_secrets, replace_secrets
+
+SECRETS = [
+    {"slug": "airbyte_api_key", "value": "api-key"},
+    {"slug": "Snowflake_Password", "value": "password"},
+]
+
+
+def test_replace_secrets():
+    config = {
+        "api_key": "{{ secret('airbyte_api_key') }}",
+        "nested": {"password": "{{secret('Snowflake_Password')}}", "user": "svc"},
+    }
+    replace_secrets(index_secrets(SECRETS), config)
+    assert config == {
+        "api_key": "api-key",
+        "nested": {"password": "password", "user": "svc"},
+    }
+
+
+def test_replace_secrets_reports_missing_secrets():
+    with pytest.raises(DbtCovesException, match="did you mean"):
+        replace_secrets(SECRETS, {"password": "{{ secret('snowflake_password') }}"})
+    # Errors of a previous call aren't carried over
+    config = {"api_key": "{{ secret('airbyte_api_key') }}"}
+    replace_secrets(SECRETS, config)
+    assert config == {"api_key": "api-key"}